@@ -1,4 +1,3 @@
-from .api import api_router
 from .schemas import *
 from .errors import (
     EntryNotFoundError,
@@ -11,4 +10,13 @@ __all__ = [
     "EntryNotFoundError",
     "PreferenceNotFoundError", 
     "DatabaseError"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Import the router, and with it every route module, on first access (PEP 562)"""
+    if name == "api_router":
+        from .api import api_router
+        globals()[name] = api_router
+        return api_router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
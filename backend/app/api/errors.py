@@ -1,4 +1,5 @@
 from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -24,7 +25,10 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with detailed error information"""
-    logger.warning(f"Validation error: {exc.errors()} - {request.url}")
+    # Validator errors carry the raised exception in ctx, which JSONResponse
+    # can't serialize on its own
+    errors = jsonable_encoder(exc.errors())
+    logger.warning(f"Validation error: {errors} - {request.url}")
     
     return JSONResponse(
         status_code=422,
@@ -32,7 +36,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "success": False,
             "message": "Validation error",
             "status_code": 422,
-            "errors": exc.errors(),
+            "errors": errors,
             "path": str(request.url.path)
         }
     )
@@ -53,6 +57,11 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
+def server_error(prefix: str, exc: Exception) -> HTTPException:
+    """Build the 500 error for an unexpected endpoint failure"""
+    return HTTPException(status_code=500, detail=f"{prefix}: {exc}")
+
+
 # Custom exception classes
 class EntryNotFoundError(HTTPException):
     def __init__(self, entry_id: int):
@@ -0,0 +1,28 @@
+"""
+Conditional-GET helpers for endpoints that return semi-static data
+"""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+
+def etag_response(request: Request, payload: Any) -> Response:
+    """Serialize payload and answer with 304 when the client's ETag still matches.
+    
+    The ETag is a strong validator derived from the encoded body, so clients
+    that poll with If-None-Match skip the body whenever nothing changed.
+    """
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
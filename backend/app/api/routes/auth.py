@@ -78,9 +78,6 @@ async def register_user(request: UserRegistrationRequest):
 async def login_user(request: LoginRequest):
     """Login user with password, recovery phrase, or emergency key"""
     try:
-        # Validate that exactly one auth method is provided
-        request.validate_auth_method()
-        
         auth_service = get_auth_service()
         success = False
         user = None
@@ -240,8 +237,6 @@ async def upload_emergency_key(name: str, file: UploadFile = File(...)):
 async def reset_password(request: PasswordResetRequest):
     """Reset user password using recovery phrase or emergency key"""
     try:
-        request.validate_verification_method()
-        
         auth_service = get_auth_service()
         
         # Verify with recovery phrase or emergency key first
@@ -175,7 +175,8 @@ async def create_conversation(
 async def get_conversations(
     limit: int = Query(50, ge=1, le=200, description="Maximum number of conversations to return"),
     offset: int = Query(0, ge=0, description="Number of conversations to skip"),
-    conversation_type: Optional[str] = Query(None, regex="^(call|chat)$", description="Filter by conversation type")
+    conversation_type: Optional[str] = Query(None, regex="^(call|chat)$", description="Filter by conversation type"),
+    before_timestamp: Optional[str] = Query(None, description="Only return conversations older than this ISO timestamp (keyset pagination)")
 ):
     """
     Retrieve conversations with pagination and filtering.
@@ -184,6 +185,8 @@ async def get_conversations(
         limit: Maximum number of results
         offset: Number of results to skip
         conversation_type: Optional filter by type
+        before_timestamp: Optional keyset cursor, the timestamp of the last
+            conversation on the previous page
         
     Returns:
         List of conversations matching criteria
@@ -196,7 +199,8 @@ async def get_conversations(
         conversations = await ConversationRepository.get_all(
             limit=limit,
             offset=offset,
-            conversation_type=conversation_type
+            conversation_type=conversation_type,
+            before_timestamp=before_timestamp
         )
         
         # Convert to response format
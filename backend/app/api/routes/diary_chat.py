@@ -248,18 +248,8 @@ async def _update_conversation_with_chat(
         conversation.message_count += 2  # User message + Boo response
         conversation.transcription += f"\n\nUser: {user_message}\nBoo: {boo_response}"
         
-        # Update search queries used
-        if conversation.search_queries_used:
-            existing_queries = conversation.search_queries_used
-        else:
-            existing_queries = []
-        
-        # Add new queries (avoid duplicates)
-        for query in search_queries:
-            if query not in existing_queries:
-                existing_queries.append(query)
-        
-        conversation.search_queries_used = existing_queries
+        # Add new search queries (avoid duplicates)
+        conversation.add_search_queries(search_queries)
         conversation.updated_at = datetime.now()
         
         # Save updated conversation
@@ -124,17 +124,13 @@ async def get_draft(draft_id: int):
 async def delete_draft(draft_id: int):
     """Delete a specific draft"""
     try:
-        # Check if draft exists
-        draft = await DraftRepository.get_by_id(draft_id)
-        if not draft:
+        # Delete the draft; no row deleted means it didn't exist
+        if not await DraftRepository.delete(draft_id):
             raise HTTPException(
                 status_code=404,
                 detail="Draft not found"
             )
         
-        # Delete the draft
-        await DraftRepository.delete(draft_id)
-        
         return SuccessResponse(
             message="Draft deleted successfully",
             data={"id": draft_id}
@@ -19,6 +19,7 @@ from app.services.embedding_service import get_embedding_service, EmbeddingServi
 from app.services.hybrid_search import HybridSearchService
 from app.db.repositories.entry_repository import EntryRepository
 from app.db.database import get_db
+from app.models.entry import decode_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -863,9 +864,8 @@ async def regenerate_all_embeddings(background_tasks: BackgroundTasks):
         logger.info(f"Cleared {cleared} embeddings")
         
         # Verify they're actually cleared
-        remaining = await EntryRepository.count_entries_with_embeddings()
-        if remaining > 0:
-            logger.warning(f"Still have {remaining} entries with embeddings after clearing!")
+        if await EntryRepository.has_entries_with_embeddings():
+            logger.warning("Still have entries with embeddings after clearing!")
             # Force clear with direct database access
             await db.execute("UPDATE entries SET embeddings = NULL")
             await db.commit()
@@ -1288,10 +1288,15 @@ async def test_embeddings():
         samples = []
         for row in rows:
             embed_str = row.get("embeddings", "")
+            # Stored as float32 BLOBs (legacy rows hold JSON text), so decode
+            # before previewing; raw bytes can't go into the JSON response
+            vector = decode_embedding(embed_str)
             samples.append({
                 "id": row["id"],
                 "embeddings_length": len(embed_str) if embed_str else 0,
-                "embeddings_preview": embed_str[:100] if embed_str else "NULL",
+                "storage": type(embed_str).__name__,
+                "dimensions": len(vector) if vector else 0,
+                "embeddings_preview": vector[:5] if vector else "NULL",
                 "is_null": embed_str is None,
                 "is_empty_string": embed_str == "",
                 "is_empty_array": embed_str == "[]"
@@ -1472,15 +1477,15 @@ async def _regenerate_all_embeddings_task():
         # Step 2: Get all entries for regeneration
         _regeneration_status["current_step"] = "Fetching entries"
         _add_regeneration_log("Step 2: Fetching all entries for regeneration...")
-        all_entries = await EntryRepository.get_all_entries_for_embedding_generation()
-        _add_regeneration_log(f"Found {len(all_entries)} entries to process")
+        total_entries = await EntryRepository.count()
+        _add_regeneration_log(f"Found {total_entries} entries to process")
         
-        if not all_entries:
+        if not total_entries:
             _add_regeneration_log("No entries found for regeneration")
             _regeneration_status["is_running"] = False
             return
         
-        _regeneration_status["total"] = len(all_entries)
+        _regeneration_status["total"] = total_entries
         
         # Step 3: Process entries in batches with BGE formatting
         _regeneration_status["current_step"] = "Generating embeddings"
@@ -1489,10 +1494,12 @@ async def _regenerate_all_embeddings_task():
         successful = 0
         failed = 0
         
-        for i in range(0, len(all_entries), batch_size):
-            batch = all_entries[i:i + batch_size]
-            batch_num = i//batch_size + 1
-            total_batches = (len(all_entries) + batch_size - 1)//batch_size
+        total_batches = (total_entries + batch_size - 1)//batch_size
+        batch_num = 0
+        
+        # Fetch one batch at a time instead of holding every entry in memory
+        async for batch in EntryRepository.iter_entries_for_embedding_generation(batch_size):
+            batch_num += 1
             
             _add_regeneration_log(f"Processing batch {batch_num}/{total_batches}")
             
@@ -1520,17 +1527,16 @@ async def _regenerate_all_embeddings_task():
             )
             _add_regeneration_log(f"Generated {len(embeddings)} embeddings, updating database...")
             
-            # Update entries with their new embeddings
-            for entry_id, embedding in zip(entry_ids, embeddings):
-                try:
-                    await EntryRepository.update_embedding(entry_id, embedding)
-                    successful += 1
-                    _regeneration_status["progress"] = successful
-                    if successful % 10 == 0:  # Log every 10 successful updates
-                        _add_regeneration_log(f"Successfully updated {successful} entries so far...")
-                except Exception as e:
-                    failed += 1
-                    _add_regeneration_log(f"Failed to update embedding for entry {entry_id}: {e}")
+            # Update the whole batch in one transaction
+            try:
+                successful += await EntryRepository.bulk_update_embeddings(
+                    list(zip(entry_ids, embeddings))
+                )
+                _regeneration_status["progress"] = successful
+                _add_regeneration_log(f"Successfully updated {successful} entries so far...")
+            except Exception as e:
+                failed += len(entry_ids)
+                _add_regeneration_log(f"Failed to update embeddings for batch {batch_num}: {e}")
             
             # Add delay between batches to prevent overwhelming the system
             await asyncio.sleep(0.5)
@@ -1598,13 +1604,12 @@ async def _process_entries_batch(batch_size: int, max_entries: int):
                 is_query=False  # Documents, not queries
             )
             
-            # Update entries with their embeddings
-            for i, (entry_id, embedding) in enumerate(zip(entry_ids, embeddings)):
-                try:
-                    await EntryRepository.update_embedding(entry_id, embedding)
-                    logger.debug(f"Updated embedding for entry {entry_id}")
-                except Exception as e:
-                    logger.error(f"Failed to update embedding for entry {entry_id}: {e}")
+            # Update the whole batch in one transaction
+            try:
+                await EntryRepository.bulk_update_embeddings(list(zip(entry_ids, embeddings)))
+                logger.debug(f"Updated embeddings for entries {entry_ids}")
+            except Exception as e:
+                logger.error(f"Failed to update embeddings for entries {entry_ids}: {e}")
             
             processed_count += len(entries)
             logger.info(f"Processed {processed_count}/{max_entries} entries")
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query, Path, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import logging
@@ -240,32 +241,16 @@ async def list_entries(
         # Get total count for pagination
         total = await EntryRepository.count()
         
-        # Convert to response format
-        entry_responses = [
-            EntryResponse(
-                id=entry.id,
-                raw_text=entry.raw_text,
-                enhanced_text=entry.enhanced_text,
-                structured_summary=entry.structured_summary,
-                mode=entry.mode,
-                embeddings=entry.embeddings,
-                timestamp=entry.timestamp,
-                mood_tags=entry.mood_tags,
-                word_count=entry.word_count,
-                processing_metadata=entry.processing_metadata,
-                smart_tags=entry.smart_tags
-            )
-            for entry in entries
-        ]
-        
-        return EntryListResponse(
-            entries=entry_responses,
-            total=total,
-            page=page,
-            page_size=page_size,
-            has_next=offset + page_size < total,
-            has_prev=page > 1
-        )
+        # Serialize rows directly; the entries are already typed by the
+        # repository, so re-validating them through EntryResponse is wasted work
+        return ORJSONResponse({
+            "entries": [EntryResponse.to_dict_fast(entry) for entry in entries],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_next": offset + page_size < total,
+            "has_prev": page > 1
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list entries: {str(e)}")
@@ -660,20 +645,18 @@ async def get_daily_streak():
     try:
         from datetime import datetime, timedelta
         
-        # Get all entries ordered by date descending (no pagination limit)
-        all_entries = await EntryRepository.get_all_for_streak()
-        
-        if not all_entries:
-            return {"streak": 0, "last_entry_date": None}
-        
-        # Sort entries by date descending
-        sorted_entries = sorted(all_entries, key=lambda e: e.timestamp, reverse=True)
-        
-        # Get unique dates with entries
+        # Stream all entries, collecting unique dates and the latest timestamp
         entry_dates = set()
-        for entry in sorted_entries:
-            entry_date = entry.timestamp.date()
-            entry_dates.add(entry_date)
+        latest_timestamp = None
+        total_entries = 0
+        async for entry in EntryRepository.get_all_for_streak():
+            total_entries += 1
+            entry_dates.add(entry.timestamp.date())
+            if latest_timestamp is None or entry.timestamp > latest_timestamp:
+                latest_timestamp = entry.timestamp
+        
+        if not total_entries:
+            return {"streak": 0, "last_entry_date": None}
         
         # Calculate streak
         streak = 0
@@ -708,12 +691,12 @@ async def get_daily_streak():
                     else:
                         break
         
-        last_entry_date = sorted_entries[0].timestamp.isoformat() if sorted_entries else None
+        last_entry_date = latest_timestamp.isoformat()
         
         return {
             "streak": streak,
             "last_entry_date": last_entry_date,
-            "total_entries": len(all_entries),
+            "total_entries": total_entries,
             "unique_days": len(entry_dates)
         }
         
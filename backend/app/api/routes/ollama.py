@@ -2,9 +2,13 @@
 Ollama API endpoints for model management and text generation
 """
 
+from contextlib import aclosing
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List, Optional
+from fastapi.responses import StreamingResponse
+from functools import wraps
+from typing import Dict, Any, AsyncIterator, List, Optional
 from pydantic import BaseModel
+import orjson
 
 from app.api.schemas import SuccessResponse, ErrorResponse
 from app.services.ollama import (
@@ -39,6 +43,49 @@ class ModelConfigRequest(BaseModel):
     model: str
 
 
+def ollama_errors(failure_message: str):
+    """Map Ollama service exceptions raised by an endpoint to HTTP errors"""
+    def decorator(endpoint):
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            except HTTPException:
+                raise
+            except OllamaModelNotFoundError as e:
+                raise HTTPException(status_code=404, detail=str(e))
+            except OllamaTimeoutError as e:
+                raise HTTPException(status_code=408, detail=str(e))
+            except OllamaConnectionError as e:
+                raise HTTPException(status_code=503, detail=f"Cannot connect to Ollama: {str(e)}")
+            except OllamaGenerationError as e:
+                raise HTTPException(status_code=500, detail=str(e))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"{failure_message}: {str(e)}")
+        return wrapper
+    return decorator
+
+
+async def _ndjson(first: Dict[str, Any], chunks: AsyncIterator[Dict[str, Any]]):
+    """Encode streamed Ollama chunks as newline-delimited JSON"""
+    # Closing this generator, e.g. when the client goes away, also closes
+    # the upstream stream and frees its Ollama request slot
+    async with aclosing(chunks):
+        yield orjson.dumps(first) + b"\n"
+        async for chunk in chunks:
+            yield orjson.dumps(chunk) + b"\n"
+
+
+async def _stream_ndjson(chunks: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """Start an NDJSON streaming response.
+    
+    The first chunk is awaited before the response is returned so that
+    connection and model errors still surface as regular HTTP errors.
+    """
+    first = await chunks.__anext__()
+    return StreamingResponse(_ndjson(first, chunks), media_type="application/x-ndjson")
+
+
 @router.get("/status", response_model=dict)
 async def get_ollama_status():
     """Get Ollama service status and connection info"""
@@ -67,230 +114,153 @@ async def get_ollama_status():
 
 
 @router.get("/models", response_model=dict)
+@ollama_errors("Failed to list models")
 async def list_models():
     """List all available Ollama models"""
-    try:
-        ollama_service = await get_ollama_service()
-        models = await ollama_service.list_models()
-        
-        model_list = []
-        for model in models:
-            model_list.append({
-                "name": model.name,
-                "modified_at": model.modified_at.isoformat(),
-                "size": model.size,
-                "size_mb": round(model.size_mb, 2),
-                "size_gb": round(model.size_gb, 2),
-                "digest": model.digest
-            })
-        
-        return {
-            "success": True,
-            "data": {
-                "models": model_list,
-                "count": len(model_list),
-                "default_model": ollama_service.get_default_model()
-            }
+    ollama_service = await get_ollama_service()
+    models = await ollama_service.list_models()
+    
+    model_list = []
+    for model in models:
+        model_list.append({
+            "name": model.name,
+            "modified_at": model.modified_at.isoformat(),
+            "size": model.size,
+            "size_mb": round(model.size_mb, 2),
+            "size_gb": round(model.size_gb, 2),
+            "digest": model.digest
+        })
+    
+    return {
+        "success": True,
+        "data": {
+            "models": model_list,
+            "count": len(model_list),
+            "default_model": ollama_service.get_default_model()
         }
-        
-    except OllamaConnectionError as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Cannot connect to Ollama: {str(e)}"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to list models: {str(e)}"
-        )
+    }
 
 
 @router.get("/models/{model_name}", response_model=dict)
+@ollama_errors("Failed to get model info")
 async def get_model_info(model_name: str):
     """Get detailed information about a specific model"""
-    try:
-        ollama_service = await get_ollama_service()
-        model_info = await ollama_service.get_model_info(model_name)
-        
-        return {
-            "success": True,
-            "data": {
-                "name": model_name,
-                "modelfile": model_info.modelfile,
-                "parameters": model_info.parameters,
-                "template": model_info.template,
-                "details": model_info.details
-            }
+    ollama_service = await get_ollama_service()
+    model_info = await ollama_service.get_model_info(model_name)
+    
+    return {
+        "success": True,
+        "data": {
+            "name": model_name,
+            "modelfile": model_info.modelfile,
+            "parameters": model_info.parameters,
+            "template": model_info.template,
+            "details": model_info.details
         }
-        
-    except OllamaModelNotFoundError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=str(e)
-        )
-    except OllamaConnectionError as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Cannot connect to Ollama: {str(e)}"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get model info: {str(e)}"
-        )
+    }
 
 
 @router.post("/generate", response_model=dict)
+@ollama_errors("Generation failed")
 async def generate_text(request: GenerateRequest):
     """Generate text using Ollama"""
-    try:
-        ollama_service = await get_ollama_service()
-        
-        response = await ollama_service.generate(
+    ollama_service = await get_ollama_service()
+    
+    if request.stream:
+        return await _stream_ndjson(ollama_service.stream_generate(
             prompt=request.prompt,
             model=request.model,
             system=request.system,
-            stream=request.stream,
-            options={
-                'temperature': request.temperature,
-                'num_predict': request.max_tokens
-            }
-        )
-        
-        return {
-            "success": True,
-            "data": {
-                "model": response.model,
-                "response": response.response,
-                "created_at": response.created_at.isoformat(),
-                "done": response.done,
-                "total_duration_seconds": response.total_duration_seconds,
-                "tokens_per_second": response.tokens_per_second,
-                "context": response.context,
-                "eval_count": response.eval_count
-            }
+            temperature=request.temperature,
+            max_tokens=request.max_tokens
+        ))
+    
+    response = await ollama_service.generate(
+        prompt=request.prompt,
+        model=request.model,
+        system=request.system,
+        options={
+            'temperature': request.temperature,
+            'num_predict': request.max_tokens
         }
-        
-    except OllamaModelNotFoundError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=str(e)
-        )
-    except OllamaTimeoutError as e:
-        raise HTTPException(
-            status_code=408,
-            detail=str(e)
-        )
-    except OllamaConnectionError as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Cannot connect to Ollama: {str(e)}"
-        )
-    except OllamaGenerationError as e:
-        raise HTTPException(
-            status_code=500,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Generation failed: {str(e)}"
-        )
+    )
+    
+    return {
+        "success": True,
+        "data": {
+            "model": response.model,
+            "response": response.response,
+            "created_at": response.created_at.isoformat(),
+            "done": response.done,
+            "total_duration_seconds": response.total_duration_seconds,
+            "tokens_per_second": response.tokens_per_second,
+            "context": response.context,
+            "eval_count": response.eval_count
+        }
+    }
 
 
 @router.post("/chat", response_model=dict)
+@ollama_errors("Chat completion failed")
 async def chat_completion(request: ChatRequest):
     """Chat completion using Ollama"""
-    try:
-        ollama_service = await get_ollama_service()
-        
-        response = await ollama_service.chat(
+    ollama_service = await get_ollama_service()
+    
+    if request.stream:
+        return await _stream_ndjson(ollama_service.stream_chat(
             messages=request.messages,
             model=request.model,
-            stream=request.stream,
-            options={
-                'temperature': request.temperature,
-                'num_predict': request.max_tokens
-            }
-        )
-        
-        return {
-            "success": True,
-            "data": {
-                "model": response.model,
-                "message": {
-                    "role": response.message.role,
-                    "content": response.message.content
-                },
-                "created_at": response.created_at.isoformat(),
-                "done": response.done,
-                "total_duration_seconds": response.total_duration / 1e9 if response.total_duration else 0,
-                "eval_count": response.eval_count
-            }
+            temperature=request.temperature,
+            max_tokens=request.max_tokens
+        ))
+    
+    response = await ollama_service.chat(
+        messages=request.messages,
+        model=request.model,
+        options={
+            'temperature': request.temperature,
+            'num_predict': request.max_tokens
         }
-        
-    except OllamaModelNotFoundError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=str(e)
-        )
-    except OllamaTimeoutError as e:
-        raise HTTPException(
-            status_code=408,
-            detail=str(e)
-        )
-    except OllamaConnectionError as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Cannot connect to Ollama: {str(e)}"
-        )
-    except OllamaGenerationError as e:
-        raise HTTPException(
-            status_code=500,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Chat completion failed: {str(e)}"
-        )
+    )
+    
+    return {
+        "success": True,
+        "data": {
+            "model": response.model,
+            "message": {
+                "role": response.message.role,
+                "content": response.message.content
+            },
+            "created_at": response.created_at.isoformat(),
+            "done": response.done,
+            "total_duration_seconds": response.total_duration / 1e9 if response.total_duration else 0,
+            "eval_count": response.eval_count
+        }
+    }
 
 
 @router.post("/set-default-model", response_model=SuccessResponse)
+@ollama_errors("Failed to set default model")
 async def set_default_model(request: ModelConfigRequest):
     """Set the default Ollama model"""
-    try:
-        ollama_service = await get_ollama_service()
-        
-        # Check if model exists
-        if not await ollama_service.model_exists(request.model):
-            raise HTTPException(
-                status_code=404,
-                detail=f"Model '{request.model}' not found"
-            )
-        
-        ollama_service.set_default_model(request.model)
-        
-        return SuccessResponse(
-            message=f"Default model set to '{request.model}'",
-            data={
-                "default_model": request.model,
-                "previous_model": ollama_service.get_default_model()
-            }
-        )
-        
-    except HTTPException:
-        raise
-    except OllamaConnectionError as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Cannot connect to Ollama: {str(e)}"
-        )
-    except Exception as e:
+    ollama_service = await get_ollama_service()
+    
+    # Check if model exists
+    if not await ollama_service.model_exists(request.model):
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to set default model: {str(e)}"
+            status_code=404,
+            detail=f"Model '{request.model}' not found"
         )
+    
+    ollama_service.set_default_model(request.model)
+    
+    return SuccessResponse(
+        message=f"Default model set to '{request.model}'",
+        data={
+            "default_model": request.model,
+            "previous_model": ollama_service.get_default_model()
+        }
+    )
 
 
 @router.post("/test", response_model=SuccessResponse)
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, HTTPException
+from functools import lru_cache
 from typing import List, Optional
+import orjson
 
 from app.api.schemas import SuccessResponse
 from app.services.patterns import PatternDetector, PatternType
@@ -9,6 +11,73 @@ from app.db.database import get_db
 router = APIRouter(prefix="/patterns", tags=["patterns"])
 
 
+# Entry rows are shaped into JSON by SQLite so mood_tags arrive already
+# parsed and each query result needs a single orjson.loads
+_ENTRY_JSON_OBJECT = """json_object(
+    'id', id,
+    'raw_text', raw_text,
+    'enhanced_text', enhanced_text,
+    'structured_summary', structured_summary,
+    'timestamp', timestamp,
+    'mood_tags', json(NULLIF(mood_tags, '')),
+    'word_count', word_count
+)"""
+
+
+def _entries_json_sql(inner_query: str) -> str:
+    """Wrap an entries query so it returns all rows as one JSON array"""
+    return f"SELECT json_group_array({_ENTRY_JSON_OBJECT}) AS entries FROM ({inner_query})"
+
+
+async def _fetch_entries_json(db, query: str, params: tuple = ()) -> list:
+    """Run a query built by _entries_json_sql and decode its JSON array.
+    
+    SQLite doesn't promise that json_group_array sees the subquery's rows in
+    its ORDER BY order, so the newest-first order is restored here.
+    """
+    row = await db.fetch_one(query, params)
+    if not row or not row["entries"]:
+        return []
+    entries = orjson.loads(row["entries"])
+    entries.sort(key=lambda entry: entry["timestamp"] or "", reverse=True)
+    return entries
+
+
+@lru_cache(maxsize=64)
+def _entries_in_sql(n: int) -> str:
+    """Build the entries-by-id query for an IN list with n placeholders"""
+    placeholders = ", ".join("?" * n)
+    return _entries_json_sql(
+        f"""SELECT id, raw_text, enhanced_text, structured_summary, 
+                   timestamp, mood_tags, word_count
+            FROM entries 
+            WHERE id IN ({placeholders})
+            ORDER BY timestamp DESC"""
+    )
+
+
+_KEYWORD_SEARCH_SQL = _entries_json_sql(
+    """SELECT DISTINCT id, raw_text, enhanced_text, structured_summary, 
+              timestamp, mood_tags, word_count
+       FROM entries 
+       WHERE (raw_text IS NOT NULL AND LOWER(raw_text) LIKE LOWER(?))
+          OR (enhanced_text IS NOT NULL AND LOWER(enhanced_text) LIKE LOWER(?))
+          OR (structured_summary IS NOT NULL AND LOWER(structured_summary) LIKE LOWER(?))
+       ORDER BY timestamp DESC
+       LIMIT 20"""
+)
+
+
+def _pad_entry_ids(entry_ids: List[int]) -> tuple:
+    """Pad ids to the next power of two with a -1 sentinel.
+    
+    Keeps the number of distinct IN (...) query strings logarithmic in the
+    pattern size so SQLite's statement cache can reuse them.
+    """
+    size = 1 << (len(entry_ids) - 1).bit_length()
+    return tuple(entry_ids) + (-1,) * (size - len(entry_ids))
+
+
 @router.get("/check", response_model=SuccessResponse)
 async def check_pattern_availability():
     """Check pattern detection availability - now always available"""
@@ -74,11 +143,10 @@ async def get_patterns():
         for pattern in patterns:
             data = pattern.to_dict()
             # Ensure JSON fields are parsed
-            import json
             if isinstance(data.get("related_entries"), str):
-                data["related_entries"] = json.loads(data["related_entries"])
+                data["related_entries"] = orjson.loads(data["related_entries"])
             if isinstance(data.get("keywords"), str):
-                data["keywords"] = json.loads(data["keywords"])
+                data["keywords"] = orjson.loads(data["keywords"])
             pattern_data.append(data)
         
         return SuccessResponse(
@@ -98,7 +166,6 @@ async def get_pattern_entries(pattern_id: int):
     """Get entries related to a specific pattern"""
     try:
         db = get_db()
-        import json
         
         # Get pattern
         pattern_row = await db.fetch_one(
@@ -109,7 +176,7 @@ async def get_pattern_entries(pattern_id: int):
             raise HTTPException(status_code=404, detail="Pattern not found")
         
         # Parse related entries
-        related_entries = json.loads(pattern_row["related_entries"])
+        related_entries = orjson.loads(pattern_row["related_entries"]) if pattern_row["related_entries"] else []
         
         if not related_entries:
             return SuccessResponse(
@@ -122,23 +189,8 @@ async def get_pattern_entries(pattern_id: int):
             )
         
         # Fetch entries
-        placeholders = ", ".join(["?" for _ in related_entries])
-        entries = await db.fetch_all(
-            f"""SELECT id, raw_text, enhanced_text, structured_summary, 
-                       timestamp, mood_tags, word_count
-                FROM entries 
-                WHERE id IN ({placeholders})
-                ORDER BY timestamp DESC""",
-            tuple(related_entries)
-        )
-        
-        # Convert to response format
-        entry_data = []
-        for entry in entries:
-            data = dict(entry)
-            if data.get("mood_tags"):
-                data["mood_tags"] = json.loads(data["mood_tags"])
-            entry_data.append(data)
+        params = _pad_entry_ids(related_entries)
+        entry_data = await _fetch_entries_json(db, _entries_in_sql(len(params)), params)
         
         return SuccessResponse(
             message=f"Retrieved {len(entry_data)} entries for pattern {pattern_id}",
@@ -160,7 +212,6 @@ async def get_entries_by_keyword(keyword: str):
     """Get entries that contain a specific keyword"""
     try:
         db = get_db()
-        import json
         
         # Try multiple search approaches
         search_terms = [keyword]
@@ -173,15 +224,9 @@ async def get_entries_by_keyword(keyword: str):
         
         for term in search_terms:
             # Simple substring search
-            entries = await db.fetch_all(
-                """SELECT DISTINCT id, raw_text, enhanced_text, structured_summary, 
-                          timestamp, mood_tags, word_count
-                   FROM entries 
-                   WHERE (raw_text IS NOT NULL AND LOWER(raw_text) LIKE LOWER(?))
-                      OR (enhanced_text IS NOT NULL AND LOWER(enhanced_text) LIKE LOWER(?))
-                      OR (structured_summary IS NOT NULL AND LOWER(structured_summary) LIKE LOWER(?))
-                   ORDER BY timestamp DESC
-                   LIMIT 20""",
+            entries = await _fetch_entries_json(
+                db,
+                _KEYWORD_SEARCH_SQL,
                 (f"%{term}%", f"%{term}%", f"%{term}%")
             )
             
@@ -214,30 +259,22 @@ async def get_entries_by_keyword(keyword: str):
                     word_params.extend([f"%{word}%", f"%{word}%", f"%{word}%"])
             
             if word_conditions:
-                query = f"""
+                query = _entries_json_sql(f"""
                     SELECT DISTINCT id, raw_text, enhanced_text, structured_summary, 
                            timestamp, mood_tags, word_count
                     FROM entries 
                     WHERE {' OR '.join(word_conditions)}
                     ORDER BY timestamp DESC
                     LIMIT 20
-                """
-                entries = await db.fetch_all(query, tuple(word_params))
-        
-        # Convert to response format
-        entry_data = []
-        for entry in entries:
-            data = dict(entry)
-            if data.get("mood_tags"):
-                data["mood_tags"] = json.loads(data["mood_tags"])
-            entry_data.append(data)
+                """)
+                entries = await _fetch_entries_json(db, query, tuple(word_params))
         
         return SuccessResponse(
-            message=f"Found {len(entry_data)} entries containing '{keyword}'",
+            message=f"Found {len(entries)} entries containing '{keyword}'",
             data={
-                "entries": entry_data,
+                "entries": entries,
                 "keyword": keyword,
-                "total": len(entry_data)
+                "total": len(entries)
             }
         )
         
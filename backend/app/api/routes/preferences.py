@@ -21,18 +21,11 @@ async def list_preferences():
         preferences = await PreferencesRepository.get_all()
         
         preference_responses = [
-            PreferenceResponse(
-                id=pref.id,
-                key=pref.key,
-                value=pref.value,
-                value_type=pref.value_type,
-                description=pref.description,
-                typed_value=pref.get_typed_value()
-            )
+            PreferenceResponse.from_preference(pref)
             for pref in preferences
         ]
         
-        return PreferencesListResponse(preferences=preference_responses)
+        return PreferencesListResponse.model_construct(preferences=preference_responses)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get preferences: {str(e)}")
@@ -47,14 +40,7 @@ async def get_preference(key: str = Path(..., description="Preference key")):
         if not preference:
             raise HTTPException(status_code=404, detail="Preference not found")
         
-        return PreferenceResponse(
-            id=preference.id,
-            key=preference.key,
-            value=preference.value,
-            value_type=preference.value_type,
-            description=preference.description,
-            typed_value=preference.get_typed_value()
-        )
+        return PreferenceResponse.from_preference(preference)
         
     except HTTPException:
         raise
@@ -81,14 +67,7 @@ async def update_preference(
             description=preference_data.description
         )
         
-        return PreferenceResponse(
-            id=preference.id,
-            key=preference.key,
-            value=preference.value,
-            value_type=preference.value_type,
-            description=preference.description,
-            typed_value=preference.get_typed_value()
-        )
+        return PreferenceResponse.from_preference(preference)
         
     except HTTPException:
         raise
@@ -100,16 +79,7 @@ async def update_preference(
 async def bulk_update_preferences(preferences_data: PreferencesBulkUpdate):
     """Update multiple preferences at once"""
     try:
-        updated_count = 0
-        
-        for pref_update in preferences_data.preferences:
-            await PreferencesRepository.set_value(
-                key=pref_update.key,
-                value=pref_update.value,
-                value_type=pref_update.value_type,
-                description=pref_update.description
-            )
-            updated_count += 1
+        updated_count = await PreferencesRepository.set_many(preferences_data.preferences)
         
         return SuccessResponse(
             message=f"Successfully updated {updated_count} preferences",
@@ -1,19 +1,44 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 
+from app.api.errors import server_error
+from app.api.etag import etag_response
 from app.api.schemas import SuccessResponse, ErrorResponse
-from app.services import STTService, get_stt_service, RecordingState
+from app.services import STTService, get_stt_service, get_stt_service_sync, RecordingState
 
-router = APIRouter(prefix="/stt", tags=["speech-to-text"])
+router = APIRouter(prefix="/stt", tags=["speech-to-text"], default_response_class=ORJSONResponse)
+
+# Static response fragments, shared across requests rather than rebuilt.
+# Kept as plain dicts (not MappingProxyType) so orjson can serialize them.
+_MODEL_RECOMMENDATIONS = {
+    "fastest": "tiny",
+    "balanced": "base",
+    "most_accurate": "large-v3",
+    "english_only_fast": "base.en",
+    "english_only_accurate": "medium.en"
+}
+
+_SAMPLE_RATE_NOTES = {
+    "whisper_requirement": "16kHz for optimal performance",
+    "resampling_method": "librosa with scipy fallback"
+}
+
+
+async def _resolve_stt_service() -> STTService:
+    """Resolve the shared STT service, initializing it on first use"""
+    # Dependencies run outside the handlers' try blocks, so map failures here
+    try:
+        return get_stt_service_sync() or await get_stt_service()
+    except Exception as e:
+        raise server_error("Failed to initialize STT service", e)
 
 
 @router.post("/start", response_model=SuccessResponse)
-async def start_recording():
+async def start_recording(stt_service: STTService = Depends(_resolve_stt_service)):
     """Start audio recording for speech-to-text"""
     try:
-        stt_service = await get_stt_service()
-        
-        success = stt_service.start_recording()
+        success, new_state = stt_service.start_recording()
         
         if not success:
             raise HTTPException(
@@ -21,10 +46,10 @@ async def start_recording():
                 detail="Cannot start recording in current state"
             )
         
-        return SuccessResponse(
+        return SuccessResponse.ok(
             message="Recording started successfully",
             data={
-                "state": stt_service.get_current_state().value,
+                "state": new_state.value,
                 "message": "Hold to record, release to stop"
             }
         )
@@ -32,19 +57,14 @@ async def start_recording():
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to start recording: {str(e)}"
-        )
+        raise server_error("Failed to start recording", e)
 
 
 @router.post("/stop", response_model=SuccessResponse)
-async def stop_recording():
+async def stop_recording(stt_service: STTService = Depends(_resolve_stt_service)):
     """Stop audio recording and start transcription"""
     try:
-        stt_service = await get_stt_service()
-        
-        success = stt_service.stop_recording()
+        success, new_state = stt_service.stop_recording()
         
         if not success:
             raise HTTPException(
@@ -52,10 +72,10 @@ async def stop_recording():
                 detail="Cannot stop recording in current state"
             )
         
-        return SuccessResponse(
+        return SuccessResponse.ok(
             message="Recording stopped, transcription started",
             data={
-                "state": stt_service.get_current_state().value,
+                "state": new_state.value,
                 "message": "Processing audio..."
             }
         )
@@ -63,21 +83,16 @@ async def stop_recording():
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to stop recording: {str(e)}"
-        )
+        raise server_error("Failed to stop recording", e)
 
 
 @router.post("/cancel", response_model=SuccessResponse)
-async def cancel_recording():
+async def cancel_recording(stt_service: STTService = Depends(_resolve_stt_service)):
     """Cancel current recording"""
     try:
-        stt_service = await get_stt_service()
-        
         success = stt_service.cancel_recording()
         
-        return SuccessResponse(
+        return SuccessResponse.ok(
             message="Recording cancelled" if success else "No active recording to cancel",
             data={
                 "state": stt_service.get_current_state().value,
@@ -86,50 +101,41 @@ async def cancel_recording():
         )
         
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to cancel recording: {str(e)}"
-        )
+        raise server_error("Failed to cancel recording", e)
 
 
 @router.get("/status", response_model=dict)
-async def get_recording_status():
+async def get_recording_status(stt_service: STTService = Depends(_resolve_stt_service)):
     """Get current recording status and state information"""
     try:
-        stt_service = await get_stt_service()
-        
         state_info = stt_service.get_state_info()
+        state_message, state_icon = stt_service.state_manager.get_state_meta()
         
         return {
             "success": True,
             "data": {
                 **state_info,
-                "state_message": stt_service.state_manager.get_state_message(),
-                "state_icon": stt_service.state_manager.get_state_icon()
+                "state_message": state_message,
+                "state_icon": state_icon
             }
         }
         
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get status: {str(e)}"
-        )
+        raise server_error("Failed to get status", e)
 
 
-@router.get("/transcription", response_model=dict)
-async def get_last_transcription():
-    """Get the last transcription result"""
+@router.get(
+    "/transcription",
+    response_model=dict,
+    responses={204: {"description": "No transcription available"}}
+)
+async def get_last_transcription(stt_service: STTService = Depends(_resolve_stt_service)):
+    """Get the last transcription result (204 No Content when there is none)"""
     try:
-        stt_service = await get_stt_service()
-        
         transcription = stt_service.get_last_transcription()
         
         if not transcription:
-            return {
-                "success": True,
-                "data": None,
-                "message": "No transcription available"
-            }
+            return Response(status_code=204)
         
         return {
             "success": True,
@@ -138,49 +144,33 @@ async def get_last_transcription():
         }
         
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get transcription: {str(e)}"
-        )
+        raise server_error("Failed to get transcription", e)
 
 
 @router.get("/models", response_model=dict)
-async def get_available_models():
+async def get_available_models(request: Request, stt_service: STTService = Depends(_resolve_stt_service)):
     """Get list of available Whisper models"""
     try:
-        stt_service = await get_stt_service()
-        
         models = stt_service.whisper_service.get_available_models()
         current_model = stt_service.whisper_service.get_model_info()
         
-        return {
+        return etag_response(request, {
             "success": True,
             "data": {
                 "available_models": models,
                 "current_model": current_model,
-                "recommendations": {
-                    "fastest": "tiny",
-                    "balanced": "base", 
-                    "most_accurate": "large-v3",
-                    "english_only_fast": "base.en",
-                    "english_only_accurate": "medium.en"
-                }
+                "recommendations": _MODEL_RECOMMENDATIONS
             }
-        }
+        })
         
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get models: {str(e)}"
-        )
+        raise server_error("Failed to get models", e)
 
 
 @router.post("/change-model", response_model=SuccessResponse)
-async def change_whisper_model(model_name: str):
+async def change_whisper_model(model_name: str, stt_service: STTService = Depends(_resolve_stt_service)):
     """Change the Whisper model"""
     try:
-        stt_service = await get_stt_service()
-        
         # Check if recording is active
         if stt_service.state_manager.is_active():
             raise HTTPException(
@@ -188,10 +178,8 @@ async def change_whisper_model(model_name: str):
                 detail="Cannot change model while recording is active"
             )
         
-        # Get available models
-        available_models = stt_service.whisper_service.get_available_models()
-        
-        if model_name not in available_models:
+        if not stt_service.whisper_service.is_model_available(model_name):
+            available_models = stt_service.whisper_service.get_available_models()
             raise HTTPException(
                 status_code=400,
                 detail=f"Model '{model_name}' not available. Available models: {available_models}"
@@ -206,7 +194,7 @@ async def change_whisper_model(model_name: str):
                 detail=f"Failed to load model '{model_name}'"
             )
         
-        return SuccessResponse(
+        return SuccessResponse.ok(
             message=f"Model changed to '{model_name}' successfully",
             data={
                 "model_name": model_name,
@@ -217,65 +205,49 @@ async def change_whisper_model(model_name: str):
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to change model: {str(e)}"
-        )
+        raise server_error("Failed to change model", e)
 
 
 @router.get("/devices", response_model=dict)
-async def get_audio_devices():
+async def get_audio_devices(request: Request, stt_service: STTService = Depends(_resolve_stt_service)):
     """Get list of available audio input devices"""
     try:
-        stt_service = await get_stt_service()
-        
         devices = stt_service.audio_capture.get_input_devices()
         
-        return {
+        return etag_response(request, {
             "success": True,
             "data": {
                 "devices": devices,
                 "count": len(devices)
             }
-        }
+        })
         
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get audio devices: {str(e)}"
-        )
+        raise server_error("Failed to get audio devices", e)
 
 
 @router.get("/sample-rates", response_model=dict)
-async def get_sample_rate_info():
+async def get_sample_rate_info(stt_service: STTService = Depends(_resolve_stt_service)):
     """Get sample rate information for dynamic resampling"""
     try:
-        stt_service = await get_stt_service()
-        
         sample_info = stt_service.audio_capture.get_sample_rate_info()
         
         return {
             "success": True,
             "data": {
                 **sample_info,
-                "whisper_requirement": "16kHz for optimal performance",
-                "resampling_method": "librosa with scipy fallback"
+                **_SAMPLE_RATE_NOTES
             }
         }
         
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get sample rate info: {str(e)}"
-        )
+        raise server_error("Failed to get sample rate info", e)
 
 
 @router.post("/test", response_model=SuccessResponse)
-async def test_stt_service():
+async def test_stt_service(stt_service: STTService = Depends(_resolve_stt_service)):
     """Test STT service initialization and basic functionality"""
     try:
-        stt_service = await get_stt_service()
-        
         # Test audio capture initialization
         audio_ok = stt_service.audio_capture.audio is not None
         
@@ -286,7 +258,7 @@ async def test_stt_service():
         devices = stt_service.audio_capture.get_input_devices()
         sample_info = stt_service.audio_capture.get_sample_rate_info()
         
-        return SuccessResponse(
+        return SuccessResponse.ok(
             message="STT service test completed",
             data={
                 "audio_capture": audio_ok,
@@ -299,7 +271,4 @@ async def test_stt_service():
         )
         
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"STT service test failed: {str(e)}"
-        )
\ No newline at end of file
+        raise server_error("STT service test failed", e)
\ No newline at end of file
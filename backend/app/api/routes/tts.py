@@ -6,20 +6,32 @@ This module provides endpoints for:
 - Streaming audio generation for conversational use
 """
 
+import asyncio
 import logging
 import os
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, Response
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.api.errors import server_error
+from app.api.etag import etag_response
 from app.api.schemas import SuccessResponse, ErrorResponse
-from app.services.tts_service import get_tts_service
+from app.services.tts_service import TTSService, get_tts_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/tts", tags=["tts"])
+router = APIRouter(prefix="/tts", tags=["tts"], default_response_class=ORJSONResponse)
+
+
+async def _resolve_tts_service() -> TTSService:
+    """Resolve the shared TTS service without a threadpool hop."""
+    # Dependencies run outside the handlers' try blocks, so map failures here
+    try:
+        return get_tts_service()
+    except Exception as e:
+        raise server_error("Failed to initialize TTS service", e)
 
 
 # Request Models
@@ -50,8 +62,61 @@ class TTSVoicesResponse(BaseModel):
     voices: List[TTSVoiceOption] = Field(..., description="List of available voice options")
 
 
+# TTS model directory, resolved once at import: TTS/ when running from
+# backend, backend/TTS/ when running from the project root
+_TTS_DIR: Optional[Path] = next(
+    (path for path in (Path("TTS"), Path("backend/TTS")) if path.is_dir()),
+    None
+)
+
+# Voice list per TTS directory, keyed by the directory's mtime so adding or
+# removing a model file invalidates the entry
+_VOICES_CACHE: Dict[Path, Tuple[int, List[TTSVoiceOption]]] = {}
+_VOICES_LOCK = asyncio.Lock()
+
+
+def _scan_voices(tts_dir: Path) -> List[TTSVoiceOption]:
+    """Build voice options from the .onnx model files in a directory"""
+    voices = []
+    
+    # os.scandir reads names straight from the directory listing without
+    # building a Path object per file; .onnx.json configs don't match ".onnx"
+    with os.scandir(tts_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".onnx"):
+                filename_without_ext = name[:-5]
+                # Create a display name from the filename
+                display_name = filename_without_ext.replace("_", " ").replace("-", " ").title()
+                
+                voices.append(TTSVoiceOption(
+                    name=display_name,
+                    filename=filename_without_ext
+                ))
+    
+    return voices
+
+
+async def _get_cached_voices(tts_dir: Path) -> List[TTSVoiceOption]:
+    """Return the voices in tts_dir, rescanning only when the directory changed"""
+    mtime = tts_dir.stat().st_mtime_ns
+    cached = _VOICES_CACHE.get(tts_dir)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    async with _VOICES_LOCK:
+        # Another request may have rescanned while we waited
+        cached = _VOICES_CACHE.get(tts_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        voices = _scan_voices(tts_dir)
+        _VOICES_CACHE[tts_dir] = (mtime, voices)
+        return voices
+
+
 @router.get("/voices", response_model=SuccessResponse[TTSVoicesResponse])
-async def get_available_voices():
+async def get_available_voices(request: Request):
     """
     Get list of available TTS voice models from the TTS directory.
     
@@ -59,45 +124,23 @@ async def get_available_voices():
         List of voice models found in backend/TTS directory
     """
     try:
-        # Get the TTS directory path
-        # Try TTS folder first (when running from backend)
-        tts_dir = Path("TTS")
-        if not tts_dir.exists():
-            # Try with backend prefix (when running from project root)
-            tts_dir = Path("backend/TTS")
-        
         voices = []
+        if _TTS_DIR is not None:
+            voices = await _get_cached_voices(_TTS_DIR)
         
-        # Look for .onnx files in the directory
-        if tts_dir.exists() and tts_dir.is_dir():
-            for file_path in tts_dir.glob("*.onnx"):
-                # Skip .onnx.json files
-                if not file_path.name.endswith(".onnx.json"):
-                    filename_without_ext = file_path.stem
-                    # Create a display name from the filename
-                    display_name = filename_without_ext.replace("_", " ").replace("-", " ").title()
-                    
-                    voices.append(TTSVoiceOption(
-                        name=display_name,
-                        filename=filename_without_ext
-                    ))
-        
-        return SuccessResponse(
-            success=True,
+        response = SuccessResponse.ok(
             message="Available voices retrieved successfully",
             data=TTSVoicesResponse(voices=voices)
         )
+        return etag_response(request, response.model_dump(mode="json"))
         
     except Exception as e:
         logger.error(f"Failed to get available voices: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get available voices: {str(e)}"
-        )
+        raise server_error("Failed to get available voices", e)
 
 
 @router.post("/synthesize")
-async def synthesize_speech(request: TTSSynthesizeRequest):
+async def synthesize_speech(request: TTSSynthesizeRequest, tts_service: TTSService = Depends(_resolve_tts_service)):
     """
     Convert text to speech using piper-tts.
     
@@ -113,8 +156,6 @@ async def synthesize_speech(request: TTSSynthesizeRequest):
     try:
         logger.info(f"TTS request - text: '{request.text[:50]}...', stream: {request.stream}")
         
-        tts_service = get_tts_service()
-        
         # Generate speech audio
         audio_result = await tts_service.synthesize_speech(
             text=request.text,
@@ -123,13 +164,9 @@ async def synthesize_speech(request: TTSSynthesizeRequest):
         
         # Check if result is streaming (async generator) or complete (bytes)
         if hasattr(audio_result, '__aiter__'):
-            # Streaming response
-            async def audio_generator():
-                async for chunk in audio_result:
-                    yield chunk
-            
+            # Streaming response - the service generator is consumed directly
             return StreamingResponse(
-                audio_generator(),
+                audio_result,
                 media_type="audio/wav",
                 headers={
                     "Content-Disposition": "inline; filename=speech.wav",
@@ -155,14 +192,11 @@ async def synthesize_speech(request: TTSSynthesizeRequest):
         )
     except Exception as e:
         logger.error(f"TTS synthesis failed: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Speech synthesis failed: {str(e)}"
-        )
+        raise server_error("Speech synthesis failed", e)
 
 
 @router.get("/model-info", response_model=SuccessResponse[TTSModelInfoResponse])
-async def get_tts_model_info():
+async def get_tts_model_info(tts_service: TTSService = Depends(_resolve_tts_service)):
     """
     Get information about the loaded TTS model.
     
@@ -173,28 +207,22 @@ async def get_tts_model_info():
         HTTPException: If model info retrieval fails
     """
     try:
-        tts_service = get_tts_service()
-        
         model_info = await tts_service.get_model_info()
         
         response_data = TTSModelInfoResponse(**model_info)
         
-        return SuccessResponse(
-            success=True,
+        return SuccessResponse.ok(
             message="TTS model information retrieved successfully",
             data=response_data
         )
         
     except Exception as e:
         logger.error(f"Failed to get TTS model info: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get model information: {str(e)}"
-        )
+        raise server_error("Failed to get model information", e)
 
 
 @router.post("/initialize", response_model=SuccessResponse[dict])
-async def initialize_tts_model():
+async def initialize_tts_model(tts_service: TTSService = Depends(_resolve_tts_service)):
     """
     Initialize the TTS model.
     
@@ -207,15 +235,12 @@ async def initialize_tts_model():
         HTTPException: If initialization fails
     """
     try:
-        tts_service = get_tts_service()
-        
         await tts_service.initialize()
         
         # Get model info after initialization
         model_info = await tts_service.get_model_info()
         
-        return SuccessResponse(
-            success=True,
+        return SuccessResponse.ok(
             message="TTS model initialized successfully",
             data={
                 "status": "initialized",
@@ -225,14 +250,11 @@ async def initialize_tts_model():
         
     except Exception as e:
         logger.error(f"TTS initialization failed: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to initialize TTS model: {str(e)}"
-        )
+        raise server_error("Failed to initialize TTS model", e)
 
 
 @router.get("/status", response_model=SuccessResponse[dict])
-async def get_tts_status():
+async def get_tts_status(tts_service: TTSService = Depends(_resolve_tts_service)):
     """
     Get current TTS service status.
     
@@ -240,8 +262,6 @@ async def get_tts_status():
         TTS service status and readiness
     """
     try:
-        tts_service = get_tts_service()
-        
         is_ready = tts_service.is_ready()
         
         # Get current model name
@@ -253,8 +273,7 @@ async def get_tts_status():
             except:
                 pass
         
-        return SuccessResponse(
-            success=True,
+        return SuccessResponse.ok(
             message="TTS status retrieved successfully",
             data={
                 "is_ready": is_ready,
@@ -265,7 +284,4 @@ async def get_tts_status():
         
     except Exception as e:
         logger.error(f"Failed to get TTS status: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get TTS status: {str(e)}"
-        )
\ No newline at end of file
+        raise server_error("Failed to get TTS status", e)
\ No newline at end of file
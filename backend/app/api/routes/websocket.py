@@ -3,14 +3,24 @@ WebSocket endpoints for real-time STT communication
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 import logging
 
 from app.services.websocket import get_websocket_manager
 
-router = APIRouter(tags=["websocket"])
+router = APIRouter(tags=["websocket"], default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+# Static parts of the /ws/status payload, built once at import
+_CHANNELS = {
+    "stt": "Recording state updates",
+    "transcription": "Transcription results",
+    "hotkey": "Hotkey-related updates",
+    "system": "System messages"
+}
+_STATIC_STATUS = {"service": "websocket", "status": "operational"}
+
 
 @router.websocket("/ws/stt")
 async def websocket_stt_endpoint(
@@ -33,13 +43,14 @@ async def websocket_stt_endpoint(
     websocket_manager = await get_websocket_manager()
     
     # Client info for logging/tracking
+    # Headers stay reachable through connection.websocket.headers, so they
+    # aren't copied into a dict for every connection
     client_info = {
         "client_id": client_id,
-        "client_host": websocket.client.host if websocket.client else None,
-        "headers": dict(websocket.headers) if hasattr(websocket, 'headers') else {}
+        "client_host": websocket.client.host if websocket.client else None
     }
     
-    logger.info(f"WebSocket connection request from {client_info.get('client_host')} (ID: {client_id})")
+    logger.info(f"WebSocket connection request from {client_info['client_host']} (ID: {client_id})")
     
     try:
         await websocket_manager.handle_connection(websocket, client_info)
@@ -56,17 +67,7 @@ async def get_websocket_status():
         
         return {
             "success": True,
-            "data": {
-                "service": "websocket",
-                "status": "operational",
-                "statistics": stats,
-                "channels": {
-                    "stt": "Recording state updates",
-                    "transcription": "Transcription results", 
-                    "hotkey": "Hotkey-related updates",
-                    "system": "System messages"
-                }
-            }
+            "data": {**_STATIC_STATUS, "statistics": stats, "channels": _CHANNELS}
         }
         
     except Exception as e:
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Any, TypeVar, Generic
 
 T = TypeVar('T')
@@ -10,14 +10,20 @@ class SuccessResponse(BaseModel, Generic[T]):
     message: str = "Operation completed successfully"
     data: Optional[T] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Entry created successfully",
                 "data": {"id": 1}
             }
         }
+    )
+    
+    @classmethod
+    def ok(cls, message: str = "Operation completed successfully", data: Optional[T] = None):
+        """Build a success response from trusted server data without validation"""
+        return cls.model_construct(success=True, message=message, data=data)
 
 
 class ErrorResponse(BaseModel):
@@ -27,8 +33,8 @@ class ErrorResponse(BaseModel):
     error_code: Optional[str] = None
     details: Optional[dict] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": False,
                 "message": "Entry not found",
@@ -36,6 +42,7 @@ class ErrorResponse(BaseModel):
                 "details": {"entry_id": 123}
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -46,8 +53,8 @@ class HealthResponse(BaseModel):
     timestamp: str
     database: str = "connected"
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "service": "boo-journal-api",
@@ -56,6 +63,7 @@ class HealthResponse(BaseModel):
                 "database": "connected"
             }
         }
+    )
 
 
 class PaginationParams(BaseModel):
@@ -63,10 +71,11 @@ class PaginationParams(BaseModel):
     page: int = 1
     page_size: int = 20
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "page": 1,
                 "page_size": 20
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
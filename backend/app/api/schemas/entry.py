@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional, List
 
@@ -12,8 +12,8 @@ class EntryCreate(BaseModel):
     custom_timestamp: Optional[datetime] = Field(None, description="Custom timestamp for the entry (for backfilling)")
     processing_metadata: Optional[dict] = Field(None, description="Processing metadata from AI processing")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "raw_text": "Today was a great day. I learned something new.",
                 "enhanced_text": "Today was an excellent day. I learned something fascinating.",
@@ -21,6 +21,7 @@ class EntryCreate(BaseModel):
                 "mode": "raw"
             }
         }
+    )
 
 
 class EntryUpdate(BaseModel):
@@ -31,13 +32,14 @@ class EntryUpdate(BaseModel):
     mode: Optional[str] = None
     mood_tags: Optional[List[str]] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "enhanced_text": "Today was an excellent day. I learned something fascinating.",
                 "mode": "enhanced"
             }
         }
+    )
 
 
 class EntryResponse(BaseModel):
@@ -54,9 +56,9 @@ class EntryResponse(BaseModel):
     processing_metadata: Optional[dict] = None
     smart_tags: Optional[List[str]] = None
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "raw_text": "Today was a great day.",
@@ -69,6 +71,24 @@ class EntryResponse(BaseModel):
                 "processing_metadata": {"model": "llama2", "processing_time": 1.5}
             }
         }
+    )
+    
+    @staticmethod
+    def to_dict_fast(entry) -> dict:
+        """Read an Entry's attributes into a plain dict, skipping validation"""
+        return {
+            "id": entry.id,
+            "raw_text": entry.raw_text,
+            "enhanced_text": entry.enhanced_text,
+            "structured_summary": entry.structured_summary,
+            "mode": entry.mode,
+            "embeddings": entry.embeddings,
+            "timestamp": entry.timestamp,
+            "mood_tags": entry.mood_tags,
+            "word_count": entry.word_count,
+            "processing_metadata": entry.processing_metadata,
+            "smart_tags": entry.smart_tags
+        }
 
 
 class EntryListResponse(BaseModel):
@@ -86,34 +106,37 @@ class EntrySearchRequest(BaseModel):
     query: str = Field(..., min_length=1, description="Search query")
     limit: int = Field(default=50, ge=1, le=100, description="Maximum results")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "learning",
                 "limit": 20
             }
         }
+    )
 
 
 class MoodAnalysisRequest(BaseModel):
     """Schema for mood analysis request"""
     text: str = Field(..., min_length=1, description="Text to analyze for mood")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "text": "I had a wonderful day today. Felt really happy and accomplished after finishing my project."
             }
         }
+    )
 
 
 class MoodAnalysisResponse(BaseModel):
     """Schema for mood analysis response"""
     mood_tags: List[str] = Field(..., description="Extracted mood tags")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "mood_tags": ["happy", "accomplished", "content"]
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Any, List
 
 
@@ -9,8 +9,8 @@ class PreferenceUpdate(BaseModel):
     value_type: str = Field(default="string", description="Value type (string, int, float, bool, json)")
     description: Optional[str] = Field(None, description="Preference description")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "key": "hotkey",
                 "value": "F9",
@@ -18,6 +18,7 @@ class PreferenceUpdate(BaseModel):
                 "description": "Global hotkey for voice recording"
             }
         }
+    )
 
 
 class PreferenceResponse(BaseModel):
@@ -29,9 +30,9 @@ class PreferenceResponse(BaseModel):
     description: Optional[str] = None
     typed_value: Any = Field(..., description="Value with proper type conversion")
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "key": "hotkey",
@@ -41,6 +42,19 @@ class PreferenceResponse(BaseModel):
                 "typed_value": "F8"
             }
         }
+    )
+    
+    @classmethod
+    def from_preference(cls, preference) -> "PreferenceResponse":
+        """Build a response from a stored Preferences model without re-validation"""
+        return cls.model_construct(
+            id=preference.id,
+            key=preference.key,
+            value=preference.value,
+            value_type=preference.value_type,
+            description=preference.description,
+            typed_value=preference.get_typed_value()
+        )
 
 
 class PreferencesListResponse(BaseModel):
@@ -52,8 +66,8 @@ class PreferencesBulkUpdate(BaseModel):
     """Schema for bulk preference updates"""
     preferences: List[PreferenceUpdate]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "preferences": [
                     {
@@ -68,4 +82,5 @@ class PreferencesBulkUpdate(BaseModel):
                     }
                 ]
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
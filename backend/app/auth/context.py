@@ -0,0 +1,7 @@
+"""Per-request authentication context"""
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# User validated for the request being handled. Each request runs in its own
+# context, so a value set here never leaks into another request.
+current_user_cv: ContextVar[Optional[Dict[str, Any]]] = ContextVar("current_user", default=None)
@@ -2,6 +2,7 @@ from fastapi import Depends, HTTPException, Request, status
 from typing import Optional, Dict, Any
 
 from ..services.auth_service import get_auth_service
+from .context import current_user_cv
 
 
 async def get_current_user(request: Request) -> Dict[str, Any]:
@@ -9,17 +10,23 @@ async def get_current_user(request: Request) -> Dict[str, Any]:
     Dependency that validates session and switches to user's database.
     Use this on all protected endpoints.
     """
+    # Reuse a user already validated for this request (by an earlier
+    # dependency or the authentication middleware)
+    user = current_user_cv.get()
+    if user is not None:
+        return user
+    
     # Get session token from Authorization header
     auth_header = request.headers.get("Authorization")
     
-    if not auth_header or not auth_header.startswith("Bearer "):
+    if not auth_header or len(auth_header) <= 7 or auth_header[:7] != "Bearer ":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    session_token = auth_header.replace("Bearer ", "")
+    session_token = auth_header[7:]
     
     # Validate session and switch database context
     auth_service = get_auth_service()
@@ -32,6 +39,7 @@ async def get_current_user(request: Request) -> Dict[str, Any]:
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    current_user_cv.set(user)
     return user
 
 
@@ -40,6 +48,10 @@ async def get_current_user_optional(request: Request) -> Optional[Dict[str, Any]
     Optional dependency that validates session if present.
     Returns None if no valid session.
     """
+    user = current_user_cv.get()
+    if user is not None:
+        return user
+    
     try:
         return await get_current_user(request)
     except HTTPException:
@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 import os
 
@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     OLLAMA_DEFAULT_MODEL: str = "mistral:latest"
     OLLAMA_TIMEOUT: int = 30
+    OLLAMA_PREWARM: bool = False  # Open the client and load the default model at startup
     
     # STT settings
     WHISPER_MODEL: str = "base"
@@ -50,15 +51,21 @@ class Settings(BaseSettings):
     MIN_ENTRIES_FOR_PATTERNS: int = 30
     PATTERN_CONFIDENCE_THRESHOLD: float = 0.7
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True
+    )
 
 
 settings = Settings()
 
-# Create necessary directories
-os.makedirs(settings.DATA_DIR, exist_ok=True)
-os.makedirs(settings.AUDIO_DIR, exist_ok=True)
-os.makedirs(settings.EMBEDDING_CACHE_DIR, exist_ok=True)
\ No newline at end of file
+# Filesystem path of the default database, derived once from DATABASE_URL
+DATABASE_PATH = settings.DATABASE_URL.replace("sqlite+aiosqlite:///", "")
+
+
+def ensure_dirs():
+    """Create the data directories (called from init_db, not at import)"""
+    os.makedirs(settings.DATA_DIR, exist_ok=True)
+    os.makedirs(settings.AUDIO_DIR, exist_ok=True)
+    os.makedirs(settings.EMBEDDING_CACHE_DIR, exist_ok=True)
\ No newline at end of file
@@ -1,10 +1,4 @@
 from .database import db, init_db
-from .repositories import (
-    EntryRepository,
-    PatternRepository,
-    PreferencesRepository,
-    DraftRepository
-)
 
 __all__ = [
     "db",
@@ -13,4 +7,21 @@ __all__ = [
     "PatternRepository",
     "PreferencesRepository",
     "DraftRepository"
-]
\ No newline at end of file
+]
+
+_LAZY_REPOSITORIES = {
+    "EntryRepository",
+    "PatternRepository",
+    "PreferencesRepository",
+    "DraftRepository"
+}
+
+
+def __getattr__(name: str):
+    """Import repository classes on first access (PEP 562)"""
+    if name in _LAZY_REPOSITORIES:
+        from . import repositories
+        value = getattr(repositories, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,18 +1,59 @@
+import asyncio
+import logging
+import os
 import aiosqlite
-from typing import Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
 
-from app.core.config import settings
-from app.db.schema import ALL_TABLES, INDEXES
+from app.core.config import DATABASE_PATH, ensure_dirs
+from app.db.schema import ALL_TABLES, INDEXES, TRIGGERS
 from app.db.migrations import run_migrations as run_db_migrations
 
+logger = logging.getLogger(__name__)
+
+
+# Applied once to every new connection. WAL lets readers run alongside a
+# writer, and synchronous=NORMAL is durable under WAL while avoiding an
+# fsync on every commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA wal_autocheckpoint = 1000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA foreign_keys = ON",
+)
+
+# Readers share the WAL set up by the writer and refuse to modify the file
+READER_PRAGMAS = CONNECTION_PRAGMAS[1:] + ("PRAGMA query_only = 1",)
+
+# One reader per core, capped so the per-connection page caches stay bounded
+READER_POOL_SIZE = min(os.cpu_count() or 1, 4)
+
+# Per-connection prepared statement cache (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
 
 class Database:
+    """One writer connection plus a small pool of read-only connections.
+
+    Writes, and any read issued while the writer has an open transaction,
+    go through the writer so callers always see their own uncommitted
+    changes. Other reads are served by the reader pool and run
+    concurrently with the writer under WAL.
+    """
+
     def __init__(self):
         # Default to config path, but can be overridden by DatabaseManager
-        self.db_path = settings.DATABASE_URL.replace("sqlite+aiosqlite:///", "")
+        self.db_path = DATABASE_PATH
         self._connection: Optional[aiosqlite.Connection] = None
         self._current_path: Optional[str] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._reader_pool: Optional[asyncio.Queue] = None
     
     async def set_db_path(self, new_path: str):
         """Switch to a different database path"""
@@ -24,23 +65,70 @@ class Database:
             self._current_path = None
     
     async def connect(self):
-        """Create database connection"""
+        """Create the writer connection and the reader pool"""
         # If we have a connection but path changed, close it first
         if self._connection and self._current_path != self.db_path:
             await self.disconnect()
         
         if not self._connection:
-            self._connection = await aiosqlite.connect(self.db_path)
-            self._connection.row_factory = aiosqlite.Row
-            await self._connection.execute("PRAGMA foreign_keys = ON")
+            self._connection = await self._open(CONNECTION_PRAGMAS)
             self._current_path = self.db_path
+            
+            # An in-memory database is private to its connection, so readers
+            # would not see the writer's data
+            if self.db_path != ":memory:":
+                cursor = await self._connection.execute("PRAGMA journal_mode")
+                journal_mode = (await cursor.fetchone())[0]
+                if journal_mode != "wal":
+                    logger.warning(f"SQLite WAL mode unavailable for {self.db_path}, using {journal_mode}")
+                
+                self._readers = list(await asyncio.gather(
+                    *(self._open(READER_PRAGMAS) for _ in range(READER_POOL_SIZE))
+                ))
+                self._reader_pool = asyncio.Queue()
+                for reader in self._readers:
+                    self._reader_pool.put_nowait(reader)
+    
+    async def _open(self, pragmas: tuple) -> aiosqlite.Connection:
+        """Open a connection to the current path and apply pragmas"""
+        connection = await aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        connection.row_factory = aiosqlite.Row
+        for pragma in pragmas:
+            await connection.execute(pragma)
+        return connection
     
     async def disconnect(self):
-        """Close database connection"""
+        """Close the writer and all reader connections"""
+        readers, self._readers, self._reader_pool = self._readers, [], None
+        for reader in readers:
+            await reader.close()
         if self._connection:
             await self._connection.close()
             self._connection = None
     
+    @asynccontextmanager
+    async def acquire_writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield the writer connection"""
+        if not self._connection:
+            await self.connect()
+        yield self._connection
+    
+    @asynccontextmanager
+    async def acquire_reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield a pooled reader, or the writer while it holds a transaction"""
+        if not self._connection:
+            await self.connect()
+        pool = self._reader_pool
+        if pool is None or self._connection.in_transaction:
+            yield self._connection
+            return
+        
+        reader = await pool.get()
+        try:
+            yield reader
+        finally:
+            pool.put_nowait(reader)
+    
     async def execute(self, query: str, params: tuple = ()):
         """Execute a query"""
         if not self._connection:
@@ -55,16 +143,55 @@ class Database:
     
     async def fetch_one(self, query: str, params: tuple = ()):
         """Fetch one row"""
-        cursor = await self.execute(query, params)
-        row = await cursor.fetchone()
+        async with self.acquire_reader() as connection:
+            cursor = await connection.execute(query, params)
+            row = await cursor.fetchone()
+            await cursor.close()
         return dict(row) if row else None
     
     async def fetch_all(self, query: str, params: tuple = ()):
         """Fetch all rows"""
-        cursor = await self.execute(query, params)
-        rows = await cursor.fetchall()
+        async with self.acquire_reader() as connection:
+            cursor = await connection.execute(query, params)
+            rows = await cursor.fetchall()
+            await cursor.close()
         return [dict(row) for row in rows]
     
+    async def fetch_all_rows(self, query: str, params: tuple = ()) -> List[aiosqlite.Row]:
+        """Fetch all rows as Row objects, without copying each into a dict"""
+        async with self.acquire_reader() as connection:
+            cursor = await connection.execute(query, params)
+            rows = await cursor.fetchall()
+            await cursor.close()
+        return rows
+    
+    async def stream_rows(
+        self, query: str, params: tuple = (), chunk_size: int = 256
+    ) -> AsyncIterator[aiosqlite.Row]:
+        """Yield rows from a reader cursor, fetching chunk_size at a time.
+        
+        The reader is held until the iteration finishes, so consumers should
+        not await slow work between rows.
+        """
+        async with self.acquire_reader() as connection:
+            cursor = await connection.execute(query, params)
+            try:
+                while True:
+                    rows = await cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row
+            finally:
+                await cursor.close()
+    
+    async def begin_immediate(self):
+        """Start a transaction that takes the write lock up front"""
+        if not self._connection:
+            await self.connect()
+        if not self._connection.in_transaction:
+            await self._connection.execute("BEGIN IMMEDIATE")
+    
     async def commit(self):
         """Commit transaction"""
         if self._connection:
@@ -94,6 +221,10 @@ async def create_tables():
     for index_sql in INDEXES:
         await db.execute(index_sql)
     
+    # Create triggers
+    for trigger_sql in TRIGGERS:
+        await db.execute(trigger_sql)
+    
     await db.commit()
 
 
@@ -104,6 +235,7 @@ async def run_migrations():
 
 async def init_db():
     """Initialize database with schema"""
+    ensure_dirs()
     await db.connect()
     
     # Create tables
@@ -115,6 +247,10 @@ async def init_db():
     # Insert default preferences
     await initialize_default_preferences()
     
+    # Refresh planner statistics so the composite indexes get picked
+    await db.execute("ANALYZE conversations")
+    await db.commit()
+    
     print("Database initialized successfully")
 
 
@@ -139,41 +275,85 @@ async def initialize_default_preferences(db_instance=None):
         ("first_use_date", datetime.now().isoformat(), "string", "First use date of the application"),
     ]
     
-    for key, value, value_type, description in default_prefs:
-        # Check if preference already exists
-        existing = await db_instance.fetch_one(
-            "SELECT id FROM preferences WHERE key = ?", (key,)
-        )
-        if not existing:
-            await db_instance.execute(
-                """INSERT INTO preferences (key, value, value_type, description) 
-                   VALUES (?, ?, ?, ?)""",
-                (key, value, value_type, description)
-            )
+    # key is UNIQUE, so one batched INSERT OR IGNORE leaves existing values alone
+    await db_instance.execute_many(
+        """INSERT OR IGNORE INTO preferences (key, value, value_type, description) 
+           VALUES (?, ?, ?, ?)""",
+        default_prefs
+    )
     
     await db_instance.commit()
 
 
+class _ConnectionWrapper:
+    """Minimal Database-like wrapper around a raw aiosqlite connection"""
+    
+    def __init__(self, connection: aiosqlite.Connection):
+        self.connection = connection
+    
+    async def fetch_one(self, query, params=()):
+        cursor = await self.connection.execute(query, params)
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+    
+    async def execute(self, query, params=()):
+        return await self.connection.execute(query, params)
+    
+    async def execute_many(self, query, params):
+        return await self.connection.executemany(query, params)
+    
+    async def commit(self):
+        await self.connection.commit()
+
+
+# Connections to per-user database files, reused across calls so each one
+# doesn't pay for a new aiosqlite worker thread. Least recently used first.
+_PATH_CONNECTIONS: "OrderedDict[str, aiosqlite.Connection]" = OrderedDict()
+PATH_CONNECTION_CACHE_SIZE = 4
+
+# Held while a cached connection is in use, so an eviction never closes a
+# connection another caller is still working with
+_PATH_CONNECTIONS_LOCK = asyncio.Lock()
+
+
+async def _get_path_connection(db_path: str) -> aiosqlite.Connection:
+    """Get a cached connection to db_path, opening one if needed.
+    
+    Callers must hold _PATH_CONNECTIONS_LOCK until they are done with it.
+    """
+    connection = _PATH_CONNECTIONS.get(db_path)
+    if connection is not None:
+        _PATH_CONNECTIONS.move_to_end(db_path)
+        return connection
+    
+    connection = await aiosqlite.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
+    connection.row_factory = aiosqlite.Row
+    for pragma in CONNECTION_PRAGMAS:
+        await connection.execute(pragma)
+    
+    _PATH_CONNECTIONS[db_path] = connection
+    if len(_PATH_CONNECTIONS) > PATH_CONNECTION_CACHE_SIZE:
+        _, evicted = _PATH_CONNECTIONS.popitem(last=False)
+        await evicted.close()
+    return connection
+
+
+async def close_path_connections():
+    """Close all cached per-path connections"""
+    async with _PATH_CONNECTIONS_LOCK:
+        while _PATH_CONNECTIONS:
+            _, connection = _PATH_CONNECTIONS.popitem()
+            await connection.close()
+
+
 async def initialize_preferences_for_db(db_path: str):
     """Initialize default preferences for a specific database file"""
-    async with aiosqlite.connect(db_path) as temp_db:
-        temp_db.row_factory = aiosqlite.Row
-        
-        # Create a temporary database wrapper
-        class TempDB:
-            def __init__(self, connection):
-                self.connection = connection
-            
-            async def fetch_one(self, query, params=()):
-                cursor = await self.connection.execute(query, params)
-                row = await cursor.fetchone()
-                return dict(row) if row else None
-            
-            async def execute(self, query, params=()):
-                return await self.connection.execute(query, params)
-            
-            async def commit(self):
-                await self.connection.commit()
-        
-        temp_db_instance = TempDB(temp_db)
-        await initialize_default_preferences(temp_db_instance)
\ No newline at end of file
+    async with _PATH_CONNECTIONS_LOCK:
+        connection = await _get_path_connection(db_path)
+        try:
+            await initialize_default_preferences(_ConnectionWrapper(connection))
+        except Exception:
+            # Don't keep a connection in an unknown transaction state
+            _PATH_CONNECTIONS.pop(db_path, None)
+            await connection.close()
+            raise
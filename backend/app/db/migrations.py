@@ -1,10 +1,47 @@
 """Database migration system"""
+import sqlite3
 from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Awaitable, Callable, List, Set, Tuple, Union
 
+# app.db.database imports this module, so bind the module object rather than
+# its names; get_db is looked up at call time, once both modules are loaded
+from app.db import database as _database
+from app.models.entry import encode_embedding, decode_embedding
 
-# Migration format: (version, description, up_sql, down_sql)
-MIGRATIONS: List[Tuple[int, str, str, str]] = [
+# A data migration SQL can't express; receives the db and leaves committing
+# to apply_migration
+MigrationStep = Callable[[Any], Awaitable[None]]
+
+_REPACK_BATCH_SIZE = 200
+
+
+async def _repack_entry_embeddings(db):
+    """Rewrite entry embeddings still stored as JSON text as float32 BLOBs"""
+    last_id = 0
+    while True:
+        cursor = await db.execute(
+            "SELECT id, embeddings FROM entries "
+            "WHERE id > ? AND typeof(embeddings) = 'text' ORDER BY id LIMIT ?",
+            (last_id, _REPACK_BATCH_SIZE)
+        )
+        rows = await cursor.fetchall()
+        if not rows:
+            return
+        for entry_id, embeddings in rows:
+            try:
+                packed = encode_embedding(decode_embedding(embeddings))
+            except ValueError:
+                # Unparseable vectors are left for regeneration to replace
+                continue
+            await db.execute(
+                "UPDATE entries SET embeddings = ? WHERE id = ?", (packed, entry_id)
+            )
+        last_id = rows[-1][0]
+
+
+# Migration format: (version, description, up_sql, down_sql); up_sql may also
+# be a MigrationStep
+MIGRATIONS: List[Tuple[int, str, Union[str, MigrationStep], str]] = [
     (
         1,
         "Initial schema",
@@ -133,33 +170,136 @@ ALTER TABLE conversations DROP COLUMN memory_extracted;
 ALTER TABLE conversations DROP COLUMN memory_extracted_llm;
 ALTER TABLE conversations DROP COLUMN memory_extracted_at;"""
     ),
+    (
+        8,
+        "Add composite conversation type/timestamp index",
+        """CREATE INDEX IF NOT EXISTS idx_conversations_type_ts ON conversations(conversation_type, timestamp DESC);""",
+        """DROP INDEX IF EXISTS idx_conversations_type_ts;"""
+    ),
+    (
+        9,
+        "Add composite draft recency index",
+        """CREATE INDEX IF NOT EXISTS idx_drafts_updated_created ON drafts(updated_at DESC, created_at DESC);""",
+        """DROP INDEX IF EXISTS idx_drafts_updated_created;"""
+    ),
+    (
+        10,
+        "Move the latest draft into the autosave singleton row",
+        """DELETE FROM drafts WHERE id NOT IN (SELECT id FROM drafts ORDER BY updated_at DESC, created_at DESC LIMIT 1);
+UPDATE drafts SET id = 1;""",
+        """-- Rollback not needed: older code reads any draft id"""
+    ),
+    (
+        11,
+        "Add partial indexes for entries with and without embeddings",
+        """CREATE INDEX IF NOT EXISTS idx_entries_has_embedding_ts ON entries(timestamp DESC) WHERE embeddings IS NOT NULL AND embeddings != '[]' AND embeddings != '';
+CREATE INDEX IF NOT EXISTS idx_entries_no_embedding_ts ON entries(timestamp DESC) WHERE embeddings IS NULL OR embeddings = '[]' OR embeddings = '';""",
+        """DROP INDEX IF EXISTS idx_entries_has_embedding_ts;
+DROP INDEX IF EXISTS idx_entries_no_embedding_ts;"""
+    ),
+    (
+        12,
+        "Add FTS5 index over entry text",
+        """CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(raw_text, enhanced_text, structured_summary, content='entries', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS entries_fts_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, raw_text, enhanced_text, structured_summary) VALUES (new.id, new.raw_text, new.enhanced_text, new.structured_summary);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_fts_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, raw_text, enhanced_text, structured_summary) VALUES ('delete', old.id, old.raw_text, old.enhanced_text, old.structured_summary);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_fts_au AFTER UPDATE OF raw_text, enhanced_text, structured_summary ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, raw_text, enhanced_text, structured_summary) VALUES ('delete', old.id, old.raw_text, old.enhanced_text, old.structured_summary);
+    INSERT INTO entries_fts(rowid, raw_text, enhanced_text, structured_summary) VALUES (new.id, new.raw_text, new.enhanced_text, new.structured_summary);
+END;
+INSERT INTO entries_fts(entries_fts) VALUES ('rebuild');""",
+        """DROP TRIGGER IF EXISTS entries_fts_ai;
+DROP TRIGGER IF EXISTS entries_fts_ad;
+DROP TRIGGER IF EXISTS entries_fts_au;
+DROP TABLE IF EXISTS entries_fts;"""
+    ),
+    (
+        13,
+        "Replace single-column mode and pattern type indexes with composites",
+        """CREATE INDEX IF NOT EXISTS idx_entries_mode_ts ON entries(mode, timestamp DESC);
+DROP INDEX IF EXISTS idx_entries_mode;
+CREATE INDEX IF NOT EXISTS idx_patterns_type_confidence ON patterns(pattern_type, confidence DESC, frequency DESC);
+DROP INDEX IF EXISTS idx_patterns_type;""",
+        """CREATE INDEX IF NOT EXISTS idx_entries_mode ON entries(mode);
+DROP INDEX IF EXISTS idx_entries_mode_ts;
+CREATE INDEX IF NOT EXISTS idx_patterns_type ON patterns(pattern_type);
+DROP INDEX IF EXISTS idx_patterns_type_confidence;"""
+    ),
+    (
+        14,
+        "Drop idx_preferences_key, which duplicates the UNIQUE key index",
+        """DROP INDEX IF EXISTS idx_preferences_key;""",
+        """CREATE INDEX IF NOT EXISTS idx_preferences_key ON preferences(key);"""
+    ),
+    (
+        15,
+        "Repack JSON text entry embeddings as float32 BLOBs",
+        _repack_entry_embeddings,
+        """-- Rollback not needed: decode_embedding reads both formats"""
+    ),
 ]
 
 
+_SCHEMA_VERSION_EXISTS_SQL = (
+    "SELECT COUNT(*) AS count FROM sqlite_master "
+    "WHERE type = 'table' AND name = 'schema_version'"
+)
+
+
+async def _has_schema_version_table(db) -> bool:
+    """Check for the schema_version table without provoking an error"""
+    result = await db.fetch_one(_SCHEMA_VERSION_EXISTS_SQL)
+    return bool(result and result["count"])
+
+
 async def get_current_version(db=None) -> int:
     """Get current schema version"""
     if db is None:
-        from app.db.database import get_db
-        db = get_db()
-    try:
-        result = await db.fetch_one(
-            "SELECT MAX(version) as version FROM schema_version"
-        )
-        return result["version"] if result and result["version"] else 0
-    except:
-        # Table doesn't exist yet
+        db = _database.get_db()
+    if not await _has_schema_version_table(db):
         return 0
+    result = await db.fetch_one(
+        "SELECT MAX(version) as version FROM schema_version"
+    )
+    return result["version"] if result and result["version"] else 0
+
 
+async def get_applied_versions(db) -> Set[int]:
+    """Get the set of applied migration versions in one query"""
+    if not await _has_schema_version_table(db):
+        return set()
+    cursor = await db.execute("SELECT version FROM schema_version")
+    rows = await cursor.fetchall()
+    return {row[0] for row in rows}
 
-async def apply_migration(db, version: int, description: str, up_sql: str):
+
+def _split_statements(sql: str) -> List[str]:
+    """Split a migration script into statements, keeping trigger bodies whole"""
+    statements = []
+    pending = ""
+    for piece in sql.split(';'):
+        pending += piece + ';'
+        if sqlite3.complete_statement(pending):
+            statement = pending.strip().rstrip(';').strip()
+            if statement:
+                statements.append(statement)
+            pending = ""
+    if pending.strip(' ;\n'):
+        statements.append(pending.strip().rstrip(';').strip())
+    return statements
+
+
+async def apply_migration(db, version: int, description: str, up_sql: Union[str, MigrationStep]):
     """Apply a single migration"""
-    if db is None:
-        from app.db.database import get_db
-        db = get_db()
-    if up_sql.strip() and not up_sql.strip().startswith("--"):
-        # Split multiple statements by semicolon and execute each one
-        statements = [stmt.strip() for stmt in up_sql.split(';') if stmt.strip()]
-        for statement in statements:
+    if callable(up_sql):
+        await up_sql(db)
+    elif up_sql.strip() and not up_sql.strip().startswith("--"):
+        # Split multiple statements and execute each one
+        for statement in _split_statements(up_sql):
             # Skip comment-only statements
             if statement.startswith('--') or not statement:
                 continue
@@ -192,21 +332,16 @@ async def apply_migration(db, version: int, description: str, up_sql: str):
 async def run_migrations(db=None):
     """Run all pending migrations"""
     if db is None:
-        from app.db.database import get_db
-        db = get_db()
-    current_version = await get_current_version(db)
-    print(f"Current database version: {current_version}")
+        db = _database.get_db()
+    applied = await get_applied_versions(db)
+    current_version = max(applied, default=0)
     
-    for version, description, up_sql, _ in MIGRATIONS:
-        print(f"Checking migration {version}: {description}")
-        if version > current_version:
-            print(f"Applying migration {version}: {description}")
-            await apply_migration(db, version, description, up_sql)
-        else:
-            print(f"Skipping migration {version} (already applied)")
+    pending = [migration for migration in MIGRATIONS if migration[0] not in applied]
+    for version, description, up_sql, _ in pending:
+        await apply_migration(db, version, description, up_sql)
     
-    final_version = await get_current_version(db)
-    if final_version > current_version:
+    if pending:
+        final_version = max(current_version, pending[-1][0])
         print(f"Database migrated from version {current_version} to {final_version}")
     else:
-        print(f"Database is up to date at version {final_version}")
\ No newline at end of file
+        print(f"Database is up to date at version {current_version}")
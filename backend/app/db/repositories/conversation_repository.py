@@ -1,10 +1,30 @@
+import json
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 from app.db.database import get_db
+from app.db.statements import build_insert_update_sql
 from app.models.conversation import Conversation
 
 
+_INSERT_COLUMNS = Conversation.INSERT_COLUMNS
+_INSERT_SQL, _ = build_insert_update_sql("conversations", _INSERT_COLUMNS)
+
+# update_conversation_metadata statements, keyed by a bitmask of the fields
+# being set: 1 = embedding, 2 = summary, 4 = key_topics
+_METADATA_COLUMNS = ("embedding", "summary", "key_topics")
+_UPDATE_METADATA_SQL = {
+    mask: "UPDATE conversations SET {}, updated_at = ? WHERE id = ?".format(
+        ", ".join(
+            f"{column} = ?"
+            for bit, column in enumerate(_METADATA_COLUMNS)
+            if mask & (1 << bit)
+        )
+    )
+    for mask in range(1, 1 << len(_METADATA_COLUMNS))
+}
+
+
 class ConversationRepository:
     """Repository for conversation database operations"""
     
@@ -12,17 +32,7 @@ class ConversationRepository:
     async def create(conversation: Conversation) -> Conversation:
         """Create a new conversation"""
         db = get_db()
-        data = conversation.to_dict()
-        del data["id"]  # Remove id for insert
-        
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?" for _ in data])
-        values = list(data.values())
-        
-        cursor = await db.execute(
-            f"INSERT INTO conversations ({columns}) VALUES ({placeholders})",
-            tuple(values)
-        )
+        cursor = await db.execute(_INSERT_SQL, conversation.to_insert_tuple())
         await db.commit()
         
         conversation.id = cursor.lastrowid
@@ -41,29 +51,37 @@ class ConversationRepository:
     async def get_all(
         limit: int = 50, 
         offset: int = 0,
-        conversation_type: Optional[str] = None
+        conversation_type: Optional[str] = None,
+        before_timestamp: Optional[str] = None
     ) -> List[Conversation]:
-        """Get all conversations with pagination and filtering"""
+        """Get all conversations with pagination and filtering.
+        
+        Pass the timestamp of the last conversation on the previous page as
+        before_timestamp to page by key instead of scanning past offset rows.
+        """
         db = get_db()
         query = "SELECT * FROM conversations"
+        conditions = []
         params = []
         
         if conversation_type:
-            query += " WHERE conversation_type = ?"
+            conditions.append("conversation_type = ?")
             params.append(conversation_type)
         
+        if before_timestamp:
+            conditions.append("timestamp < ?")
+            params.append(before_timestamp)
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
         query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
-        rows = await db.fetch_all(query, tuple(params))
-        conversations = []
-        for row in rows:
-            # Handle None values in search_queries_used
-            row_dict = dict(row)
-            if row_dict.get('search_queries_used') is None:
-                row_dict['search_queries_used'] = '[]'
-            conversations.append(Conversation.from_dict(row_dict))
-        return conversations
+        # from_row reads each Row in place and maps a NULL
+        # search_queries_used to an empty list itself
+        rows = await db.fetch_all_rows(query, tuple(params))
+        return [Conversation.from_row(row) for row in rows]
     
     @staticmethod
     async def update(
@@ -91,9 +109,9 @@ class ConversationRepository:
             params.append(message_count)
         
         if search_queries_used is not None:
-            import json
             updates.append("search_queries_used = ?")
-            params.append(json.dumps(search_queries_used))
+            # An empty list is stored as NULL, as Conversation.to_insert_tuple does
+            params.append(json.dumps(search_queries_used) if search_queries_used else None)
         
         if updates:
             updates.append("updated_at = ?")
@@ -117,38 +135,28 @@ class ConversationRepository:
         key_topics: List[str] = None
     ) -> bool:
         """Update conversation metadata for memory system - only updates non-None values"""
-        db = get_db()
-        import json
+        mask = (
+            (embedding is not None)
+            | (summary is not None) << 1
+            | (key_topics is not None) << 2
+        )
+        if not mask:
+            return True  # Nothing to update
         
-        # Build dynamic query to only update provided fields
-        set_clauses = []
         params = []
-        
         if embedding is not None:
-            set_clauses.append("embedding = ?")
             params.append(embedding)
-            
         if summary is not None:
-            set_clauses.append("summary = ?")
             params.append(summary)
-            
         if key_topics is not None:
-            set_clauses.append("key_topics = ?")
-            params.append(json.dumps(key_topics))
+            params.append(json.dumps(key_topics) if key_topics else None)
         
-        if not set_clauses:
-            return True  # Nothing to update
-            
         # Always update timestamp
-        set_clauses.append("updated_at = ?")
         params.append(datetime.now().isoformat())
         params.append(conversation_id)
         
-        query = f"""UPDATE conversations 
-                   SET {', '.join(set_clauses)}
-                   WHERE id = ?"""
-        
-        await db.execute(query, params)
+        db = get_db()
+        await db.execute(_UPDATE_METADATA_SQL[mask], tuple(params))
         await db.commit()
         return True
     
@@ -157,6 +165,10 @@ class ConversationRepository:
         """Delete a conversation and related memories"""
         db = get_db()
         try:
+            # Take the write lock before the first DELETE so the transaction
+            # never has to upgrade from a read lock mid-way
+            await db.begin_immediate()
+            
             # First delete related agent_memories to avoid foreign key constraint violation
             await db.execute(
                 "DELETE FROM agent_memories WHERE source_conversation_id = ?", 
@@ -196,32 +208,26 @@ class ConversationRepository:
     async def get_statistics() -> Dict[str, Any]:
         """Get comprehensive conversation statistics"""
         db = get_db()
-        # Basic counts
-        total_conversations = await ConversationRepository.count()
-        call_conversations = await ConversationRepository.count_by_type("call")
-        chat_conversations = await ConversationRepository.count_by_type("chat")
-        
-        # Duration and message statistics
-        duration_stats = await db.fetch_one(
-            "SELECT SUM(duration) as total_duration, AVG(duration) as avg_duration FROM conversations"
-        )
-        
-        message_stats = await db.fetch_one(
-            "SELECT SUM(message_count) as total_messages, AVG(message_count) as avg_messages FROM conversations"
-        )
-        
-        # Most recent conversation
-        recent_conversation = await db.fetch_one(
-            "SELECT timestamp FROM conversations ORDER BY timestamp DESC LIMIT 1"
+        # One pass over the table for every aggregate
+        stats = await db.fetch_one(
+            """SELECT COUNT(*) AS total_conversations,
+                      COALESCE(SUM(conversation_type = 'call'), 0) AS call_conversations,
+                      COALESCE(SUM(conversation_type = 'chat'), 0) AS chat_conversations,
+                      SUM(duration) AS total_duration,
+                      AVG(duration) AS avg_duration,
+                      SUM(message_count) AS total_messages,
+                      AVG(message_count) AS avg_messages,
+                      MAX(timestamp) AS most_recent
+               FROM conversations"""
         )
         
         return {
-            "total_conversations": total_conversations,
-            "call_conversations": call_conversations,
-            "chat_conversations": chat_conversations,
-            "total_duration": duration_stats["total_duration"] or 0,
-            "average_duration": float(duration_stats["avg_duration"] or 0),
-            "total_messages": message_stats["total_messages"] or 0,
-            "average_messages": float(message_stats["avg_messages"] or 0),
-            "most_recent": recent_conversation["timestamp"] if recent_conversation else None
+            "total_conversations": stats["total_conversations"],
+            "call_conversations": stats["call_conversations"],
+            "chat_conversations": stats["chat_conversations"],
+            "total_duration": stats["total_duration"] or 0,
+            "average_duration": float(stats["avg_duration"] or 0),
+            "total_messages": stats["total_messages"] or 0,
+            "average_messages": float(stats["avg_messages"] or 0),
+            "most_recent": stats["most_recent"]
         }
\ No newline at end of file
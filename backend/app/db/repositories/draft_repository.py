@@ -1,10 +1,37 @@
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from app.db.database import get_db
+from app.db.statements import build_insert_update_sql
 from app.models.draft import Draft
 
 
+_INSERT_COLUMNS = Draft.INSERT_COLUMNS
+_INSERT_SQL, _UPDATE_SQL = build_insert_update_sql("drafts", _INSERT_COLUMNS)
+
+
+# Autosave keeps a single draft in the row with this id. A fresh row gets
+# updated_at NULL (so callers can tell a create from an update); later saves
+# set it to the save time carried in excluded.created_at.
+SINGLETON_DRAFT_ID = 1
+
+_UPSERT_DRAFT_SQL = """INSERT INTO drafts (id, content, metadata, created_at, updated_at)
+    VALUES (?, ?, ?, ?, NULL)
+    ON CONFLICT(id) DO UPDATE SET
+        content = excluded.content,
+        metadata = excluded.metadata,
+        updated_at = excluded.created_at
+    RETURNING *"""
+
+# Same, but leaves the stored metadata alone when none was supplied
+_UPSERT_DRAFT_KEEP_METADATA_SQL = """INSERT INTO drafts (id, content, metadata, created_at, updated_at)
+    VALUES (?, ?, ?, ?, NULL)
+    ON CONFLICT(id) DO UPDATE SET
+        content = excluded.content,
+        updated_at = excluded.created_at
+    RETURNING *"""
+
+
 class DraftRepository:
     """Repository for draft database operations"""
     
@@ -12,16 +39,11 @@ class DraftRepository:
     async def create(draft: Draft) -> Draft:
         """Create a new draft"""
         db = get_db()
-        data = draft.to_dict()
-        del data["id"]
-        
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?" for _ in data])
-        values = list(data.values())
+        values = draft.to_insert_tuple()
         
         cursor = await db.execute(
-            f"INSERT INTO drafts ({columns}) VALUES ({placeholders})",
-            tuple(values)
+            _INSERT_SQL,
+            values
         )
         await db.commit()
         
@@ -53,16 +75,11 @@ class DraftRepository:
         """Update an existing draft"""
         db = get_db()
         draft.updated_at = datetime.now()
-        data = draft.to_dict()
-        draft_id = data.pop("id")
-        
-        set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
-        values = list(data.values())
-        values.append(draft_id)
+        values = draft.to_insert_tuple() + (draft.id,)
         
         await db.execute(
-            f"UPDATE drafts SET {set_clause} WHERE id = ?",
-            tuple(values)
+            _UPDATE_SQL,
+            values
         )
         await db.commit()
         
@@ -71,63 +88,50 @@ class DraftRepository:
     @staticmethod
     async def save_or_update(content: str, metadata: Optional[dict] = None) -> Draft:
         """Save draft content, always updating the latest draft (one draft at a time)"""
-        # Clean up - ensure only one draft exists
-        await DraftRepository.cleanup_old_drafts_keep_one()
-        
-        latest = await DraftRepository.get_latest()
+        db = get_db()
+        draft = Draft(id=SINGLETON_DRAFT_ID, content=content, metadata=metadata)
+        data = draft.to_dict()
         
-        # If there's any existing draft, update it
-        if latest:
-            latest.content = content
-            # Always update metadata - new metadata takes precedence
-            if metadata is not None:
-                latest.metadata = metadata
-            return await DraftRepository.update(latest)
+        cursor = await db.execute(
+            _UPSERT_DRAFT_SQL if metadata is not None else _UPSERT_DRAFT_KEEP_METADATA_SQL,
+            (SINGLETON_DRAFT_ID, data["content"], data["metadata"], data["created_at"])
+        )
+        row = await cursor.fetchone()
+        await db.commit()
         
-        # Otherwise create a new draft (first time)
-        draft = Draft(content=content, metadata=metadata)
-        return await DraftRepository.create(draft)
+        return Draft.from_dict(dict(row))
     
     @staticmethod
     async def cleanup_old_drafts_keep_one() -> int:
         """Keep only the most recent draft, delete all others"""
         db = get_db()
-        # Get all drafts ordered by most recent first
-        rows = await db.fetch_all(
-            """SELECT id FROM drafts 
-               ORDER BY updated_at DESC, created_at DESC"""
+        # One statement; the inner ORDER BY ... LIMIT 1 is served by
+        # idx_drafts_updated_created
+        cursor = await db.execute(
+            """DELETE FROM drafts WHERE id NOT IN (
+                   SELECT id FROM drafts
+                   ORDER BY updated_at DESC, created_at DESC
+                   LIMIT 1
+               )"""
         )
-        
-        if len(rows) <= 1:
-            return 0  # Nothing to clean up
-        
-        # Keep the first (most recent), delete the rest
-        draft_ids_to_delete = [row["id"] for row in rows[1:]]
-        
-        deleted_count = 0
-        for draft_id in draft_ids_to_delete:
-            await db.execute("DELETE FROM drafts WHERE id = ?", (draft_id,))
-            deleted_count += 1
-        
         await db.commit()
-        return deleted_count
+        return cursor.rowcount
     
     @staticmethod
     async def delete(draft_id: int) -> bool:
-        """Delete a draft"""
+        """Delete a draft. Returns False if no such draft existed."""
         db = get_db()
-        await db.execute("DELETE FROM drafts WHERE id = ?", (draft_id,))
+        cursor = await db.execute("DELETE FROM drafts WHERE id = ?", (draft_id,))
         await db.commit()
-        return True
+        return cursor.rowcount > 0
     
     @staticmethod
     async def delete_old_drafts(days: int = 7) -> int:
         """Delete drafts older than specified days"""
         db = get_db()
-        cutoff_date = datetime.now()
-        cutoff_date = cutoff_date.replace(
-            day=cutoff_date.day - days if cutoff_date.day > days else 1
-        )
+        # created_at is stored as local-time isoformat, so the cutoff is built
+        # the same way rather than with SQLite's UTC datetime('now')
+        cutoff_date = datetime.now() - timedelta(days=days)
         
         cursor = await db.execute(
             "DELETE FROM drafts WHERE created_at < ?",
@@ -1,8 +1,36 @@
-from typing import List, Optional, Dict, Any
+import logging
+import re
+import sqlite3
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 from app.db.database import get_db
-from app.models.entry import Entry
+from app.db.statements import build_insert_update_sql
+from app.models.entry import Entry, encode_embedding
+
+logger = logging.getLogger(__name__)
+
+
+_INSERT_COLUMNS = Entry.INSERT_COLUMNS
+_INSERT_SQL, _UPDATE_SQL = build_insert_update_sql("entries", _INSERT_COLUMNS)
+
+
+# Embedding presence predicates. These must match the WHERE clauses of the
+# partial indexes idx_entries_has_embedding_ts / idx_entries_no_embedding_ts
+# in schema.py word for word, or SQLite will not use those indexes.
+_HAS_EMBEDDING = "embeddings IS NOT NULL AND embeddings != '[]' AND embeddings != ''"
+_NO_EMBEDDING = "(embeddings IS NULL OR embeddings = '[]' OR embeddings = '')"
+
+# Word tokens of a search query, as the FTS5 unicode61 tokenizer sees them
+_FTS_TERM = re.compile(r"\w+")
+
+# Everything except the embedding vector and processing metadata, for the
+# timestamp-ordered queries whose callers never read those large columns.
+# Entry.from_dict leaves the skipped fields at their defaults.
+_LIGHT_COLUMNS = ", ".join(
+    column for column in ("id",) + _INSERT_COLUMNS
+    if column not in ("embeddings", "processing_metadata")
+)
 
 
 class EntryRepository:
@@ -11,17 +39,12 @@ class EntryRepository:
     @staticmethod
     async def create(entry: Entry) -> Entry:
         """Create a new entry"""
-        data = entry.to_dict()
-        del data["id"]  # Remove id for insert
-        
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?" for _ in data])
-        values = list(data.values())
+        values = entry.to_insert_tuple()
         
         db = get_db()
         cursor = await db.execute(
-            f"INSERT INTO entries ({columns}) VALUES ({placeholders})",
-            tuple(values)
+            _INSERT_SQL,
+            values
         )
         await db.commit()
         
@@ -62,16 +85,11 @@ class EntryRepository:
     async def update(entry: Entry) -> Entry:
         """Update an existing entry"""
         db = get_db()
-        data = entry.to_dict()
-        entry_id = data.pop("id")
-        
-        set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
-        values = list(data.values())
-        values.append(entry_id)
+        values = entry.to_insert_tuple() + (entry.id,)
         
         await db.execute(
-            f"UPDATE entries SET {set_clause} WHERE id = ?",
-            tuple(values)
+            _UPDATE_SQL,
+            values
         )
         await db.commit()
         
@@ -106,15 +124,14 @@ class EntryRepository:
         return result["count"] if result else 0
     
     @staticmethod
-    async def get_all_for_streak() -> List[Entry]:
-        """Get all entries for streak calculation (no pagination limit)"""
+    async def get_all_for_streak() -> AsyncIterator[Entry]:
+        """Stream all entries, newest first, for streak calculation"""
         db = get_db()
-        rows = await db.fetch_all(
-            "SELECT * FROM entries ORDER BY timestamp DESC"
+        rows = db.stream_rows(
+            f"SELECT {_LIGHT_COLUMNS} FROM entries ORDER BY timestamp DESC"
         )
         # Handle new memory columns gracefully
-        entries = []
-        for row in rows:
+        async for row in rows:
             try:
                 # Convert row to dict and ensure all fields exist
                 row_dict = dict(row)
@@ -127,11 +144,10 @@ class EntryRepository:
                     row_dict['memory_extracted_at'] = None
                     
                 entry = Entry.from_dict(row_dict)
-                entries.append(entry)
             except Exception as e:
                 # Skip problematic entries but log them
                 continue
-        return entries
+            yield entry
     
     @staticmethod
     async def search(
@@ -139,8 +155,27 @@ class EntryRepository:
         limit: int = 50
     ) -> List[Entry]:
         """Search entries by text content"""
-        search_query = f"%{query}%"
         db = get_db()
+        
+        # Match the query as a phrase whose last word may be a prefix, through
+        # the entries_fts index
+        terms = _FTS_TERM.findall(query)
+        if terms:
+            try:
+                rows = await db.fetch_all(
+                    """SELECT * FROM entries
+                       WHERE id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)
+                       ORDER BY timestamp DESC
+                       LIMIT ?""",
+                    (f'"{" ".join(terms)}"*', limit)
+                )
+                if rows:
+                    return [Entry.from_dict(row) for row in rows]
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Full-text search unavailable, using LIKE: {e}")
+        
+        # Substring fallback for matches inside words, or without the FTS table
+        search_query = f"%{query}%"
         rows = await db.fetch_all(
             """SELECT * FROM entries 
                WHERE raw_text LIKE ? 
@@ -160,7 +195,7 @@ class EntryRepository:
         """Get entries within a date range"""
         db = get_db()
         rows = await db.fetch_all(
-            """SELECT * FROM entries 
+            f"""SELECT {_LIGHT_COLUMNS} FROM entries
                WHERE timestamp BETWEEN ? AND ?
                ORDER BY timestamp DESC""",
             (start_date.isoformat(), end_date.isoformat())
@@ -179,9 +214,10 @@ class EntryRepository:
     async def get_entries_without_embeddings(limit: int = 100) -> List[Entry]:
         """Get entries that don't have embeddings yet"""
         db = get_db()
+        # Walks idx_entries_no_embedding_ts newest first and stops at LIMIT
         rows = await db.fetch_all(
-            """SELECT * FROM entries 
-               WHERE embeddings IS NULL OR embeddings = '[]' OR embeddings = ''
+            f"""SELECT {_LIGHT_COLUMNS} FROM entries 
+               WHERE {_NO_EMBEDDING}
                ORDER BY timestamp DESC
                LIMIT ?""",
             (limit,)
@@ -198,8 +234,7 @@ class EntryRepository:
     ) -> List[Entry]:
         """Get entries that have embeddings for similarity search with optional filtering"""
         # Base query
-        query = """SELECT * FROM entries 
-                   WHERE embeddings IS NOT NULL AND embeddings != '[]' AND embeddings != ''"""
+        query = f"SELECT * FROM entries WHERE {_HAS_EMBEDDING}"
         params = []
         
         # Add date filtering if specified
@@ -213,14 +248,15 @@ class EntryRepository:
         
         # Add mood tag filtering if specified
         if mood_tags:
-            # Use JSON_EXTRACT or LIKE for mood tag filtering (SQLite JSON support)
-            mood_conditions = []
-            for mood_tag in mood_tags:
-                mood_conditions.append("mood_tags LIKE ?")
-                params.append(f'%"{mood_tag}"%')
-            
-            if mood_conditions:
-                query += f" AND ({' OR '.join(mood_conditions)})"
+            # Probe the stored JSON array once per row with JSON1 instead of an
+            # OR-chain of LIKE scans. Non-JSON values are treated as no tags.
+            placeholders = ",".join("?" * len(mood_tags))
+            query += (
+                " AND EXISTS (SELECT 1 FROM json_each("
+                "CASE WHEN json_valid(entries.mood_tags) THEN entries.mood_tags END"
+                f") WHERE json_each.value IN ({placeholders}))"
+            )
+            params.extend(mood_tags)
         
         # Add ordering
         query += " ORDER BY timestamp DESC"
@@ -237,13 +273,10 @@ class EntryRepository:
     @staticmethod
     async def update_embedding(entry_id: int, embeddings: List[float]) -> bool:
         """Update only the embeddings field for an entry"""
-        import json
-        embeddings_json = json.dumps(embeddings)
-        
         db = get_db()
         await db.execute(
             "UPDATE entries SET embeddings = ? WHERE id = ?",
-            (embeddings_json, entry_id)
+            (encode_embedding(embeddings), entry_id)
         )
         await db.commit()
         return True
@@ -253,18 +286,25 @@ class EntryRepository:
         """Count entries that have embeddings"""
         db = get_db()
         result = await db.fetch_one(
-            """SELECT COUNT(*) as count FROM entries 
-               WHERE embeddings IS NOT NULL AND embeddings != '[]' AND embeddings != '' AND LENGTH(embeddings) > 2"""
+            f"SELECT COUNT(*) as count FROM entries WHERE {_HAS_EMBEDDING}"
         )
         return result["count"] if result else 0
     
+    @staticmethod
+    async def has_entries_with_embeddings() -> bool:
+        """Check whether any entry has embeddings, stopping at the first one"""
+        db = get_db()
+        row = await db.fetch_one(
+            f"SELECT 1 FROM entries WHERE {_HAS_EMBEDDING} LIMIT 1"
+        )
+        return row is not None
+    
     @staticmethod
     async def count_entries_without_embeddings() -> int:
         """Count entries that don't have embeddings"""
         db = get_db()
         result = await db.fetch_one(
-            """SELECT COUNT(*) as count FROM entries 
-               WHERE embeddings IS NULL OR embeddings = '[]' OR embeddings = ''"""
+            f"SELECT COUNT(*) as count FROM entries WHERE {_NO_EMBEDDING}"
         )
         return result["count"] if result else 0
     
@@ -273,8 +313,8 @@ class EntryRepository:
         """Get entries before a specific timestamp"""
         db = get_db()
         rows = await db.fetch_all(
-            "SELECT * FROM entries WHERE timestamp < ? ORDER BY timestamp DESC LIMIT ?",
-            (timestamp, limit)
+            f"SELECT {_LIGHT_COLUMNS} FROM entries WHERE timestamp < ? ORDER BY timestamp DESC LIMIT ?",
+            (timestamp.isoformat(), limit)
         )
         return [Entry.from_dict(row) for row in rows]
     
@@ -283,60 +323,91 @@ class EntryRepository:
         """Get entries after a specific timestamp"""
         db = get_db()
         rows = await db.fetch_all(
-            "SELECT * FROM entries WHERE timestamp > ? ORDER BY timestamp ASC LIMIT ?",
-            (timestamp, limit)
+            f"SELECT {_LIGHT_COLUMNS} FROM entries WHERE timestamp > ? ORDER BY timestamp ASC LIMIT ?",
+            (timestamp.isoformat(), limit)
         )
         return [Entry.from_dict(row) for row in rows]
     
+    @staticmethod
+    async def bulk_update_embeddings(pairs: List[Tuple[int, List[float]]]) -> int:
+        """Update the embeddings of many entries in a single transaction"""
+        rows = [(encode_embedding(embeddings), entry_id) for entry_id, embeddings in pairs]
+        if not rows:
+            return 0
+        
+        db = get_db()
+        try:
+            await db.begin_immediate()
+            await db.execute_many(
+                "UPDATE entries SET embeddings = ? WHERE id = ?", rows
+            )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            raise e
+        return len(rows)
+    
     @staticmethod
     async def clear_all_embeddings() -> int:
         """Clear all embeddings from all entries. Returns count of affected rows."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # First, count how many entries have embeddings
-        before_count = await EntryRepository.count_entries_with_embeddings()
-        logger.info(f"Before clearing: {before_count} entries have embeddings")
-        
-        if before_count == 0:
+        if not await EntryRepository.has_entries_with_embeddings():
             logger.warning("No entries have embeddings to clear!")
             return 0
         
-        # Clear all embeddings - try multiple approaches
+        # Clear all embeddings in one statement; IS NOT NULL also covers the
+        # empty '[]' and '' placeholders
         db = get_db()
         try:
-            # Method 1: Update with NULL
-            await db.execute(
+            await db.begin_immediate()
+            cursor = await db.execute(
                 "UPDATE entries SET embeddings = NULL WHERE embeddings IS NOT NULL"
             )
             await db.commit()
             
-            # Method 2: Also clear empty arrays and empty strings
-            await db.execute(
-                "UPDATE entries SET embeddings = NULL WHERE embeddings = '[]' OR embeddings = ''"
-            )
-            await db.commit()
-            
         except Exception as e:
             logger.error(f"Error clearing embeddings: {e}")
+            await db.rollback()
             # Try direct approach
-            await db.execute("UPDATE entries SET embeddings = NULL")
+            cursor = await db.execute("UPDATE entries SET embeddings = NULL")
             await db.commit()
         
         # Verify they were cleared
-        after_count = await EntryRepository.count_entries_with_embeddings()
-        logger.info(f"After clearing: {after_count} entries have embeddings")
+        if await EntryRepository.has_entries_with_embeddings():
+            logger.warning("Some entries still have embeddings after clearing")
         
-        return before_count  # Return how many were cleared
+        return cursor.rowcount
     
     @staticmethod
     async def get_all_entries_for_embedding_generation() -> List[Entry]:
         """Get all entries for embedding generation (no pagination)"""
+        return [
+            entry
+            async for batch in EntryRepository.iter_entries_for_embedding_generation()
+            for entry in batch
+        ]
+    
+    @staticmethod
+    async def iter_entries_for_embedding_generation(
+        batch_size: int = 100
+    ) -> AsyncIterator[List[Entry]]:
+        """Yield all entries in id order, batch_size at a time.
+        
+        Each batch is a separate keyset query, so no read snapshot is held
+        while the caller generates and writes embeddings between batches.
+        """
         db = get_db()
-        rows = await db.fetch_all(
-            """SELECT id, raw_text, enhanced_text, structured_summary, mode, 
-                      embeddings, timestamp, mood_tags, word_count, processing_metadata
-               FROM entries 
-               ORDER BY id ASC"""
-        )
-        return [Entry.from_dict(row) for row in rows]
\ No newline at end of file
+        last_id = 0
+        while True:
+            rows = await db.fetch_all(
+                """SELECT id, raw_text, enhanced_text, structured_summary, mode, 
+                          embeddings, timestamp, mood_tags, word_count, processing_metadata
+                   FROM entries 
+                   WHERE id > ?
+                   ORDER BY id ASC
+                   LIMIT ?""",
+                (last_id, batch_size)
+            )
+            if not rows:
+                return
+            yield [Entry.from_dict(row) for row in rows]
+            last_id = rows[-1]["id"]
\ No newline at end of file
@@ -2,9 +2,14 @@ from typing import List, Optional
 from datetime import date
 
 from app.db.database import get_db
+from app.db.statements import build_insert_update_sql
 from app.models.pattern import Pattern
 
 
+_INSERT_COLUMNS = Pattern.INSERT_COLUMNS
+_INSERT_SQL, _UPDATE_SQL = build_insert_update_sql("patterns", _INSERT_COLUMNS)
+
+
 class PatternRepository:
     """Repository for pattern database operations"""
     
@@ -12,16 +17,11 @@ class PatternRepository:
     async def create(pattern: Pattern) -> Pattern:
         db = get_db()
         """Create a new pattern"""
-        data = pattern.to_dict()
-        del data["id"]
-        
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?" for _ in data])
-        values = list(data.values())
+        values = pattern.to_insert_tuple()
         
         cursor = await db.execute(
-            f"INSERT INTO patterns ({columns}) VALUES ({placeholders})",
-            tuple(values)
+            _INSERT_SQL,
+            values
         )
         await db.commit()
         
@@ -60,16 +60,11 @@ class PatternRepository:
     async def update(pattern: Pattern) -> Pattern:
         """Update an existing pattern"""
         db = get_db()
-        data = pattern.to_dict()
-        pattern_id = data.pop("id")
-        
-        set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
-        values = list(data.values())
-        values.append(pattern_id)
+        values = pattern.to_insert_tuple() + (pattern.id,)
         
         await db.execute(
-            f"UPDATE patterns SET {set_clause} WHERE id = ?",
-            tuple(values)
+            _UPDATE_SQL,
+            values
         )
         await db.commit()
         
@@ -77,11 +72,11 @@ class PatternRepository:
     
     @staticmethod
     async def delete(pattern_id: int) -> bool:
-        """Delete a pattern"""
+        """Delete a pattern. Returns False if no such pattern existed."""
         db = get_db()
-        await db.execute("DELETE FROM patterns WHERE id = ?", (pattern_id,))
+        cursor = await db.execute("DELETE FROM patterns WHERE id = ?", (pattern_id,))
         await db.commit()
-        return True
+        return cursor.rowcount > 0
     
     @staticmethod
     async def delete_all() -> bool:
@@ -105,22 +100,25 @@ class PatternRepository:
     
     @staticmethod
     async def update_last_seen(pattern_id: int, last_seen: date) -> bool:
-        """Update the last seen date for a pattern"""
+        """Update the last seen date for a pattern. Returns False if nothing changed."""
         db = get_db()
-        await db.execute(
-            "UPDATE patterns SET last_seen = ? WHERE id = ?",
-            (last_seen.isoformat(), pattern_id)
+        # Skip the write, and the dirty page, when the date is already current
+        cursor = await db.execute(
+            "UPDATE patterns SET last_seen = ? WHERE id = ? AND last_seen IS NOT ?",
+            (last_seen.isoformat(), pattern_id, last_seen.isoformat())
         )
         await db.commit()
-        return True
+        return cursor.rowcount > 0
     
     @staticmethod
-    async def increment_frequency(pattern_id: int) -> bool:
-        """Increment the frequency count for a pattern"""
+    async def increment_frequency(pattern_id: int, amount: int = 1) -> bool:
+        """Increment the frequency count for a pattern. Returns False if it doesn't exist."""
+        if amount == 0:
+            return True
         db = get_db()
-        await db.execute(
-            "UPDATE patterns SET frequency = frequency + 1 WHERE id = ?",
-            (pattern_id,)
+        cursor = await db.execute(
+            "UPDATE patterns SET frequency = frequency + ? WHERE id = ?",
+            (amount, pattern_id)
         )
         await db.commit()
-        return True
\ No newline at end of file
+        return cursor.rowcount > 0
\ No newline at end of file
@@ -1,25 +1,92 @@
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any
+import json
+import time
 
 from app.db.database import get_db
 from app.models.preferences import Preferences
 
 
+# Insert or update one preference by its UNIQUE key. An empty or missing
+# description keeps the stored one.
+_UPSERT_SQL = """INSERT INTO preferences (key, value, value_type, description)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        value_type = excluded.value_type,
+        description = COALESCE(NULLIF(excluded.description, ''), preferences.description)"""
+
+# How often get_by_key asks SQLite whether another connection has written
+_DATA_VERSION_CHECK_INTERVAL = 1.0
+
+
 class PreferencesRepository:
     """Repository for preferences database operations"""
     
+    # Preference rows of the active database, by key. Reads and writes reach
+    # it only through _get_cache, so it never outlives a database switch.
+    # Writes made through this class update it directly; PRAGMA data_version,
+    # polled at most once per _DATA_VERSION_CHECK_INTERVAL, catches commits
+    # made elsewhere.
+    _cache: Dict[str, Preferences] = {}
+    _cache_path: Optional[str] = None
+    _cache_data_version: Optional[int] = None
+    _cache_checked_at: float = 0.0
+    # Bumped before and after every write made through this class. A read
+    # only fills the cache if no write started or finished while it ran,
+    # since it may have seen the row from before that write.
+    _write_generation: int = 0
+    
+    @staticmethod
+    async def _get_cache(db) -> Dict[str, Preferences]:
+        """Return the key cache, emptied if the database changed under it"""
+        cls = PreferencesRepository
+        if cls._cache_path != db.db_path:
+            cls._cache = {}
+            cls._cache_path = db.db_path
+            cls._cache_data_version = None
+            cls._cache_checked_at = 0.0
+        
+        now = time.monotonic()
+        if now - cls._cache_checked_at >= _DATA_VERSION_CHECK_INTERVAL:
+            cls._cache_checked_at = now
+            async with db.acquire_writer() as connection:
+                cursor = await connection.execute("PRAGMA data_version")
+                data_version = (await cursor.fetchone())[0]
+            if data_version != cls._cache_data_version:
+                cls._cache = {}
+                cls._cache_data_version = data_version
+        return cls._cache
+    
+    @staticmethod
+    def _serialize_value(value: Any, value_type: str) -> str:
+        """Convert a typed value to its string storage form"""
+        if value_type == "json":
+            return json.dumps(value)
+        return str(value)
+    
     @staticmethod
     async def get_by_key(key: str) -> Optional[Preferences]:
         """Get preference by key"""
         db = get_db()
+        cache = await PreferencesRepository._get_cache(db)
+        pref = cache.get(key)
+        if pref is not None:
+            return pref
+        
+        generation = PreferencesRepository._write_generation
         row = await db.fetch_one(
             "SELECT * FROM preferences WHERE key = ?", (key,)
         )
-        return Preferences.from_dict(row) if row else None
+        if not row:
+            return None
+        pref = Preferences.from_dict(row)
+        if PreferencesRepository._write_generation == generation:
+            cache[key] = pref
+        return pref
     
     @staticmethod
     async def get_value(key: str, default: Any = None) -> Any:
         """Get typed preference value by key"""
-        db = get_db()
         pref = await PreferencesRepository.get_by_key(key)
         if pref:
             return pref.get_typed_value()
@@ -35,46 +102,60 @@ class PreferencesRepository:
         """Set preference value (create or update)"""
         db = get_db()
         # Convert value to string for storage
-        if value_type == "json":
-            import json
-            value_str = json.dumps(value)
-        else:
-            value_str = str(value)
+        value_str = PreferencesRepository._serialize_value(value, value_type)
         
-        existing = await PreferencesRepository.get_by_key(key)
+        # Drop the cached row until the write below has committed
+        cache = await PreferencesRepository._get_cache(db)
+        cache.pop(key, None)
+        PreferencesRepository._write_generation += 1
         
-        if existing:
-            # Update existing preference
-            existing.value = value_str
-            existing.value_type = value_type
-            if description:
-                existing.description = description
-            
-            await db.execute(
-                """UPDATE preferences 
-                   SET value = ?, value_type = ?, description = ?
-                   WHERE key = ?""",
-                (value_str, value_type, existing.description, key)
-            )
-        else:
-            # Create new preference
-            pref = Preferences(
-                key=key,
-                value=value_str,
-                value_type=value_type,
-                description=description
-            )
-            
-            cursor = await db.execute(
-                """INSERT INTO preferences (key, value, value_type, description)
-                   VALUES (?, ?, ?, ?)""",
-                (key, value_str, value_type, description)
+        cursor = await db.execute(
+            _UPSERT_SQL + " RETURNING *",
+            (key, value_str, value_type, description)
+        )
+        row = await cursor.fetchone()
+        await db.commit()
+        
+        PreferencesRepository._write_generation += 1
+        pref = cache[key] = Preferences.from_dict(dict(row))
+        return pref
+    
+    @staticmethod
+    async def set_many(items: List[Any]) -> int:
+        """Set multiple preferences in a single transaction.
+        
+        Each item must expose ``key``, ``value``, ``value_type`` and
+        ``description`` attributes (e.g. ``PreferenceUpdate``). Existing
+        descriptions are kept when the update does not provide one.
+        """
+        if not items:
+            return 0
+        
+        db = get_db()
+        cache = await PreferencesRepository._get_cache(db)
+        rows = [
+            (
+                item.key,
+                PreferencesRepository._serialize_value(item.value, item.value_type),
+                item.value_type,
+                item.description
             )
-            pref.id = cursor.lastrowid
-            existing = pref
+            for item in items
+        ]
         
-        await db.commit()
-        return existing
+        PreferencesRepository._write_generation += 1
+        try:
+            await db.execute_many(_UPSERT_SQL, rows)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        finally:
+            PreferencesRepository._write_generation += 1
+            for item in items:
+                cache.pop(item.key, None)
+        
+        return len(rows)
     
     @staticmethod
     async def get_all() -> List[Preferences]:
@@ -87,13 +168,20 @@ class PreferencesRepository:
     async def delete(key: str) -> bool:
         """Delete a preference"""
         db = get_db()
+        cache = await PreferencesRepository._get_cache(db)
+        PreferencesRepository._write_generation += 1
         await db.execute("DELETE FROM preferences WHERE key = ?", (key,))
         await db.commit()
+        PreferencesRepository._write_generation += 1
+        cache.pop(key, None)
         return True
     
     @staticmethod
     async def get_multiple(keys: List[str]) -> dict:
         """Get multiple preferences as a dictionary"""
+        if not keys:
+            return {}
+        
         db = get_db()
         placeholders = ", ".join(["?" for _ in keys])
         rows = await db.fetch_all(
@@ -10,7 +10,7 @@ CREATE TABLE IF NOT EXISTS entries (
     enhanced_text TEXT,
     structured_summary TEXT,
     mode TEXT NOT NULL DEFAULT 'raw',
-    embeddings TEXT,  -- JSON array of floats
+    embeddings BLOB,  -- packed float32 vector (older rows may hold JSON text)
     timestamp DATETIME NOT NULL,
     mood_tags TEXT,   -- JSON array of strings
     word_count INTEGER DEFAULT 0,
@@ -22,6 +22,18 @@ CREATE TABLE IF NOT EXISTS entries (
 )
 """
 
+# Full-text index over the entry text columns. External content: the text
+# lives in entries and the triggers below keep the index in step with it.
+ENTRIES_FTS_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    raw_text,
+    enhanced_text,
+    structured_summary,
+    content='entries',
+    content_rowid='id'
+)
+"""
+
 # Patterns table
 PATTERNS_TABLE = """
 CREATE TABLE IF NOT EXISTS patterns (
@@ -126,20 +138,41 @@ CREATE TABLE IF NOT EXISTS schema_version (
 # Indexes for better performance
 INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries(timestamp DESC)",
-    "CREATE INDEX IF NOT EXISTS idx_entries_mode ON entries(mode)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_mode_ts ON entries(mode, timestamp DESC)",
     "CREATE INDEX IF NOT EXISTS idx_entries_mood_tags ON entries(mood_tags)",
-    "CREATE INDEX IF NOT EXISTS idx_patterns_type ON patterns(pattern_type)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_has_embedding_ts ON entries(timestamp DESC) WHERE embeddings IS NOT NULL AND embeddings != '[]' AND embeddings != ''",
+    "CREATE INDEX IF NOT EXISTS idx_entries_no_embedding_ts ON entries(timestamp DESC) WHERE embeddings IS NULL OR embeddings = '[]' OR embeddings = ''",
+    "CREATE INDEX IF NOT EXISTS idx_patterns_type_confidence ON patterns(pattern_type, confidence DESC, frequency DESC)",
     "CREATE INDEX IF NOT EXISTS idx_patterns_confidence ON patterns(confidence DESC)",
-    "CREATE INDEX IF NOT EXISTS idx_preferences_key ON preferences(key)",
     "CREATE INDEX IF NOT EXISTS idx_drafts_updated ON drafts(updated_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_drafts_updated_created ON drafts(updated_at DESC, created_at DESC)",
     "CREATE INDEX IF NOT EXISTS idx_conversations_timestamp ON conversations(timestamp DESC)",
     "CREATE INDEX IF NOT EXISTS idx_conversations_type ON conversations(conversation_type)"
 ]
 
+# Triggers keeping entries_fts in sync with entries
+TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS entries_fts_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, raw_text, enhanced_text, structured_summary)
+    VALUES (new.id, new.raw_text, new.enhanced_text, new.structured_summary);
+END""",
+    """CREATE TRIGGER IF NOT EXISTS entries_fts_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, raw_text, enhanced_text, structured_summary)
+    VALUES ('delete', old.id, old.raw_text, old.enhanced_text, old.structured_summary);
+END""",
+    """CREATE TRIGGER IF NOT EXISTS entries_fts_au AFTER UPDATE OF raw_text, enhanced_text, structured_summary ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, raw_text, enhanced_text, structured_summary)
+    VALUES ('delete', old.id, old.raw_text, old.enhanced_text, old.structured_summary);
+    INSERT INTO entries_fts(rowid, raw_text, enhanced_text, structured_summary)
+    VALUES (new.id, new.raw_text, new.enhanced_text, new.structured_summary);
+END""",
+]
+
 # All tables in order of creation
 ALL_TABLES = [
     SCHEMA_VERSION_TABLE,
     ENTRIES_TABLE,
+    ENTRIES_FTS_TABLE,
     PATTERNS_TABLE,
     PREFERENCES_TABLE,
     DRAFTS_TABLE,
@@ -159,4 +192,8 @@ async def create_tables(db_path: str):
         for index_sql in INDEXES:
             await db.execute(index_sql)
         
+        # Create all triggers
+        for trigger_sql in TRIGGERS:
+            await db.execute(trigger_sql)
+        
         await db.commit()
\ No newline at end of file
@@ -0,0 +1,20 @@
+from typing import Sequence, Tuple
+
+
+def build_insert_update_sql(table: str, columns: Sequence[str]) -> Tuple[str, str]:
+    """Build the INSERT and UPDATE-by-id statements for a model's columns.
+    
+    Repositories call this once at import time with their model's
+    INSERT_COLUMNS. Since the column order never changes, every call runs
+    the same SQL text and the statement cache can reuse its prepared handle.
+    The UPDATE takes the row id as its last parameter.
+    """
+    insert_sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    update_sql = (
+        f"UPDATE {table} SET {', '.join(f'{column} = ?' for column in columns)} "
+        "WHERE id = ?"
+    )
+    return insert_sql, update_sql
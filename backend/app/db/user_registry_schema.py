@@ -24,6 +24,20 @@ CREATE INDEX IF NOT EXISTS idx_users_active ON users(is_active);
 CREATE INDEX IF NOT EXISTS idx_users_last_login ON users(last_login);
 """
 
+# Applied when the registry is opened. WAL lets session lookups read while a
+# login writes; journal_mode persists in the file, the rest are per connection.
+USER_REGISTRY_PRAGMAS = [
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 30000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -20000",  # ~20 MB, kept warm by the pooled connections
+]
+
+# What every later connection needs once the file is already in WAL mode
+USER_REGISTRY_CONNECTION_PRAGMAS = USER_REGISTRY_PRAGMAS[1:]
+
 USER_REGISTRY_MIGRATIONS = [
     {
         "version": 1,
@@ -1,9 +1,12 @@
+import asyncio
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
-from app.core.config import settings
+from app.core.config import settings, ensure_dirs
 from app.api.api import api_router
 from app.api.errors import (
     http_exception_handler,
@@ -12,7 +15,10 @@ from app.api.errors import (
 )
 from app.services.processing_queue import get_processing_queue, cleanup_processing_queue
 from app.services.service_coordinator import get_service_coordinator
+from app.services.ollama import get_ollama_service
 from app.services.background_tasks import background_manager
+from app.services.user_registry_service import get_user_registry_service
+from app.db.database import close_path_connections
 
 
 @asynccontextmanager
@@ -21,14 +27,26 @@ async def lifespan(app: FastAPI):
     # Removed init_db() - we don't want to create standalone boo.db
     # User databases are initialized when users register/login
     # Shared auth database (user_registry.db) persists from registration
+    ensure_dirs()
     
-    # Initialize processing queue
-    processing_queue = await get_processing_queue()
+    user_registry = get_user_registry_service()
     
-    # Initialize services (STT, WebSocket, Hotkey)
-    service_coordinator = await get_service_coordinator()
+    # Independent startup steps run concurrently: the processing queue and
+    # the services (STT, WebSocket, Hotkey). The user registry pool opens on
+    # first use, so a fresh install doesn't get an empty registry file that
+    # /auth/status would take for an initialized one
+    processing_queue, service_coordinator = await asyncio.gather(
+        get_processing_queue(),
+        get_service_coordinator(),
+    )
     await service_coordinator.initialize()
     
+    # Optionally open the Ollama connection and load the default model now
+    # so the first user request doesn't pay the cold-start cost
+    if settings.OLLAMA_PREWARM:
+        ollama_service = await get_ollama_service()
+        await ollama_service.prewarm()
+    
     # Background memory processing now starts per-user after login
     
     yield
@@ -36,6 +54,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     await background_manager.stop()
     await cleanup_processing_queue()
+    await user_registry.close_pool()
+    await close_path_connections()
 
 
 app = FastAPI(
@@ -43,6 +63,7 @@ app = FastAPI(
     description="Local-first journaling application with AI integration",
     version=settings.VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
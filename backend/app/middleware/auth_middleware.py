@@ -1,8 +1,22 @@
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
 from fastapi import HTTPException, Request, Response, status
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
 from ..services.auth_service import get_auth_service
+from ..auth.context import current_user_cv
+
+logger = logging.getLogger(__name__)
+
+# Endpoints under /api/v1/ that don't require authentication, besides the
+# /api/v1/auth/ routes. Paths outside /api/v1/ are never checked.
+_EXCLUDED_PATHS: frozenset[str] = frozenset({
+    "/api/v1/health",
+    "/api/v1/health/",
+})
 
 
 class AuthenticationMiddleware(BaseHTTPMiddleware):
@@ -10,74 +24,72 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
     Middleware that validates sessions for all requests except auth and health endpoints
     """
     
-    def __init__(self, app):
-        super().__init__(app)
-        # Endpoints that don't require authentication
-        self.excluded_paths = {
-            "/",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/api/v1/auth/",
-            "/api/v1/auth/register",
-            "/api/v1/auth/login",
-            "/api/v1/auth/logout",
-            "/api/v1/auth/status", 
-            "/api/v1/auth/users",
-            "/api/v1/health",
-            "/api/v1/health/",
-        }
-    
     async def dispatch(self, request: Request, call_next):
-        print(f"MIDDLEWARE: Processing request to {request.url.path}")
+        path = request.url.path
+        # Checked once so disabled debug logging costs nothing per request
+        debug = logger.isEnabledFor(logging.DEBUG)
+        started = time.perf_counter() if debug else 0.0
         
-        # Skip authentication for excluded paths
-        if request.url.path in self.excluded_paths or request.url.path.startswith("/api/v1/auth/"):
-            print(f"MIDDLEWARE: Skipping auth for {request.url.path}")
+        outcome, user, response = await self._authenticate(request, path)
+        
+        # One record per request, timing only the middleware's own work
+        if debug:
+            logger.debug(
+                "auth path=%s outcome=%s dt=%.3fms",
+                path, outcome, (time.perf_counter() - started) * 1000,
+            )
+        
+        if response is not None:
+            return response
+        if user is None:
             return await call_next(request)
         
-        # Skip authentication for non-API paths
-        if not request.url.path.startswith("/api/v1/"):
-            print(f"MIDDLEWARE: Skipping non-API path {request.url.path}")
+        # Expose the user to endpoints for the rest of this request
+        token = current_user_cv.set(user)
+        try:
             return await call_next(request)
+        finally:
+            current_user_cv.reset(token)
+    
+    async def _authenticate(
+        self, request: Request, path: str
+    ) -> Tuple[str, Optional[Dict[str, Any]], Optional[Response]]:
+        """Decide how to handle a request: (outcome, user, error response)"""
+        # Skip authentication for non-API paths before any rule lookup
+        if not path.startswith("/api/v1/"):
+            return "non_api", None, None
+        
+        # Skip authentication for excluded paths
+        if path.startswith("/api/v1/auth/") or path in _EXCLUDED_PATHS:
+            return "public", None, None
         
         # Check for session token
         auth_header = request.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
-            print(f"MIDDLEWARE: No auth header for {request.url.path}")
-            return JSONResponse(
+            return "no_token", None, JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"detail": "Authentication required"},
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        session_token = auth_header.replace("Bearer ", "")
-        print(f"MIDDLEWARE: Validating session for {request.url.path}")
+        session_token = auth_header[7:]
         
         # Validate session and switch database context
         try:
             auth_service = get_auth_service()
             is_valid, user = await auth_service.validate_session(session_token)
-            
-            if not is_valid or not user:
-                print(f"MIDDLEWARE: Invalid session for {request.url.path}")
-                return JSONResponse(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    content={"detail": "Invalid or expired session"},
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            print(f"MIDDLEWARE: Valid session for user {user['username']} on {request.url.path}")
-            
-            # Add user info to request state for use in endpoints
-            request.state.current_user = user
-            
         except Exception as e:
-            print(f"MIDDLEWARE: Exception validating session: {e}")
-            return JSONResponse(
+            logger.error("Exception validating session: %s", e)
+            return "error", None, JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={"detail": f"Authentication error: {str(e)}"},
             )
         
-        # Continue with request
-        return await call_next(request)
\ No newline at end of file
+        if not is_valid or not user:
+            return "invalid", None, JSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "Invalid or expired session"},
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
+        return "valid", user, None
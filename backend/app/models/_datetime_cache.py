@@ -0,0 +1,17 @@
+"""Cached ISO timestamp parsing for model hydration"""
+from datetime import date, datetime
+from functools import lru_cache
+
+
+# Rows loaded together often share timestamps, and the parsed values are
+# immutable, so repeated strings can return the same object
+@lru_cache(maxsize=4096)
+def parse_dt(value: str) -> datetime:
+    """Parse an ISO datetime string"""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value: str) -> date:
+    """Parse an ISO date string"""
+    return date.fromisoformat(value)
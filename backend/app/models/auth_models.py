@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
+from pydantic_core import PydanticCustomError
 from typing import Optional, List
 from datetime import datetime
 
@@ -10,14 +11,16 @@ class UserRegistrationRequest(BaseModel):
     recovery_phrase: str = Field(..., min_length=10, max_length=500, description="User's recovery phrase")
     emergency_key: Optional[str] = Field(None, description="Optional pre-generated emergency key")
     
-    @validator('name')
-    def validate_name(cls, v):
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: str) -> str:
         if not v.strip():
             raise ValueError('Name cannot be empty or whitespace only')
         return v.strip()
     
-    @validator('recovery_phrase')
-    def validate_recovery_phrase(cls, v):
+    @field_validator('recovery_phrase')
+    @classmethod
+    def validate_recovery_phrase(cls, v: str) -> str:
         if not v.strip():
             raise ValueError('Recovery phrase cannot be empty')
         return v.strip()
@@ -30,11 +33,13 @@ class LoginRequest(BaseModel):
     recovery_phrase: Optional[str] = Field(None, min_length=10, max_length=500, description="Recovery phrase")
     emergency_key_content: Optional[str] = Field(None, description="Emergency key file content")
     
-    @validator('name')
-    def validate_name(cls, v):
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: str) -> str:
         return v.strip()
     
-    def validate_auth_method(self):
+    @model_validator(mode='after')
+    def validate_auth_method(self) -> 'LoginRequest':
         """Ensure exactly one authentication method is provided"""
         methods = [
             bool(self.password),
@@ -43,9 +48,12 @@ class LoginRequest(BaseModel):
         ]
         
         if sum(methods) != 1:
-            raise ValueError("Exactly one authentication method must be provided")
+            raise PydanticCustomError(
+                "auth_method",
+                "Exactly one authentication method must be provided"
+            )
         
-        return True
+        return self
 
 
 class UserResponse(BaseModel):
@@ -57,8 +65,7 @@ class UserResponse(BaseModel):
     last_login: Optional[datetime]
     is_active: bool
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserListResponse(BaseModel):
@@ -69,8 +76,7 @@ class UserListResponse(BaseModel):
     created_at: datetime
     last_login: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RegistrationResponse(BaseModel):
@@ -121,7 +127,8 @@ class PasswordResetRequest(BaseModel):
     recovery_phrase: Optional[str] = Field(None, description="Recovery phrase for verification")
     emergency_key_content: Optional[str] = Field(None, description="Emergency key for verification")
     
-    def validate_verification_method(self):
+    @model_validator(mode='after')
+    def validate_verification_method(self) -> 'PasswordResetRequest':
         """Ensure at least one verification method is provided"""
         methods = [
             bool(self.recovery_phrase),
@@ -129,9 +136,12 @@ class PasswordResetRequest(BaseModel):
         ]
         
         if sum(methods) == 0:
-            raise ValueError("Recovery phrase or emergency key must be provided for password reset")
+            raise PydanticCustomError(
+                "verification_method",
+                "Recovery phrase or emergency key must be provided for password reset"
+            )
         
-        return True
+        return self
 
 
 class ChangePasswordRequest(BaseModel):
@@ -139,9 +149,10 @@ class ChangePasswordRequest(BaseModel):
     current_password: str = Field(..., min_length=8, max_length=128, description="Current password")
     new_password: str = Field(..., min_length=8, max_length=128, description="New password")
     
-    @validator('new_password')
-    def validate_new_password(cls, v, values):
-        if 'current_password' in values and v == values['current_password']:
+    @field_validator('new_password')
+    @classmethod
+    def validate_new_password(cls, v: str, info: ValidationInfo) -> str:
+        if v == info.data.get('current_password'):
             raise ValueError('New password must be different from current password')
         return v
 
@@ -151,8 +162,9 @@ class ChangeRecoveryPhraseRequest(BaseModel):
     current_password: str = Field(..., min_length=8, max_length=128, description="Current password for verification")
     new_recovery_phrase: str = Field(..., min_length=10, max_length=500, description="New recovery phrase")
     
-    @validator('new_recovery_phrase')
-    def validate_recovery_phrase(cls, v):
+    @field_validator('new_recovery_phrase')
+    @classmethod
+    def validate_recovery_phrase(cls, v: str) -> str:
         if not v.strip():
             raise ValueError('Recovery phrase cannot be empty')
         return v.strip()
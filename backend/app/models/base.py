@@ -1,10 +1,30 @@
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, Tuple, get_origin
+
+
+def _is_classvar(annotation) -> bool:
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
 
 
 class BaseModel:
     """Base model class for database entities"""
     
+    __slots__ = ()
+    
+    # Public annotated fields, snapshotted per class by __init_subclass__
+    _TO_DICT_FIELDS: ClassVar[Tuple[str, ...]] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields: Dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            for name, annotation in vars(klass).get('__annotations__', {}).items():
+                if not name.startswith('_') and not _is_classvar(annotation):
+                    fields[name] = None
+        cls._TO_DICT_FIELDS = tuple(fields)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
         """Create instance from dictionary"""
@@ -12,10 +32,10 @@ class BaseModel:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert instance to dictionary"""
-        return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        return {k: getattr(self, k) for k in self._TO_DICT_FIELDS}
 
 
 class TimestampMixin:
     """Mixin for adding timestamp fields"""
     created_at: datetime
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
@@ -1,10 +1,30 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
-import json
+from typing import Any, Callable, Iterable, List, Mapping, Optional, ClassVar, Tuple
+import orjson
 
+from ._datetime_cache import parse_dt
 
-@dataclass
+
+def _load_json_list(value, default):
+    """Decode a JSON list column, falling back to default when empty or invalid"""
+    if not value:
+        return default
+    try:
+        return orjson.loads(value)
+    except (orjson.JSONDecodeError, TypeError):
+        return default
+
+
+def _parse_datetime(value, default):
+    """Parse an ISO datetime column, falling back to default when invalid"""
+    try:
+        return parse_dt(value)
+    except (ValueError, TypeError):
+        return default
+
+
+@dataclass(slots=True)
 class Conversation:
     """Conversation model for Talk to Your Diary feature"""
     id: Optional[int] = None
@@ -32,32 +52,62 @@ class Conversation:
         if self.search_queries_used is None:
             self.search_queries_used = []
     
+    # Columns of to_insert_tuple(), in order: every stored field but id
+    INSERT_COLUMNS: ClassVar[Tuple[str, ...]] = (
+        "timestamp",
+        "duration",
+        "transcription",
+        "conversation_type",
+        "message_count",
+        "search_queries_used",
+        "created_at",
+        "updated_at",
+        "embedding",
+        "summary",
+        "key_topics",
+        "memory_extracted",
+        "memory_extracted_llm",
+        "memory_extracted_at",
+    )
+    
+    def to_insert_tuple(self) -> tuple:
+        """Values for INSERT_COLUMNS, encoded for storage"""
+        return (
+            self.timestamp.isoformat() if self.timestamp else None,
+            self.duration,
+            self.transcription,
+            self.conversation_type,
+            self.message_count,
+            orjson.dumps(self.search_queries_used).decode() if self.search_queries_used else None,
+            self.created_at.isoformat() if self.created_at else None,
+            self.updated_at.isoformat() if self.updated_at else None,
+            self.embedding,
+            self.summary,
+            orjson.dumps(self.key_topics).decode() if self.key_topics else None,
+            self.memory_extracted,
+            self.memory_extracted_llm,
+            self.memory_extracted_at.isoformat() if self.memory_extracted_at else None,
+        )
+    
     def to_dict(self):
         """Convert to dictionary for database storage"""
-        return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "duration": self.duration,
-            "transcription": self.transcription,
-            "conversation_type": self.conversation_type,
-            "message_count": self.message_count,
-            "search_queries_used": json.dumps(self.search_queries_used) if self.search_queries_used else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "embedding": self.embedding,
-            "summary": self.summary,
-            "key_topics": json.dumps(self.key_topics) if self.key_topics else None,
-            "memory_extracted": self.memory_extracted,
-            "memory_extracted_llm": self.memory_extracted_llm,
-            "memory_extracted_at": self.memory_extracted_at.isoformat() if self.memory_extracted_at else None
-        }
+        return dict(zip(("id",) + self.INSERT_COLUMNS, (self.id,) + self.to_insert_tuple()))
     
     def add_search_query(self, query: str):
         """Add a search query to the list"""
+        self.add_search_queries((query,))
+    
+    def add_search_queries(self, queries: Iterable[str]):
+        """Append queries not already recorded, keeping first-use order"""
         if self.search_queries_used is None:
             self.search_queries_used = []
-        if query not in self.search_queries_used:
-            self.search_queries_used.append(query)
+        # Built per call rather than kept alongside the list, since callers
+        # also assign search_queries_used directly
+        seen = set(self.search_queries_used)
+        for query in queries:
+            if query not in seen:
+                seen.add(query)
+                self.search_queries_used.append(query)
     
     def update_duration(self, duration_seconds: int):
         """Update conversation duration"""
@@ -70,65 +120,41 @@ class Conversation:
         self.updated_at = datetime.now()
     
     @classmethod
-    def from_dict(cls, data: dict):
-        """Create Conversation from database row"""
-        try:
-            # Parse JSON fields
-            if data.get("search_queries_used"):
-                try:
-                    data["search_queries_used"] = json.loads(data["search_queries_used"])
-                except (json.JSONDecodeError, TypeError):
-                    data["search_queries_used"] = []
-            else:
-                data["search_queries_used"] = []
-            
-            # Parse key_topics JSON field
-            if data.get("key_topics"):
-                try:
-                    data["key_topics"] = json.loads(data["key_topics"])
-                except (json.JSONDecodeError, TypeError):
-                    data["key_topics"] = None
-            else:
-                data["key_topics"] = None
-            
-            # Parse datetime fields
-            if data.get("timestamp"):
-                try:
-                    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
-                except (ValueError, TypeError):
-                    data["timestamp"] = datetime.now()
-            
-            if data.get("created_at"):
-                try:
-                    data["created_at"] = datetime.fromisoformat(data["created_at"])
-                except (ValueError, TypeError):
-                    data["created_at"] = datetime.now()
-            
-            if data.get("updated_at"):
-                try:
-                    data["updated_at"] = datetime.fromisoformat(data["updated_at"])
-                except (ValueError, TypeError):
-                    data["updated_at"] = None
-                    
-            if data.get("memory_extracted_at"):
-                try:
-                    data["memory_extracted_at"] = datetime.fromisoformat(data["memory_extracted_at"])
-                except (ValueError, TypeError):
-                    data["memory_extracted_at"] = None
-            
-            return cls(**data)
-        except Exception:
-            # Return a default conversation if parsing fails
-            return cls(
-                id=data.get("id"),
-                transcription=data.get("transcription", ""),
-                conversation_type=data.get("conversation_type", "chat"),
-                duration=data.get("duration", 0),
-                message_count=data.get("message_count", 0),
-                embedding=data.get("embedding"),
-                summary=data.get("summary"),
-                key_topics=data.get("key_topics"),
-                memory_extracted=data.get("memory_extracted", 0),
-                memory_extracted_llm=data.get("memory_extracted_llm", 0),
-                memory_extracted_at=None
-            )
\ No newline at end of file
+    def _from_mapping(cls, get: Callable[..., Any]) -> "Conversation":
+        """Build a Conversation from a column getter, get(name, default=None)"""
+        # Each helper falls back instead of raising, so no row is dropped
+        return cls(
+            id=get("id"),
+            timestamp=_parse_datetime(get("timestamp"), None),
+            duration=get("duration", 0),
+            transcription=get("transcription", ""),
+            conversation_type=get("conversation_type", "chat"),
+            message_count=get("message_count", 0),
+            search_queries_used=_load_json_list(get("search_queries_used"), []),
+            created_at=_parse_datetime(get("created_at"), None),
+            updated_at=_parse_datetime(get("updated_at"), None),
+            embedding=get("embedding"),
+            summary=get("summary"),
+            key_topics=_load_json_list(get("key_topics"), None),
+            memory_extracted=get("memory_extracted", 0),
+            memory_extracted_llm=get("memory_extracted_llm", 0),
+            memory_extracted_at=_parse_datetime(get("memory_extracted_at"), None)
+        )
+    
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]):
+        """Create Conversation from a database row (dict or sqlite Row)"""
+        if not isinstance(data, dict):
+            data = dict(data)
+        return cls._from_mapping(data.get)
+    
+    @classmethod
+    def from_row(cls, row) -> "Conversation":
+        """Create Conversation straight from a sqlite Row, without a dict copy"""
+        # Databases created before the memory system may lack its columns
+        columns = row.keys()
+        
+        def get(name, default=None):
+            return row[name] if name in columns else default
+        
+        return cls._from_mapping(get)
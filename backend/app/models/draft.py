@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
-import json
+from typing import Optional, ClassVar, Tuple
+import orjson
 
+from ._datetime_cache import parse_dt
 
-@dataclass
+
+@dataclass(slots=True)
 class Draft:
     """Draft model for auto-save functionality"""
     id: Optional[int] = None
@@ -19,25 +21,36 @@ class Draft:
         if self.metadata is None:
             self.metadata = {}
     
+    # Columns of to_insert_tuple(), in order: every stored field but id
+    INSERT_COLUMNS: ClassVar[Tuple[str, ...]] = (
+        "content",
+        "metadata",
+        "created_at",
+        "updated_at",
+    )
+    
+    def to_insert_tuple(self) -> tuple:
+        """Values for INSERT_COLUMNS, encoded for storage"""
+        return (
+            self.content,
+            orjson.dumps(self.metadata, option=orjson.OPT_NON_STR_KEYS).decode() if self.metadata else None,
+            self.created_at.isoformat() if self.created_at else None,
+            self.updated_at.isoformat() if self.updated_at else None,
+        )
+    
     def to_dict(self):
         """Convert to dictionary for database storage"""
-        return {
-            "id": self.id,
-            "content": self.content,
-            "metadata": json.dumps(self.metadata) if self.metadata else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
+        return dict(zip(("id",) + self.INSERT_COLUMNS, (self.id,) + self.to_insert_tuple()))
     
     @classmethod
     def from_dict(cls, data: dict):
         """Create Draft from database row"""
         # Parse JSON fields
         if data.get("metadata"):
-            data["metadata"] = json.loads(data["metadata"])
+            data["metadata"] = orjson.loads(data["metadata"])
         if data.get("created_at"):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
+            data["created_at"] = parse_dt(data["created_at"])
         if data.get("updated_at"):
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+            data["updated_at"] = parse_dt(data["updated_at"])
         
         return cls(**data)
\ No newline at end of file
@@ -1,10 +1,31 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
-import json
+from array import array
+from typing import Optional, List, Union, ClassVar, Tuple
+import orjson
 
+from ._datetime_cache import parse_dt
 
-@dataclass
+
+def encode_embedding(embeddings: Optional[List[float]]) -> Optional[bytes]:
+    """Pack an embedding vector into a float32 BLOB for storage"""
+    if not embeddings:
+        return None
+    return array("f", embeddings).tobytes()
+
+
+def decode_embedding(value: Union[bytes, str, None]) -> Optional[List[float]]:
+    """Unpack a stored embedding, accepting legacy JSON text as well as BLOBs"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return orjson.loads(value)
+    vector = array("f")
+    vector.frombytes(value)
+    return vector.tolist()
+
+
+@dataclass(slots=True)
 class Entry:
     """Journal entry model"""
     id: Optional[int] = None
@@ -33,24 +54,44 @@ class Entry:
         if self.word_count == 0 and self.raw_text:
             self.word_count = len(self.raw_text.split())
     
+    # Columns of to_insert_tuple(), in order: every stored field but id
+    INSERT_COLUMNS: ClassVar[Tuple[str, ...]] = (
+        "raw_text",
+        "enhanced_text",
+        "structured_summary",
+        "mode",
+        "embeddings",
+        "timestamp",
+        "mood_tags",
+        "word_count",
+        "processing_metadata",
+        "smart_tags",
+        "memory_extracted",
+        "memory_extracted_llm",
+        "memory_extracted_at",
+    )
+    
+    def to_insert_tuple(self) -> tuple:
+        """Values for INSERT_COLUMNS, encoded for storage"""
+        return (
+            self.raw_text,
+            self.enhanced_text,
+            self.structured_summary,
+            self.mode,
+            encode_embedding(self.embeddings),
+            self.timestamp.isoformat() if self.timestamp else None,
+            orjson.dumps(self.mood_tags).decode() if self.mood_tags else None,
+            self.word_count,
+            orjson.dumps(self.processing_metadata, option=orjson.OPT_NON_STR_KEYS).decode() if self.processing_metadata else None,
+            orjson.dumps(self.smart_tags).decode() if self.smart_tags else None,
+            self.memory_extracted,
+            self.memory_extracted_llm,
+            self.memory_extracted_at.isoformat() if self.memory_extracted_at else None,
+        )
+    
     def to_dict(self):
         """Convert to dictionary for database storage"""
-        return {
-            "id": self.id,
-            "raw_text": self.raw_text,
-            "enhanced_text": self.enhanced_text,
-            "structured_summary": self.structured_summary,
-            "mode": self.mode,
-            "embeddings": json.dumps(self.embeddings) if self.embeddings else None,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "mood_tags": json.dumps(self.mood_tags) if self.mood_tags else None,
-            "word_count": self.word_count,
-            "processing_metadata": json.dumps(self.processing_metadata) if self.processing_metadata else None,
-            "smart_tags": json.dumps(self.smart_tags) if self.smart_tags else None,
-            "memory_extracted": self.memory_extracted,
-            "memory_extracted_llm": self.memory_extracted_llm,
-            "memory_extracted_at": self.memory_extracted_at.isoformat() if self.memory_extracted_at else None
-        }
+        return dict(zip(("id",) + self.INSERT_COLUMNS, (self.id,) + self.to_insert_tuple()))
     
     def update_processing_metadata(self, new_metadata: dict):
         """Update processing metadata while preserving existing data"""
@@ -64,16 +105,16 @@ class Entry:
         """Create Entry from database row"""
         # Parse JSON fields
         if data.get("embeddings"):
-            data["embeddings"] = json.loads(data["embeddings"])
+            data["embeddings"] = decode_embedding(data["embeddings"])
         if data.get("mood_tags"):
-            data["mood_tags"] = json.loads(data["mood_tags"])
+            data["mood_tags"] = orjson.loads(data["mood_tags"])
         if data.get("processing_metadata"):
-            data["processing_metadata"] = json.loads(data["processing_metadata"])
+            data["processing_metadata"] = orjson.loads(data["processing_metadata"])
         if data.get("smart_tags"):
-            data["smart_tags"] = json.loads(data["smart_tags"])
+            data["smart_tags"] = orjson.loads(data["smart_tags"])
         if data.get("timestamp"):
-            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+            data["timestamp"] = parse_dt(data["timestamp"])
         if data.get("memory_extracted_at"):
-            data["memory_extracted_at"] = datetime.fromisoformat(data["memory_extracted_at"])
+            data["memory_extracted_at"] = parse_dt(data["memory_extracted_at"])
         
         return cls(**data)
\ No newline at end of file
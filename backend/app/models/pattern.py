@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional, List
-import json
+from typing import Optional, List, ClassVar, Tuple
+import orjson
 
+from ._datetime_cache import parse_date
 
-@dataclass
+
+@dataclass(slots=True)
 class Pattern:
     """Pattern model for detected patterns in journal entries"""
     id: Optional[int] = None
@@ -23,31 +25,46 @@ class Pattern:
         if self.keywords is None:
             self.keywords = []
     
+    # Columns of to_insert_tuple(), in order: every stored field but id
+    INSERT_COLUMNS: ClassVar[Tuple[str, ...]] = (
+        "pattern_type",
+        "description",
+        "frequency",
+        "confidence",
+        "first_seen",
+        "last_seen",
+        "related_entries",
+        "keywords",
+    )
+    
+    def to_insert_tuple(self) -> tuple:
+        """Values for INSERT_COLUMNS, encoded for storage"""
+        return (
+            self.pattern_type,
+            self.description,
+            self.frequency,
+            self.confidence,
+            self.first_seen.isoformat() if self.first_seen else None,
+            self.last_seen.isoformat() if self.last_seen else None,
+            orjson.dumps(self.related_entries).decode() if self.related_entries else None,
+            orjson.dumps(self.keywords).decode() if self.keywords else None,
+        )
+    
     def to_dict(self):
         """Convert to dictionary for database storage"""
-        return {
-            "id": self.id,
-            "pattern_type": self.pattern_type,
-            "description": self.description,
-            "frequency": self.frequency,
-            "confidence": self.confidence,
-            "first_seen": self.first_seen.isoformat() if self.first_seen else None,
-            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
-            "related_entries": json.dumps(self.related_entries) if self.related_entries else None,
-            "keywords": json.dumps(self.keywords) if self.keywords else None
-        }
+        return dict(zip(("id",) + self.INSERT_COLUMNS, (self.id,) + self.to_insert_tuple()))
     
     @classmethod
     def from_dict(cls, data: dict):
         """Create Pattern from database row"""
         # Parse JSON fields
         if data.get("related_entries"):
-            data["related_entries"] = json.loads(data["related_entries"])
+            data["related_entries"] = orjson.loads(data["related_entries"])
         if data.get("keywords"):
-            data["keywords"] = json.loads(data["keywords"])
+            data["keywords"] = orjson.loads(data["keywords"])
         if data.get("first_seen"):
-            data["first_seen"] = date.fromisoformat(data["first_seen"])
+            data["first_seen"] = parse_date(data["first_seen"])
         if data.get("last_seen"):
-            data["last_seen"] = date.fromisoformat(data["last_seen"])
+            data["last_seen"] = parse_date(data["last_seen"])
         
         return cls(**data)
\ No newline at end of file
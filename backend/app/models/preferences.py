@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from typing import Optional
-import json
+import orjson
 
+from .base import BaseModel
 
-@dataclass
-class Preferences:
+
+@dataclass(slots=True)
+class Preferences(BaseModel):
     """User preferences model"""
     id: Optional[int] = None
     key: str = ""
@@ -12,16 +14,6 @@ class Preferences:
     value_type: str = "string"  # string, int, float, bool, json
     description: Optional[str] = None
     
-    def to_dict(self):
-        """Convert to dictionary for database storage"""
-        return {
-            "id": self.id,
-            "key": self.key,
-            "value": self.value,
-            "value_type": self.value_type,
-            "description": self.description
-        }
-    
     def get_typed_value(self):
         """Get value with proper type conversion"""
         if self.value_type == "int":
@@ -31,11 +23,6 @@ class Preferences:
         elif self.value_type == "bool":
             return self.value.lower() in ("true", "1", "yes")
         elif self.value_type == "json":
-            return json.loads(self.value)
+            return orjson.loads(self.value)
         else:
             return self.value
-    
-    @classmethod
-    def from_dict(cls, data: dict):
-        """Create Preferences from database row"""
-        return cls(**data)
\ No newline at end of file
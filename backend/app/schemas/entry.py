@@ -4,7 +4,7 @@ Entry-related schemas and models for the API.
 
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
@@ -60,8 +60,7 @@ class EntryResponse(BaseModel):
     word_count: Optional[int] = None
     processing_metadata: Optional[Dict[str, Any]] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EntryListResponse(BaseModel):
@@ -1,4 +1,4 @@
-from .stt import STTService, get_stt_service, RecordingState
+from .stt import STTService, get_stt_service, get_stt_service_sync, RecordingState
 from .hotkey import HotkeyService, get_hotkey_service, validate_hotkey
 from .websocket import WebSocketManager, get_websocket_manager
 from .ollama import OllamaService, get_ollama_service
@@ -9,6 +9,7 @@ from .service_coordinator import ServiceCoordinator, get_service_coordinator, en
 __all__ = [
     "STTService",
     "get_stt_service", 
+    "get_stt_service_sync",
     "RecordingState",
     "HotkeyService",
     "get_hotkey_service",
@@ -1,8 +1,17 @@
+import asyncio
 import bcrypt
+import hashlib
+import hmac
 import uuid
-import json
+import orjson
 import os
+import re
 import logging
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
@@ -13,6 +22,57 @@ from .session_manager import get_session_manager
 
 logger = logging.getLogger(__name__)
 
+# Users behind validated sessions are kept for a short time so the
+# per-request auth check skips the user registry lookup
+SESSION_USER_CACHE_TTL = 60  # seconds
+SESSION_USER_CACHE_SIZE = 10_000
+
+
+# Characters dropped from generated usernames. \W is exactly what fails
+# str.isalnum() and isn't "_", so non-ASCII letters are kept as before.
+_USERNAME_STRIP = re.compile(r'\W+')
+
+# Verified (password, bcrypt hash) pairs, so repeat logins skip the KDF. Only
+# successes are cached, so a wrong guess always pays the full bcrypt cost.
+VERIFIED_PASSWORD_CACHE_SIZE = 1024
+
+# bcrypt releases the GIL, so hashing on these threads runs in parallel and
+# keeps the event loop free while a login or registration is being checked
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
+# Per-process secret for password cache keys, so the cache never holds a
+# digest that could be brute-forced faster than the bcrypt hash itself
+_PASSWORD_CACHE_SECRET = os.urandom(32)
+
+
+def _secrets_match(given: Any, expected: Any) -> bool:
+    """Constant-time string equality; anything that isn't a string never matches"""
+    if not isinstance(given, str) or not isinstance(expected, str):
+        return False
+    # Compared as bytes, since compare_digest rejects non-ASCII str
+    return hmac.compare_digest(given.encode('utf-8'), expected.encode('utf-8'))
+
+
+def _password_cache_key(password: str, hashed: str) -> bytes:
+    """Keyed digest of a password and the bcrypt hash it was checked against"""
+    # bcrypt hashes never contain NUL, so the separator keeps pairs distinct
+    data = hashed.encode('utf-8') + b"\0" + password.encode('utf-8')
+    return hashlib.blake2b(data, key=_PASSWORD_CACHE_SECRET, digest_size=32).digest()
+
+
+@lru_cache(maxsize=4096)
+def _username_for(display_name: str) -> str:
+    """Derive the username for a display name; pure, so results are cached"""
+    # Convert to lowercase, replace spaces with underscores
+    base_username = display_name.lower().replace(' ', '_')
+    # Remove non-alphanumeric characters except underscores
+    base_username = _USERNAME_STRIP.sub('', base_username)
+    # Ensure it starts with a letter
+    if not base_username or not base_username[0].isalpha():
+        base_username = f"user_{base_username}"
+    
+    return base_username[:50]  # Limit length
+
 
 class AuthenticationService:
     """Core authentication service with multiple authentication methods"""
@@ -23,31 +83,45 @@ class AuthenticationService:
         self.session_manager = get_session_manager()
         self.max_failed_attempts = 5
         self.lockout_duration = 60  # minutes
+        # user id -> (monotonic expiry, user), least recently used first
+        self._session_user_cache: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # user id -> lock held while that user is being loaded
+        self._session_user_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+        # password cache keys that bcrypt verified, least recently used first
+        self._verified_passwords: "OrderedDict[bytes, None]" = OrderedDict()
     
-    def _hash_password(self, password: str) -> str:
+    async def _hash_password(self, password: str) -> str:
         """Hash password using bcrypt"""
         salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+        loop = asyncio.get_running_loop()
+        hashed = await loop.run_in_executor(
+            _BCRYPT_POOL, bcrypt.hashpw, password.encode('utf-8'), salt
+        )
         return hashed.decode('utf-8')
     
-    def _verify_password(self, password: str, hashed: str) -> bool:
+    async def _verify_password(self, password: str, hashed: str) -> bool:
         """Verify password against hash"""
         try:
-            return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+            key = _password_cache_key(password, hashed)
+            if key in self._verified_passwords:
+                self._verified_passwords.move_to_end(key)
+                return True
+            loop = asyncio.get_running_loop()
+            verified = await loop.run_in_executor(
+                _BCRYPT_POOL, bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8')
+            )
         except Exception:
             return False
+        
+        if verified:
+            self._verified_passwords[key] = None
+            if len(self._verified_passwords) > VERIFIED_PASSWORD_CACHE_SIZE:
+                self._verified_passwords.popitem(last=False)
+        return verified
     
     def _generate_username(self, display_name: str) -> str:
         """Generate unique username from display name"""
-        # Convert to lowercase, replace spaces with underscores
-        base_username = display_name.lower().replace(' ', '_')
-        # Remove non-alphanumeric characters except underscores
-        base_username = ''.join(c for c in base_username if c.isalnum() or c == '_')
-        # Ensure it starts with a letter
-        if not base_username or not base_username[0].isalpha():
-            base_username = f"user_{base_username}"
-        
-        return base_username[:50]  # Limit length
+        return _username_for(display_name)
     
     def _generate_recovery_key(self) -> str:
         """Generate emergency recovery key"""
@@ -62,18 +136,18 @@ class AuthenticationService:
             "username": username,
             "name": display_name
         }
-        return json.dumps(key_data, indent=2)
+        return orjson.dumps(key_data, option=orjson.OPT_INDENT_2).decode()
     
     def _parse_emergency_key_file(self, file_content: str) -> Optional[Dict[str, Any]]:
         """Parse and validate emergency key file"""
         try:
-            data = json.loads(file_content)
-            if data.get("type") != "boo_emergency_key":
+            data = orjson.loads(file_content)
+            if not isinstance(data, dict) or data.get("type") != "boo_emergency_key":
                 return None
             if "key" not in data:
                 return None
             return data
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError, TypeError):
             return None
     
     async def register_user(
@@ -96,8 +170,8 @@ class AuthenticationService:
             counter += 1
         
         # Hash password and recovery phrase
-        password_hash = self._hash_password(password)
-        phrase_hash = self._hash_password(recovery_phrase) if recovery_phrase else None
+        password_hash = await self._hash_password(password)
+        phrase_hash = await self._hash_password(recovery_phrase) if recovery_phrase else None
         
         # Generate emergency key if not provided
         if not emergency_key:
@@ -140,7 +214,7 @@ class AuthenticationService:
             return False, None, "Account temporarily locked due to failed login attempts"
         
         # Verify password
-        if not self._verify_password(password, user['password_hash']):
+        if not await self._verify_password(password, user['password_hash']):
             # Increment failed attempts
             failed_count = await self.user_registry.increment_failed_attempts(user['id'])
             
@@ -174,7 +248,7 @@ class AuthenticationService:
             return False, None, "Account temporarily locked"
         
         # Verify recovery phrase
-        if not self._verify_password(recovery_phrase, user['secret_phrase_hash']):
+        if not await self._verify_password(recovery_phrase, user['secret_phrase_hash']):
             # Increment failed attempts for recovery phrase too
             failed_count = await self.user_registry.increment_failed_attempts(user['id'])
             
@@ -206,11 +280,11 @@ class AuthenticationService:
             return False, None, "Invalid credentials"
         
         # Verify emergency key matches
-        if key_data['key'] != user['recovery_key']:
+        if not _secrets_match(key_data['key'], user['recovery_key']):
             return False, None, "Invalid emergency key"
         
         # Verify username matches (additional security)
-        if key_data.get('username') != user['username']:
+        if not _secrets_match(key_data.get('username'), user['username']):
             return False, None, "Emergency key does not match this account"
         
         # Emergency key bypasses account locks (it's emergency recovery)
@@ -263,20 +337,58 @@ class AuthenticationService:
     
     async def validate_session(self, session_token: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Validate session token and return current user"""
+        # The session check itself is in memory and always runs, so logout and
+        # expiry take effect immediately; only the user lookup is cached
         is_valid, session = self.session_manager.validate_session(session_token)
         
         if not is_valid or not session:
             return False, None
         
-        # Get full user data from registry
-        user = await self.user_registry.get_user_by_id(session.user_id)
+        user_id = session.user_id
+        user = self._cached_session_user(user_id)
+        if user:
+            return True, user
+        
+        # Concurrent requests for the same user share one registry lookup
+        lock = self._session_user_locks.get(user_id)
+        if lock is None:
+            lock = self._session_user_locks[user_id] = asyncio.Lock()
+        async with lock:
+            user = self._cached_session_user(user_id)
+            if user:
+                return True, user
+            
+            # Get full user data from registry
+            user = await self.user_registry.get_user_by_id(user_id)
+            
+            if user:
+                expires = time.monotonic() + SESSION_USER_CACHE_TTL
+                self._session_user_cache[user_id] = (expires, user)
+                self._session_user_cache.move_to_end(user_id)
+                if len(self._session_user_cache) > SESSION_USER_CACHE_SIZE:
+                    self._session_user_cache.popitem(last=False)
         
         return is_valid, user
     
+    def _cached_session_user(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached user record if still fresh"""
+        cached = self._session_user_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            self._session_user_cache.move_to_end(user_id)
+            return cached[1]
+        return None
+    
+    def _invalidate_cached_user(self, user_id: int):
+        """Drop the cached record for a user who logged out or changed"""
+        self._session_user_cache.pop(user_id, None)
+    
     async def logout(self, session_token: Optional[str] = None):
         """End current session"""
         if session_token:
+            _, session = self.session_manager.validate_session(session_token)
             self.session_manager.end_session(session_token)
+            if session:
+                self._invalidate_cached_user(session.user_id)
         
         # Clear database context
         await self.db_manager.clear_session()
@@ -292,14 +404,15 @@ class AuthenticationService:
             return False, "User not found"
         
         # Verify current password
-        if not self._verify_password(current_password, user['password_hash']):
+        if not await self._verify_password(current_password, user['password_hash']):
             return False, "Current password is incorrect"
         
         # Hash new password
-        new_hash = self._hash_password(new_password)
+        new_hash = await self._hash_password(new_password)
         
         # Update in database
         await self.user_registry.update_password_hash(user_id, new_hash)
+        self._invalidate_cached_user(user_id)
         
         return True, "Password updated successfully"
     
@@ -310,14 +423,15 @@ class AuthenticationService:
             return False, "User not found"
         
         # Verify current password
-        if not self._verify_password(current_password, user['password_hash']):
+        if not await self._verify_password(current_password, user['password_hash']):
             return False, "Password is incorrect"
         
         # Hash new recovery phrase
-        new_phrase_hash = self._hash_password(new_recovery_phrase)
+        new_phrase_hash = await self._hash_password(new_recovery_phrase)
         
         # Update in database
         await self.user_registry.update_secret_phrase_hash(user_id, new_phrase_hash)
+        self._invalidate_cached_user(user_id)
         
         return True, "Recovery phrase updated successfully"
     
@@ -330,7 +444,7 @@ class AuthenticationService:
                 return None
             
             # Verify current password
-            if not bcrypt.checkpw(current_password.encode('utf-8'), user['password_hash'].encode('utf-8')):
+            if not await self._verify_password(current_password, user['password_hash']):
                 return None
             
             # Return the verified password and emergency key
@@ -353,10 +467,11 @@ class AuthenticationService:
             return False
         
         # Hash new password
-        new_hash = self._hash_password(new_password)
+        new_hash = await self._hash_password(new_password)
         
         # Update in database
         await self.user_registry.update_password_hash(user['id'], new_hash)
+        self._invalidate_cached_user(user['id'])
         return True
     
     async def get_development_override(self) -> bool:
@@ -40,7 +40,7 @@ class ConversationType(Enum):
     CHAT = "chat"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     """Represents a single turn in a conversation."""
     timestamp: datetime
@@ -50,7 +50,7 @@ class ConversationTurn:
     duration_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveConversation:
     """Represents an active conversation session."""
     conversation_id: Optional[int]
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from .user_registry_service import get_user_registry_service
 from ..db.schema import create_tables
-from ..db.database import db, initialize_preferences_for_db, get_db
+from ..db.database import db, initialize_preferences_for_db, get_db, CONNECTION_PRAGMAS
 from ..db.migrations import run_migrations
 
 
@@ -63,9 +63,8 @@ class DatabaseManager:
         self.user_db_path = None
         
         # Reset global database to default path when clearing session
-        from ..core.config import settings
-        default_path = settings.DATABASE_URL.replace("sqlite+aiosqlite:///", "")
-        await db.set_db_path(default_path)
+        from ..core.config import DATABASE_PATH
+        await db.set_db_path(DATABASE_PATH)
     
     async def _initialize_user_database(self, db_path: str):
         """Create new user database with complete schema matching main database"""
@@ -90,6 +89,8 @@ class DatabaseManager:
         try:
             async with aiosqlite.connect(db_path) as temp_db:
                 temp_db.row_factory = aiosqlite.Row
+                for pragma in CONNECTION_PRAGMAS:
+                    await temp_db.execute(pragma)
                 
                 # Create a temporary database wrapper that matches the expected interface
                 class TempDB:
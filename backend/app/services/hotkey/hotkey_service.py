@@ -171,7 +171,7 @@ class HotkeyService:
                     return
                 
                 # Start STT recording
-                success = self.stt_service.start_recording()
+                success, _ = self.stt_service.start_recording()
                 if not success:
                     raise Exception("Failed to start STT recording")
                 
@@ -213,7 +213,7 @@ class HotkeyService:
                         return
                 
                 # Stop STT recording
-                success = self.stt_service.stop_recording()
+                success, _ = self.stt_service.stop_recording()
                 if not success:
                     raise Exception("Failed to stop STT recording")
                 
@@ -5,7 +5,9 @@ Ollama service for local LLM integration
 import asyncio
 import json
 import logging
-from typing import Optional, List, Dict, Any, AsyncGenerator
+import os
+from contextlib import aclosing
+from typing import Optional, List, Dict, Any, AsyncGenerator, AsyncIterator
 import httpx
 from datetime import datetime
 
@@ -28,6 +30,24 @@ from .ollama_exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Ollama's own default when OLLAMA_NUM_PARALLEL is not set
+DEFAULT_NUM_PARALLEL = 4
+
+# Longest wait, in seconds, for the next chunk of a streamed response. Long
+# enough to cover a cold model load before the first token, but finite so a
+# stalled stream gives its request slot back.
+STREAM_READ_TIMEOUT = 120
+
+
+def _env_int(name: str) -> Optional[int]:
+    """Read an optional integer Ollama server setting from the environment"""
+    value = os.environ.get(name)
+    try:
+        return int(value) if value else None
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}={value!r}")
+        return None
+
 
 class OllamaService:
     """Service for interacting with Ollama API"""
@@ -35,12 +55,19 @@ class OllamaService:
     def __init__(self, base_url: Optional[str] = None, timeout: Optional[int] = None):
         self.base_url = base_url or settings.OLLAMA_BASE_URL
         self.timeout = timeout or settings.OLLAMA_TIMEOUT
+        self._stream_timeout = httpx.Timeout(self.timeout, read=STREAM_READ_TIMEOUT)
         self._client: Optional[httpx.AsyncClient] = None
         self._available_models: List[OllamaModel] = []
         self._default_model = settings.OLLAMA_DEFAULT_MODEL
         self._connected = False
         self._last_health_check: Optional[datetime] = None
         
+        # Mirror the server's parallelism so extra requests queue here
+        # instead of piling up as open connections on the Ollama side
+        self.num_parallel = _env_int("OLLAMA_NUM_PARALLEL")
+        self.max_loaded_models = _env_int("OLLAMA_MAX_LOADED_MODELS")
+        self._request_slots = asyncio.Semaphore(self.num_parallel or DEFAULT_NUM_PARALLEL)
+        
     async def __aenter__(self):
         """Async context manager entry"""
         await self.connect()
@@ -188,6 +215,28 @@ class OllamaService:
         models = await self.list_models()
         return any(model.name == model_name for model in models)
     
+    def _build_options(
+        self,
+        temperature: float,
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build Ollama generation options"""
+        options = {
+            "temperature": temperature,
+            "num_gpu": -1,  # Use all GPU layers for maximum performance
+            **kwargs
+        }
+        
+        # Set context window - use from kwargs if provided, otherwise default
+        if "num_ctx" not in options:
+            options["num_ctx"] = 4096  # Default context length
+        
+        if max_tokens:
+            options["num_predict"] = max_tokens
+        
+        return options
+    
     async def generate(
         self,
         prompt: str,
@@ -203,19 +252,7 @@ class OllamaService:
         
         model = model or self._default_model
         
-        # Build options
-        options = {
-            "temperature": temperature,
-            "num_gpu": -1,  # Use all GPU layers for maximum performance
-            **kwargs
-        }
-        
-        # Set context window - use from kwargs if provided, otherwise default
-        if "num_ctx" not in options:
-            options["num_ctx"] = 4096  # Default context length
-        
-        if max_tokens:
-            options["num_predict"] = max_tokens
+        options = self._build_options(temperature, max_tokens, **kwargs)
         
         request = GenerateRequest(
             model=model,
@@ -226,11 +263,12 @@ class OllamaService:
         )
         
         try:
-            response = await self._client.post(
-                "/api/generate",
-                json=request.dict(exclude_none=True),
-                timeout=None if stream else self.timeout
-            )
+            async with self._request_slots:
+                response = await self._client.post(
+                    "/api/generate",
+                    json=request.dict(exclude_none=True),
+                    timeout=self._stream_timeout if stream else self.timeout
+                )
             
             if response.status_code == 404:
                 raise OllamaModelNotFoundError(f"Model '{model}' not found")
@@ -274,19 +312,7 @@ class OllamaService:
                 content=msg["content"]
             ))
         
-        # Build options
-        options = {
-            "temperature": temperature,
-            "num_gpu": -1,  # Use all GPU layers for maximum performance
-            **kwargs
-        }
-        
-        # Set context window - use from kwargs if provided, otherwise default
-        if "num_ctx" not in options:
-            options["num_ctx"] = 4096  # Default context length
-        
-        if max_tokens:
-            options["num_predict"] = max_tokens
+        options = self._build_options(temperature, max_tokens, **kwargs)
         
         request = ChatRequest(
             model=model,
@@ -296,11 +322,12 @@ class OllamaService:
         )
         
         try:
-            response = await self._client.post(
-                "/api/chat",
-                json=request.dict(exclude_none=True),
-                timeout=None if stream else self.timeout
-            )
+            async with self._request_slots:
+                response = await self._client.post(
+                    "/api/chat",
+                    json=request.dict(exclude_none=True),
+                    timeout=self._stream_timeout if stream else self.timeout
+                )
             
             if response.status_code == 404:
                 raise OllamaModelNotFoundError(f"Model '{model}' not found")
@@ -322,6 +349,81 @@ class OllamaService:
             logger.error(f"Chat failed: {e}")
             raise OllamaGenerationError(f"Chat failed: {str(e)}")
     
+    async def stream_generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream generation chunks from Ollama as they are produced"""
+        await self.ensure_connected()
+        
+        model = model or self._default_model
+        request = GenerateRequest(
+            model=model,
+            prompt=prompt,
+            system=system,
+            options=self._build_options(temperature, max_tokens, **kwargs),
+            stream=True
+        )
+        
+        async with aclosing(self._stream_lines("/api/generate", request.dict(exclude_none=True), model)) as chunks:
+            async for chunk in chunks:
+                yield chunk
+    
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream chat completion chunks from Ollama as they are produced"""
+        await self.ensure_connected()
+        
+        model = model or self._default_model
+        request = ChatRequest(
+            model=model,
+            messages=[ChatMessage(role=msg["role"], content=msg["content"]) for msg in messages],
+            options=self._build_options(temperature, max_tokens, **kwargs),
+            stream=True
+        )
+        
+        async with aclosing(self._stream_lines("/api/chat", request.dict(exclude_none=True), model)) as chunks:
+            async for chunk in chunks:
+                yield chunk
+    
+    async def _stream_lines(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        model: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """POST to a streaming endpoint and yield each NDJSON line as it arrives"""
+        try:
+            async with self._request_slots:
+                async with self._client.stream("POST", endpoint, json=payload, timeout=self._stream_timeout) as response:
+                    if response.status_code == 404:
+                        raise OllamaModelNotFoundError(f"Model '{model}' not found")
+                    
+                    response.raise_for_status()
+                    
+                    async for line in response.aiter_lines():
+                        if line:
+                            yield json.loads(line)
+                        
+        except httpx.TimeoutException:
+            raise OllamaTimeoutError(f"Streaming from {endpoint} timed out")
+        except OllamaModelNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Streaming from {endpoint} failed: {e}")
+            raise OllamaGenerationError(f"Streaming failed: {str(e)}")
+    
     async def _stream_response(self, response: httpx.Response) -> AsyncGenerator[GenerateResponse, None]:
         """Stream generation responses"""
         async for line in response.aiter_lines():
@@ -373,11 +475,12 @@ class OllamaService:
         
         try:
             # Send request to Ollama with tools
-            response = await self._client.post(
-                "/api/generate",
-                json=request,
-                timeout=self.timeout
-            )
+            async with self._request_slots:
+                response = await self._client.post(
+                    "/api/generate",
+                    json=request,
+                    timeout=self.timeout
+                )
             
             if response.status_code == 404:
                 model = request.get("model", "unknown")
@@ -421,11 +524,35 @@ class OllamaService:
             logger.error(f"Error generating with tools: {e}")
             raise OllamaGenerationError(f"Generation failed: {str(e)}")
 
+    async def prewarm(self) -> bool:
+        """Open the HTTP client and load the default model ahead of the first request"""
+        try:
+            await self.connect()
+            await self.generate(prompt=" ", max_tokens=1)
+            logger.info(f"Pre-warmed Ollama model {self._default_model}")
+            return True
+        except Exception as e:
+            logger.warning(f"Ollama pre-warm failed: {e}")
+            return False
+    
+    async def list_loaded_models(self) -> List[str]:
+        """List models currently loaded in Ollama's memory (/api/ps)"""
+        await self.ensure_connected()
+        
+        try:
+            response = await self._client.get("/api/ps")
+            response.raise_for_status()
+            return [model["name"] for model in response.json().get("models", [])]
+        except Exception as e:
+            logger.warning(f"Failed to list loaded models: {e}")
+            return []
+    
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection and return status info"""
         try:
             await self.connect()
             models = await self.list_models()
+            loaded_models = await self.list_loaded_models()
             
             return {
                 "connected": True,
@@ -433,7 +560,10 @@ class OllamaService:
                 "model_count": len(models),
                 "models": [model.name for model in models],
                 "default_model": self._default_model,
-                "default_model_available": self._default_model in [m.name for m in models]
+                "default_model_available": self._default_model in [m.name for m in models],
+                "loaded_models": loaded_models,
+                "num_parallel": self.num_parallel,
+                "max_loaded_models": self.max_loaded_models
             }
         except Exception as e:
             return {
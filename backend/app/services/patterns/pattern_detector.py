@@ -12,6 +12,7 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 from app.db.database import get_db
+from app.models.entry import decode_embedding
 from app.services.embedding_service import EmbeddingService
 from app.services.ollama.ollama_service import OllamaService
 from app.db.repositories.preferences_repository import PreferencesRepository
@@ -75,9 +76,9 @@ class PatternDetector:
         entries = []
         for row in rows:
             entry = dict(row)
-            # Parse embeddings from JSON
+            # Unpack the stored embedding vector
             if entry["embeddings"]:
-                entry["embeddings"] = json.loads(entry["embeddings"])
+                entry["embeddings"] = decode_embedding(entry["embeddings"])
             # Parse mood tags
             if entry["mood_tags"]:
                 entry["mood_tags"] = json.loads(entry["mood_tags"])
@@ -11,7 +11,7 @@ class PatternType(Enum):
     TEMPORAL = "temporal"
 
 
-@dataclass
+@dataclass(slots=True)
 class Pattern:
     """Pattern model for detected patterns in journal entries"""
     id: Optional[int] = None
@@ -57,6 +57,6 @@ class Pattern:
             confidence=data["confidence"],
             first_seen=datetime.fromisoformat(data["first_seen"]) if data.get("first_seen") else None,
             last_seen=datetime.fromisoformat(data["last_seen"]) if data.get("last_seen") else None,
-            related_entries=json.loads(data.get("related_entries", "[]")),
+            related_entries=json.loads(data["related_entries"]) if data.get("related_entries") else [],
             keywords=json.loads(data.get("keywords", "[]")) if data.get("keywords") else []
         )
\ No newline at end of file
@@ -29,7 +29,7 @@ class ProcessingStatus(str, Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingJob:
     """Represents a processing job in the queue"""
     id: str
@@ -4,7 +4,7 @@ from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSession:
     """User session data structure"""
     session_id: str
@@ -1,4 +1,4 @@
-from .stt_service import STTService, get_stt_service
+from .stt_service import STTService, get_stt_service, get_stt_service_sync
 from .recording_states import RecordingState, StateManager, get_state_manager
 from .audio_capture import AudioCapture
 from .whisper_service import WhisperService
@@ -6,6 +6,7 @@ from .whisper_service import WhisperService
 __all__ = [
     "STTService",
     "get_stt_service",
+    "get_stt_service_sync",
     "RecordingState",
     "StateManager", 
     "get_state_manager",
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +16,19 @@ class RecordingState(Enum):
     ERROR = "error"
 
 
+# Human-readable message and icon for each state
+_STATE_META: Dict[RecordingState, Tuple[str, str]] = {
+    RecordingState.IDLE: ("Ready to record", "⭕"),
+    RecordingState.RECORDING: ("Recording audio...", "🔴"),
+    RecordingState.PROCESSING: ("Processing audio...", "⚙️"),
+    RecordingState.TRANSCRIBING: ("Converting speech to text...", "📝"),
+    RecordingState.ENHANCING: ("Creating enhanced versions...", "✨"),
+    RecordingState.SUCCESS: ("Entry created successfully!", "✅"),
+    RecordingState.ERROR: ("An error occurred", "❌")
+}
+_UNKNOWN_STATE_META = ("Unknown state", "❓")
+
+
 class StateManager:
     """Manager for recording state transitions"""
     
@@ -100,29 +113,15 @@ class StateManager:
     
     def get_state_message(self) -> str:
         """Get human-readable state message"""
-        messages = {
-            RecordingState.IDLE: "Ready to record",
-            RecordingState.RECORDING: "Recording audio...",
-            RecordingState.PROCESSING: "Processing audio...",
-            RecordingState.TRANSCRIBING: "Converting speech to text...",
-            RecordingState.ENHANCING: "Creating enhanced versions...",
-            RecordingState.SUCCESS: "Entry created successfully!",
-            RecordingState.ERROR: "An error occurred"
-        }
-        return messages.get(self.current_state, "Unknown state")
+        return _STATE_META.get(self.current_state, _UNKNOWN_STATE_META)[0]
     
     def get_state_icon(self) -> str:
         """Get icon representation for current state"""
-        icons = {
-            RecordingState.IDLE: "⭕",
-            RecordingState.RECORDING: "🔴",
-            RecordingState.PROCESSING: "⚙️",
-            RecordingState.TRANSCRIBING: "📝",
-            RecordingState.ENHANCING: "✨",
-            RecordingState.SUCCESS: "✅",
-            RecordingState.ERROR: "❌"
-        }
-        return icons.get(self.current_state, "❓")
+        return _STATE_META.get(self.current_state, _UNKNOWN_STATE_META)[1]
+    
+    def get_state_meta(self) -> Tuple[str, str]:
+        """Get (message, icon) for the current state in one lookup"""
+        return _STATE_META.get(self.current_state, _UNKNOWN_STATE_META)
     
     def get_recent_history(self, count: int = 10) -> list:
         """Get recent state history"""
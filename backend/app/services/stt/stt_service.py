@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Tuple
 import tempfile
 import os
 
@@ -101,11 +101,11 @@ class STTService:
         if state_callback:
             self.state_callback = state_callback
     
-    def start_recording(self) -> bool:
-        """Start audio recording"""
+    def start_recording(self) -> Tuple[bool, RecordingState]:
+        """Start audio recording, returning (success, new_state)"""
         if not self.state_manager.can_start_recording():
             logger.warning(f"Cannot start recording in state: {self.state_manager.get_state()}")
-            return False
+            return False, self.state_manager.get_state()
         
         try:
             # Reset state to IDLE if coming from SUCCESS or ERROR
@@ -127,23 +127,23 @@ class STTService:
                 self.state_manager.set_state(RecordingState.ERROR)
                 if self.error_callback:
                     self.error_callback("Failed to start audio recording")
-                return False
+                return False, RecordingState.ERROR
             
             logger.info("STT recording started")
-            return True
+            return True, self.state_manager.get_state()
             
         except Exception as e:
             logger.error(f"Failed to start STT recording: {e}")
             self.state_manager.set_state(RecordingState.ERROR)
             if self.error_callback:
                 self.error_callback(f"Recording error: {str(e)}")
-            return False
+            return False, RecordingState.ERROR
     
-    def stop_recording(self) -> bool:
-        """Stop audio recording and start transcription"""
+    def stop_recording(self) -> Tuple[bool, RecordingState]:
+        """Stop audio recording and start transcription, returning (success, new_state)"""
         if not self.state_manager.can_stop_recording():
             logger.warning(f"Cannot stop recording in state: {self.state_manager.get_state()}")
-            return False
+            return False, self.state_manager.get_state()
         
         try:
             # Stop audio capture
@@ -154,7 +154,7 @@ class STTService:
                 self.state_manager.set_state(RecordingState.ERROR)
                 if self.error_callback:
                     self.error_callback("No audio data captured")
-                return False
+                return False, RecordingState.ERROR
             
             # Store audio data in session
             if self.current_session:
@@ -164,14 +164,14 @@ class STTService:
             asyncio.create_task(self._process_transcription(audio_data))
             
             logger.info("STT recording stopped, transcription started")
-            return True
+            return True, self.state_manager.get_state()
             
         except Exception as e:
             logger.error(f"Failed to stop STT recording: {e}")
             self.state_manager.set_state(RecordingState.ERROR)
             if self.error_callback:
                 self.error_callback(f"Stop recording error: {str(e)}")
-            return False
+            return False, RecordingState.ERROR
     
     async def _process_transcription(self, audio_data: bytes):
         """Process transcription in background"""
@@ -324,6 +324,11 @@ class STTService:
 _stt_service: Optional[STTService] = None
 
 
+def get_stt_service_sync() -> Optional[STTService]:
+    """Get the STT service if it has already been initialized"""
+    return _stt_service
+
+
 async def get_stt_service() -> STTService:
     """Get global STT service instance"""
     global _stt_service
@@ -10,6 +10,23 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Whisper model sizes supported by openai-whisper
+AVAILABLE_MODELS = (
+    "tiny",
+    "tiny.en",
+    "base",
+    "base.en",
+    "small",
+    "small.en",
+    "medium",
+    "medium.en",
+    "large",
+    "large-v1",
+    "large-v2",
+    "large-v3"
+)
+_AVAILABLE_MODEL_SET = frozenset(AVAILABLE_MODELS)
+
 
 class WhisperService:
     """Whisper speech-to-text service with lazy loading"""
@@ -230,17 +247,8 @@ class WhisperService:
     
     def get_available_models(self) -> list:
         """Get list of available Whisper models"""
-        return [
-            "tiny",
-            "tiny.en",
-            "base", 
-            "base.en",
-            "small",
-            "small.en",
-            "medium",
-            "medium.en",
-            "large",
-            "large-v1",
-            "large-v2",
-            "large-v3"
-        ]
\ No newline at end of file
+        return list(AVAILABLE_MODELS)
+    
+    def is_model_available(self, model_name: str) -> bool:
+        """Check whether a Whisper model name is supported"""
+        return model_name in _AVAILABLE_MODEL_SET
\ No newline at end of file
@@ -297,7 +297,8 @@ class TTSService:
                         # Append raw audio data (not WAV formatted)
                         all_audio_data.extend(chunk.audio_int16_bytes)
                 
-                return bytes(all_audio_data), sample_rate, sample_width, channels
+                # wave accepts any bytes-like object, so hand over the buffer without copying
+                return all_audio_data, sample_rate, sample_width, channels
             
             # Get all audio data in thread pool
             audio_data, sample_rate, sample_width, channels = await loop.run_in_executor(None, stream_audio, syn_config)
@@ -305,20 +306,14 @@ class TTSService:
             # Create a single WAV file from all the audio data
             wav_bytes = self._create_wav_from_raw_audio(audio_data, sample_rate, sample_width, channels)
             
-            # For streaming effect, we can split the final WAV into smaller chunks
-            # But ensure we don't break the WAV structure
-            chunk_size = len(wav_bytes) // 4  # Split into 4 parts for streaming effect
-            if chunk_size < 1024:  # Minimum chunk size
-                yield wav_bytes
-            else:
-                # For streaming, just return the complete audio since WAV can't be properly split
-                yield wav_bytes
+            # WAV can't be split mid-header, so the complete file goes out as one chunk
+            yield wav_bytes
                     
         except Exception as e:
             logger.error(f"Failed to synthesize streaming audio: {e}")
             raise
     
-    def _create_wav_from_raw_audio(self, audio_data: bytes, sample_rate: int, sample_width: int, channels: int) -> bytes:
+    def _create_wav_from_raw_audio(self, audio_data: Union[bytes, bytearray], sample_rate: int, sample_width: int, channels: int) -> bytes:
         """Create a single WAV file from raw audio data."""
         try:
             # Create a BytesIO buffer
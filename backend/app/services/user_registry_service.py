@@ -2,31 +2,117 @@ import asyncio
 import aiosqlite
 import os
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import AsyncIterator, Optional, List, Dict, Any
 from pathlib import Path
 
-from ..db.user_registry_schema import USER_REGISTRY_SCHEMA
+from ..db.user_registry_schema import (
+    USER_REGISTRY_SCHEMA,
+    USER_REGISTRY_PRAGMAS,
+    USER_REGISTRY_CONNECTION_PRAGMAS,
+)
 from ..db.database import get_db
 
 
+# Long-lived registry connections kept warm for per-request session checks
+REGISTRY_POOL_MIN_SIZE = 1
+REGISTRY_POOL_MAX_SIZE = 8
+
+# Session validation runs these on every authenticated request. Keeping them
+# as fixed strings lets each pooled connection's statement cache reuse the
+# compiled statement instead of preparing it again.
+_USER_BY_USERNAME_SQL = "SELECT * FROM users WHERE username = ? AND is_active = TRUE"
+_USER_BY_ID_SQL = "SELECT * FROM users WHERE id = ? AND is_active = TRUE"
+
+
 class UserRegistryService:
     """Service for managing the shared user registry database"""
     
     def __init__(self, registry_path: str = "app_data/shared/user_registry.db"):
         self.registry_path = registry_path
+        self._connections: List[aiosqlite.Connection] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._size = 0
         self._ensure_directory()
     
     def _ensure_directory(self):
         """Ensure the shared directory exists"""
         os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
     
+    def _open_pragmas(self) -> List[str]:
+        """Pragmas for the first connection made to the registry"""
+        # An in-memory database can't use WAL
+        if self.registry_path == ":memory:":
+            return USER_REGISTRY_CONNECTION_PRAGMAS
+        return USER_REGISTRY_PRAGMAS
+    
     async def initialize(self):
         """Initialize the user registry database with schema"""
         async with aiosqlite.connect(self.registry_path) as db:
+            for pragma in self._open_pragmas():
+                await db.execute(pragma)
             await db.executescript(USER_REGISTRY_SCHEMA)
             await db.commit()
     
+    async def _open_connection(
+        self, pragmas: List[str] = USER_REGISTRY_CONNECTION_PRAGMAS
+    ) -> aiosqlite.Connection:
+        """Open a registry connection with the given pragmas applied"""
+        connection = await aiosqlite.connect(self.registry_path)
+        connection.row_factory = aiosqlite.Row
+        for pragma in pragmas:
+            await connection.execute(pragma)
+        self._connections.append(connection)
+        return connection
+    
+    async def open_pool(self):
+        """Open the minimum number of pooled registry connections"""
+        if self._idle is not None:
+            return
+        self._idle = asyncio.Queue()
+        self._size = REGISTRY_POOL_MIN_SIZE
+        # Switch the file to WAL on the first connection, before the rest open
+        connections = [await self._open_connection(self._open_pragmas())]
+        connections += await asyncio.gather(
+            *(self._open_connection() for _ in range(REGISTRY_POOL_MIN_SIZE - 1))
+        )
+        for connection in connections:
+            self._idle.put_nowait(connection)
+    
+    async def close_pool(self):
+        """Close every pooled registry connection"""
+        connections, self._connections, self._idle = self._connections, [], None
+        self._size = 0
+        for connection in connections:
+            await connection.close()
+    
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled connection, opening another while below the cap"""
+        if self._idle is None:
+            await self.open_pool()
+        idle = self._idle
+        
+        if idle.empty() and self._size < REGISTRY_POOL_MAX_SIZE:
+            # Reserve the slot before awaiting so concurrent callers see it
+            self._size += 1
+            try:
+                connection = await self._open_connection()
+            except BaseException:
+                self._size -= 1
+                raise
+        else:
+            connection = await idle.get()
+        try:
+            yield connection
+        finally:
+            # Don't hand an aborted transaction to the next borrower
+            if connection.in_transaction:
+                await connection.rollback()
+            if self._idle is idle:
+                idle.put_nowait(connection)
+    
     async def create_user(
         self,
         username: str,
@@ -46,7 +132,7 @@ class UserRegistryService:
         if not database_path:
             database_path = f"app_data/users/{username}/boo.db"
         
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             try:
                 cursor = await db.execute("""
                     INSERT INTO users (
@@ -58,37 +144,31 @@ class UserRegistryService:
                 await db.commit()
                 user_id = cursor.lastrowid
                 
-                return await self.get_user_by_id(user_id)
-                
             except aiosqlite.IntegrityError as e:
                 if "username" in str(e):
                     raise ValueError("Username already exists")
                 raise ValueError(f"Failed to create user: {str(e)}")
+        
+        # Looked up after returning the connection so a full pool can't deadlock
+        return await self.get_user_by_id(user_id)
     
     async def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user by username"""
-        async with aiosqlite.connect(self.registry_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("""
-                SELECT * FROM users WHERE username = ? AND is_active = TRUE
-            """, (username,))
+        async with self._connect() as db:
+            cursor = await db.execute(_USER_BY_USERNAME_SQL, (username,))
             row = await cursor.fetchone()
             return dict(row) if row else None
     
     async def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
-        async with aiosqlite.connect(self.registry_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("""
-                SELECT * FROM users WHERE id = ? AND is_active = TRUE
-            """, (user_id,))
+        async with self._connect() as db:
+            cursor = await db.execute(_USER_BY_ID_SQL, (user_id,))
             row = await cursor.fetchone()
             return dict(row) if row else None
     
     async def list_users(self) -> List[Dict[str, Any]]:
         """List all active users (username and display_name only for security)"""
-        async with aiosqlite.connect(self.registry_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connect() as db:
             cursor = await db.execute("""
                 SELECT id, username, display_name, created_at, last_login 
                 FROM users WHERE is_active = TRUE
@@ -99,7 +179,7 @@ class UserRegistryService:
     
     async def update_last_login(self, user_id: int):
         """Update user's last login timestamp"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET last_login = CURRENT_TIMESTAMP 
                 WHERE id = ?
@@ -108,7 +188,7 @@ class UserRegistryService:
     
     async def increment_failed_attempts(self, user_id: int) -> int:
         """Increment failed login attempts and return new count"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET failed_login_attempts = failed_login_attempts + 1
                 WHERE id = ?
@@ -123,7 +203,7 @@ class UserRegistryService:
     
     async def reset_failed_attempts(self, user_id: int):
         """Reset failed login attempts to 0"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET failed_login_attempts = 0 
                 WHERE id = ?
@@ -134,7 +214,7 @@ class UserRegistryService:
         """Temporarily lock user account"""
         unlock_time = datetime.now() + timedelta(minutes=lock_duration_minutes)
         
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET account_locked_until = ?
                 WHERE id = ?
@@ -143,7 +223,7 @@ class UserRegistryService:
     
     async def is_account_locked(self, user_id: int) -> bool:
         """Check if account is currently locked"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             cursor = await db.execute("""
                 SELECT account_locked_until FROM users WHERE id = ?
             """, (user_id,))
@@ -157,7 +237,7 @@ class UserRegistryService:
     
     async def update_display_name(self, user_id: int, new_display_name: str):
         """Update user's display name"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET display_name = ? WHERE id = ?
             """, (new_display_name, user_id))
@@ -165,7 +245,7 @@ class UserRegistryService:
     
     async def update_password_hash(self, user_id: int, new_password_hash: str):
         """Update user's password hash"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET password_hash = ? WHERE id = ?
             """, (new_password_hash, user_id))
@@ -173,7 +253,7 @@ class UserRegistryService:
     
     async def update_secret_phrase_hash(self, user_id: int, new_phrase_hash: str):
         """Update user's recovery phrase hash"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET secret_phrase_hash = ? WHERE id = ?
             """, (new_phrase_hash, user_id))
@@ -181,7 +261,7 @@ class UserRegistryService:
     
     async def deactivate_user(self, user_id: int):
         """Deactivate user account (soft delete)"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET is_active = FALSE WHERE id = ?
             """, (user_id,))
@@ -194,7 +274,7 @@ class UserRegistryService:
     
     async def cleanup_expired_locks(self):
         """Remove expired account locks"""
-        async with aiosqlite.connect(self.registry_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 UPDATE users SET account_locked_until = NULL 
                 WHERE account_locked_until < datetime('now')
@@ -4,6 +4,7 @@ WebSocket connection management
 
 import asyncio
 import logging
+from collections import Counter
 from typing import Dict, Set, Optional, List, Any
 from datetime import datetime
 import uuid
@@ -17,7 +18,13 @@ logger = logging.getLogger(__name__)
 class Connection:
     """Represents a WebSocket connection"""
     
-    def __init__(self, websocket: WebSocket, connection_id: str, client_info: Dict[str, Any] = None):
+    def __init__(
+        self,
+        websocket: WebSocket,
+        connection_id: str,
+        client_info: Dict[str, Any] = None,
+        channel_counts: Optional[Counter] = None
+    ):
         self.websocket = websocket
         self.connection_id = connection_id
         self.session_id = str(uuid.uuid4())
@@ -26,6 +33,8 @@ class Connection:
         self.client_info = client_info or {}
         self.active = True
         self.subscriptions: Set[str] = set()
+        # Shared per-channel subscriber counts owned by the ConnectionManager
+        self._channel_counts = channel_counts
     
     async def send_message(self, message: WebSocketMessage) -> bool:
         """Send message to this connection"""
@@ -61,11 +70,24 @@ class Connection:
     
     def subscribe(self, channel: str):
         """Subscribe to a channel"""
-        self.subscriptions.add(channel)
+        if channel not in self.subscriptions:
+            self.subscriptions.add(channel)
+            if self._channel_counts is not None:
+                self._channel_counts[channel] += 1
     
     def unsubscribe(self, channel: str):
         """Unsubscribe from a channel"""
-        self.subscriptions.discard(channel)
+        if channel in self.subscriptions:
+            self.subscriptions.discard(channel)
+            if self._channel_counts is not None:
+                self._channel_counts[channel] -= 1
+    
+    def detach_counts(self):
+        """Remove this connection's subscriptions from the shared channel counts"""
+        if self._channel_counts is not None:
+            for channel in self.subscriptions:
+                self._channel_counts[channel] -= 1
+            self._channel_counts = None
     
     def is_subscribed(self, channel: str) -> bool:
         """Check if subscribed to a channel"""
@@ -81,13 +103,15 @@ class ConnectionManager:
         self.ping_timeout = 10   # seconds
         self._ping_task = None
         self._lock = asyncio.Lock()
+        # Subscriber count per channel, kept in step with subscribe/unsubscribe
+        self._channel_counts: Counter = Counter()
     
     async def connect(self, websocket: WebSocket, client_info: Dict[str, Any] = None) -> Connection:
         """Accept and register a new connection"""
         await websocket.accept()
         
         connection_id = str(uuid.uuid4())
-        connection = Connection(websocket, connection_id, client_info)
+        connection = Connection(websocket, connection_id, client_info, self._channel_counts)
         
         async with self._lock:
             self.active_connections[connection_id] = connection
@@ -104,6 +128,8 @@ class ConnectionManager:
         """Disconnect and remove a connection"""
         async with self._lock:
             connection = self.active_connections.pop(connection_id, None)
+            if connection:
+                connection.detach_counts()
         
         if connection:
             connection.active = False
@@ -184,6 +210,10 @@ class ConnectionManager:
         """Get number of active connections"""
         return len(self.active_connections)
     
+    def get_channel_subscriber_count(self, channel: str) -> int:
+        """Get number of connections subscribed to a channel"""
+        return self._channel_counts[channel]
+    
     def get_channel_subscribers(self, channel: str) -> List[Connection]:
         """Get all connections subscribed to a channel"""
         subscribers = []
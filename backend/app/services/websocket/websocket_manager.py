@@ -178,7 +178,7 @@ class WebSocketManager:
                     logger.debug(f"Ignoring start_recording command - already in state: {current_state}")
                     return
                 
-                success = self.stt_service.start_recording()
+                success, _ = self.stt_service.start_recording()
                 if not success:
                     await connection.send_message(
                         create_error_message(
@@ -191,7 +191,7 @@ class WebSocketManager:
         elif command == "stop_recording":
             # Stop recording via WebSocket command
             if self.stt_service:
-                success = self.stt_service.stop_recording()
+                success, _ = self.stt_service.stop_recording()
                 if not success:
                     await connection.send_message(
                         create_error_message(
@@ -435,9 +435,9 @@ class WebSocketManager:
         """Get WebSocket connection statistics"""
         return {
             "total_connections": self.connection_manager.get_connection_count(),
-            "stt_subscribers": len(self.connection_manager.get_channel_subscribers(self.CHANNEL_STT)),
-            "transcription_subscribers": len(self.connection_manager.get_channel_subscribers(self.CHANNEL_TRANSCRIPTION)),
-            "hotkey_subscribers": len(self.connection_manager.get_channel_subscribers(self.CHANNEL_HOTKEY)),
+            "stt_subscribers": self.connection_manager.get_channel_subscriber_count(self.CHANNEL_STT),
+            "transcription_subscribers": self.connection_manager.get_channel_subscriber_count(self.CHANNEL_TRANSCRIPTION),
+            "hotkey_subscribers": self.connection_manager.get_channel_subscriber_count(self.CHANNEL_HOTKEY),
             "active_recording": self.current_recording_session is not None
         }
     
@@ -0,0 +1,69 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.api.errors import validation_exception_handler
+from app.models.auth_models import (
+    LoginRequest,
+    PasswordResetRequest,
+    UserRegistrationRequest,
+)
+
+
+def test_login_request_rejects_two_auth_methods():
+    with pytest.raises(ValidationError) as exc_info:
+        LoginRequest(name="alice", password="password123", recovery_phrase="a long recovery phrase")
+    
+    error, = exc_info.value.errors()
+    assert error["type"] == "auth_method"
+    assert error["msg"] == "Exactly one authentication method must be provided"
+
+
+def test_password_reset_request_requires_verification_method():
+    with pytest.raises(ValidationError) as exc_info:
+        PasswordResetRequest(name="alice", new_password="password123")
+    
+    error, = exc_info.value.errors()
+    assert error["type"] == "verification_method"
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/login", {"name": "alice", "password": "password123", "recovery_phrase": "a long recovery phrase"}),
+    ("/login", {"name": "alice"}),
+    ("/reset", {"name": "alice", "new_password": "password123"}),
+])
+def test_validation_handler_returns_422_for_auth_method_errors(path, body):
+    app = FastAPI()
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    
+    @app.post("/login")
+    async def login(request: LoginRequest):
+        return {}
+    
+    @app.post("/reset")
+    async def reset(request: PasswordResetRequest):
+        return {}
+    
+    response = TestClient(app).post(path, json=body)
+    
+    assert response.status_code == 422
+    assert response.json()["errors"][0]["msg"]
+
+
+def test_validation_handler_serializes_field_validator_errors():
+    app = FastAPI()
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    
+    @app.post("/register")
+    async def register(request: UserRegistrationRequest):
+        return {}
+    
+    response = TestClient(app).post("/register", json={
+        "name": "   ",
+        "password": "password123",
+        "recovery_phrase": "a long recovery phrase",
+    })
+    
+    assert response.status_code == 422
@@ -0,0 +1,37 @@
+import asyncio
+
+from app.db.database import create_tables, get_db, initialize_default_preferences
+from app.db.repositories.preferences_repository import PreferencesRepository
+
+
+def test_read_racing_a_write_does_not_cache_stale_row(tmp_path, monkeypatch):
+    async def run():
+        db = get_db()
+        await db.set_db_path(str(tmp_path / "prefs.db"))
+        await db.connect()
+        try:
+            await create_tables()
+            await initialize_default_preferences()
+            await PreferencesRepository.set_value("hotkey", "F8")
+            PreferencesRepository._cache.pop("hotkey", None)
+
+            fetch_one = db.fetch_one
+
+            async def fetch_then_write(query, params=()):
+                # The read completes, then a write commits before the
+                # reader gets to fill the cache.
+                row = await fetch_one(query, params)
+                if params == ("hotkey",):
+                    monkeypatch.setattr(db, "fetch_one", fetch_one)
+                    await PreferencesRepository.set_value("hotkey", "F9")
+                return row
+
+            monkeypatch.setattr(db, "fetch_one", fetch_then_write)
+            stale = await PreferencesRepository.get_by_key("hotkey")
+
+            assert stale.value == "F8"
+            assert await PreferencesRepository.get_value("hotkey") == "F9"
+        finally:
+            await db.disconnect()
+
+    asyncio.run(run())